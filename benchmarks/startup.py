@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Measure cold-start import time of the lib package and the entry scripts.
+
+Every sample runs in a fresh interpreter (`python -X importtime`), the same way
+each API request starts a new process. Reports the median cumulative import time
+per module and which heavy modules each target pulls in.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeat 10 --json > startup.json
+    python benchmarks/startup.py --baseline startup.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import targets (module -> statement executed in a fresh interpreter)
+MODULES = {
+    "lib": "import lib",
+    "lib.args": "from lib import Args",
+    "lib.dataset": "from lib import Dataset",
+    "lib.model": "from lib import Model",
+    "lib.dataset.render": "from lib import Render",
+    "lib (all facades)": "from lib import Args, Dataset, Model, Render",
+}
+
+# Entry scripts timed end to end with --help (imports + argument parsing)
+SCRIPTS = ["train-tree.py", "train-forest.py", "train-gradient.py", "train-hist-gradient.py",
+           "grow-forest.py", "sweep.py", "compare.py", "render.py", "registry.py"]
+
+# Modules that should only load when a script actually draws, downloads or fits
+HEAVY = ["matplotlib", "seaborn", "kagglehub", "sklearn", "sklearn.manifold", "sklearn.inspection"]
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$')
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target (default: 5)")
+    parser.add_argument("--top", type=int, default=8,
+                        help="Slowest top-level imports listed per target (default: 8)")
+    parser.add_argument("--no-scripts", action="store_true", help="Skip the entry script timings")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="JSON from a previous --json run; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown against --baseline (default: 0.25)")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    return parser.parse_args()
+
+
+def importtime(statement):
+    """Run one statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple: (wall seconds, {module: cumulative seconds}, [top-level module names])
+    """
+    code = (f"{statement}\n"
+            "import sys\n"
+            f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))")
+    start_time = time.perf_counter()
+    result = subprocess.run([sys.executable, "-W", "ignore", "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start_time
+
+    cumulative = {}
+    top_level = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, total_us, indent, module = match.groups()
+        cumulative[module] = int(total_us) / 1e6
+        if len(indent) == 1:
+            top_level.append(module)
+    heavy = [m for m in result.stdout.strip().split(',') if m]
+    return wall, cumulative, top_level, heavy
+
+
+def bench_module(name, statement, repeat, top):
+    """Median import time of a target and its slowest top-level dependencies."""
+    walls, samples, heavy = [], [], []
+    for _ in range(repeat):
+        wall, cumulative, top_level, heavy = importtime(statement)
+        walls.append(wall)
+        samples.append({m: cumulative[m] for m in top_level})
+
+    modules = {m: statistics.median(s.get(m, 0.0) for s in samples) for m in samples[0]}
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "target": name,
+        "seconds": statistics.median(sum(s.values()) for s in samples),
+        "wall": statistics.median(walls),
+        "heavy": heavy,
+        "modules": [{"module": m, "seconds": s} for m, s in slowest],
+    }
+
+
+def bench_script(script, repeat):
+    """Median wall time of `python <script> --help` in a fresh interpreter."""
+    walls = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, "-W", "ignore", os.path.join(ROOT, script), "--help"],
+                       cwd=ROOT, capture_output=True, check=True)
+        walls.append(time.perf_counter() - start_time)
+    return {"target": script, "wall": statistics.median(walls)}
+
+
+def baseline_regressions(results, baseline, tolerance):
+    """Targets whose wall time exceeds the baseline by more than `tolerance`."""
+    previous = {r["target"]: r["wall"] for r in baseline["modules"] + baseline["scripts"]}
+    regressions = []
+    for result in results["modules"] + results["scripts"]:
+        before = previous.get(result["target"])
+        if before and result["wall"] > before * (1 + tolerance):
+            regressions.append({"target": result["target"], "baseline": before, "wall": result["wall"]})
+    return regressions
+
+
+def main():
+    args = parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "modules": [bench_module(name, statement, args.repeat, args.top) for name, statement in MODULES.items()],
+        "scripts": [] if args.no_scripts else [bench_script(script, args.repeat) for script in SCRIPTS],
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = baseline_regressions(results, json.load(f), args.tolerance)
+        results["regressions"] = regressions
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Cold-start imports (median of {args.repeat}, Python {results['python']})")
+        for result in results["modules"]:
+            heavy = ', '.join(result["heavy"]) or "-"
+            print(f"\n{result['target']:<24} {result['seconds']:7.3f}s imports  "
+                  f"{result['wall']:7.3f}s wall  heavy: {heavy}")
+            for module in result["modules"]:
+                print(f"    {module['module']:<36} {module['seconds']:7.3f}s")
+        if results["scripts"]:
+            print("\nEntry scripts (--help)")
+            for result in results["scripts"]:
+                print(f"    {result['target']:<36} {result['wall']:7.3f}s")
+        for regression in regressions:
+            print(f"\nREGRESSION {regression['target']}: {regression['wall']:.3f}s "
+                  f"(baseline {regression['baseline']:.3f}s)")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
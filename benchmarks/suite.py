@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the dataset, imputation, training, report, render and compare hot paths.
+
+Each benchmark runs at several data scales (rows resampled from the cached
+dataset with a fixed seed), is timed over --repeat runs (median) and then run
+once more under tracemalloc for its peak allocation. compare.py benchmarks run
+in fresh interpreters and report the child's peak RSS instead.
+
+Runs offline as long as the parsed dataset cache is warm (any earlier training
+run), and always with --dataset Synthetic (generated locally with its default
+configuration); nothing is written to the real run registry or render cache.
+
+    python benchmarks/suite.py --dataset Iris --rows 1000,10000 --output bench.json
+    python benchmarks/suite.py --groups models,report --baseline bench.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+# Scratch space for the run registry, render cache and images of this process
+# and its compare.py children (must be set before lib is imported)
+WORK_DIR = tempfile.mkdtemp(prefix="dtf-bench-")
+os.environ["RUN_REGISTRY"] = os.path.join(WORK_DIR, "registry.sqlite")
+os.environ["RENDER_CACHE_DIR"] = os.path.join(WORK_DIR, "renders")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from lib import Dataset, Model, Render  # noqa: E402
+
+GROUPS = ["dataset", "impute", "models", "report", "render", "compare"]
+MODELS = ["tree", "forest", "gradient", "hist-gradient"]
+
+# Masked share of feature values for the imputation benchmark
+MASK_RATE = 0.1
+
+# Row caps per group: larger scales are skipped (KNN imputation and the
+# MDS/proximity renders grow quadratically with rows)
+MAX_ROWS = {"impute": 20_000, "render": 2_000}
+
+# Run IDs for the temporary compare.py models (frontend/public/output/<id>/, removed afterwards)
+BENCH_RUN_BASE = 9_100_000_000
+
+COMPARE_MASK_VALUES = list(range(0, 95, 5))
+
+# Rows where Model.compile predictions differ from sklearn's (any entry fails the suite)
+MISMATCHES = []
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the training, compare and render hot paths")
+    parser.add_argument("--dataset", type=str, default="Iris",
+                        help="Comma-separated datasets (default: Iris)")
+    parser.add_argument("--rows", type=str, default="1000,10000",
+                        help="Comma-separated row counts for scaled benchmarks (default: 1000,10000)")
+    parser.add_argument("--groups", type=str, default=",".join(GROUPS),
+                        help=f"Comma-separated groups to run (default: {','.join(GROUPS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Resampling and masking seed (default: 42)")
+    parser.add_argument("--compare-jobs", type=int, default=1,
+                        help="--jobs passed to compare.py (default: 1)")
+    parser.add_argument("--output", type=str, default=None, help="Also write the JSON results to this file")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="JSON from a previous run; exit 1 when a benchmark regresses")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative slowdown / memory growth against --baseline (default: 0.2)")
+    parser.add_argument("--min-delta", type=float, default=0.005,
+                        help="Ignore time regressions smaller than this many seconds (default: 0.005)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    return parser.parse_args()
+
+
+class Scale:
+    """One dataset resampled to a fixed number of rows, with lazily fitted models.
+
+    Rows are drawn from the parsed dataset (without replacement up to its size,
+    with replacement beyond) and split 67/33, all from `seed`.
+    """
+
+    def __init__(self, dataset, rows, seed):
+        self.dataset = dataset
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+
+        X, y = getattr(Dataset, dataset)._load_raw()
+        index = rng.choice(len(X), size=rows, replace=rows > len(X))
+        X = X.iloc[index].reset_index(drop=True)
+        y = y.iloc[index].reset_index(drop=True)
+
+        split = int(rows * 0.67)
+        self.X_train, self.X_test = X.iloc[:split], X.iloc[split:]
+        self.y_train, self.y_test = y.iloc[:split], y.iloc[split:]
+        self.X_masked = self.X_train.mask(rng.random(self.X_train.shape) < MASK_RATE)
+        self._fitted = {}
+
+    def config(self, model):
+        return Model.load_config(model, self.dataset)
+
+    def fitted(self, model):
+        """Fit (once) a model from config/<model>-<dataset>.yml on the training rows."""
+        if model not in self._fitted:
+            self._fitted[model] = Model.build(model, self.config(model)).fit(self.X_train, self.y_train)
+        return self._fitted[model]
+
+
+def measure(fn, repeat):
+    """Median/min wall time over `repeat` calls, then one traced call for peak memory."""
+    seconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        with quiet():
+            fn()
+        seconds.append(time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    try:
+        with quiet():
+            fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": statistics.median(seconds), "min": min(seconds), "peak_mb": peak / 2**20}
+
+
+def measure_child(argv, repeat):
+    """Median/min wall time of a script in a fresh interpreter, and its peak RSS."""
+    seconds, peaks = [], []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        child = subprocess.Popen([sys.executable, "-W", "ignore"] + argv, cwd=ROOT,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        _, status, usage = os.wait4(child.pid, 0)
+        child.returncode = os.waitstatus_to_exitcode(status)
+        seconds.append(time.perf_counter() - start_time)
+        if child.returncode != 0:
+            raise RuntimeError(f"{' '.join(argv)} exited with code {child.returncode}")
+        peaks.append(usage.ru_maxrss / 1024)  # KB on Linux
+
+    return {"seconds": statistics.median(seconds), "min": min(seconds), "peak_rss_mb": max(peaks)}
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow stdout (Model.report prints its JSON) and progress logging on stderr."""
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+def dataset_benchmarks(dataset):
+    """Dataset.<name>.input() with and without masking, imputation and compact frames (native size)."""
+    source = getattr(Dataset, dataset)
+    for params in ({"mask_rate": 0.0}, {"mask_rate": MASK_RATE}, {"mask_rate": MASK_RATE, "impute": True},
+                   {"mask_rate": MASK_RATE, "compact": True}):
+        yield "input", params, lambda params=params: source.input(**params)
+
+
+def impute_benchmarks(scale):
+    """Chunked KNN imputation (KNNImputer-equivalent) of the masked training rows."""
+    yield "knn", {}, lambda: Dataset.knn_impute(scale.X_masked)
+
+
+def model_benchmarks(scale):
+    """Fit and predict for each model type with its YAML config (plus the compiled predictor)."""
+    for model in MODELS:
+        config = scale.config(model)
+        yield "fit", {"model": model}, lambda model=model, config=config: \
+            Model.build(model, config).fit(scale.X_train, scale.y_train)
+        clf = scale.fitted(model)
+        yield "predict", {"model": model}, lambda clf=clf: clf.predict(scale.X_test)
+        try:
+            compiled = Model.compile(clf)
+        except TypeError:
+            continue
+        check_compiled(scale, model, clf, compiled)
+        yield "predict-compiled", {"model": model}, lambda compiled=compiled: compiled.predict(scale.X_test)
+
+
+def check_compiled(scale, model, clf, compiled):
+    """Compare compiled and sklearn labels on the test rows (and masked rows where NaN is allowed)."""
+    inputs = {"test": scale.X_test}
+    if compiled.allow_nan:
+        inputs["masked"] = scale.X_masked
+    for split, X in inputs.items():
+        mismatches = int((compiled.predict(X) != clf.predict(X)).sum())
+        if mismatches:
+            MISMATCHES.append({"dataset": scale.dataset, "rows": scale.rows, "model": model,
+                               "split": split, "mismatches": mismatches, "of": len(X)})
+
+
+def report_benchmarks(scale):
+    """Model.report JSON serialization, inline rows and saved to a run directory."""
+    clf = scale.fitted("tree")
+    y_pred = clf.predict(scale.X_test)
+    rows = {"X_train": scale.X_train, "X_test": scale.X_test, "y_train": scale.y_train, "y_test": scale.y_test}
+    run_id = str(BENCH_RUN_BASE + 99)
+
+    def report(params):
+        with quiet():
+            Model.report(scale.y_test, y_pred, json_output=True, params=params,
+                         model_info={"type": "tree"},
+                         feature_importance=dict(zip(scale.X_train.columns, clf.feature_importances_)),
+                         **rows)
+
+    yield "json", {}, lambda: report({"dataset": scale.dataset})
+    yield "save", {}, lambda: report({"dataset": scale.dataset, "run_id": run_id})
+
+
+def render_benchmarks(scale):
+    """Every Render method, drawn into the scratch directory."""
+    X, y = scale.X_train, scale.y_train
+    features = X.columns.tolist()
+    classes = [str(c) for c in np.unique(y)]
+    tree, forest, gradient = scale.fitted("tree"), scale.fitted("forest"), scale.fitted("gradient")
+
+    renders = {
+        "heatmap": lambda: Render.heatmap(X),
+        "clustering": lambda: Render.clustering(X, y),
+        "tree": lambda: Render.tree(tree, features, classes),
+        "tree_importance": lambda: Render.tree_importance(tree, features),
+        "tree_boundaries": lambda: Render.tree_boundaries(tree, X, y, features),
+        "forest_importance": lambda: Render.forest_importance(forest, features),
+        "forest_trees": lambda: Render.forest_trees(forest, features, classes),
+        "forest_pdp": lambda: Render.forest_pdp(forest, X, features, target=forest.classes_[0]),
+        "forest_ice": lambda: Render.forest_ice(forest, X, features, target=forest.classes_[0]),
+        "forest_proximity": lambda: Render.forest_proximity(forest, X),
+        "forest_clustering": lambda: Render.forest_clustering(forest, X, y),
+        "gradient_forest_importance": lambda: Render.gradient_forest_importance(
+            gradient.feature_importances_, features),
+        "gradient_forest_staged": lambda: Render.gradient_forest_staged(
+            gradient, scale.X_train, scale.X_test, scale.y_train, scale.y_test),
+        "gradient_forest_trees": lambda: Render.gradient_forest_trees(gradient, features),
+    }
+    if getattr(forest, "oob_score", False):
+        renders["forest_oob"] = lambda: Render.forest_oob(forest)
+
+    for name, render in renders.items():
+        yield name, {}, render
+
+
+def compare_render_benchmarks(seed):
+    """Render.compare_* charts from synthetic accuracy curves (independent of data scale)."""
+    rng = np.random.default_rng(seed)
+    colors = {"tree": "forestgreen", "forest": "royalblue", "gradient": "darkorange", "hist-gradient": "purple"}
+    results = {}
+    for model in MODELS:
+        results[model] = rng.uniform(0.5, 1.0, len(COMPARE_MASK_VALUES)).tolist()
+        results[f"{model}_impute"] = rng.uniform(0.5, 1.0, len(COMPARE_MASK_VALUES)).tolist()
+    models = [{"runId": str(BENCH_RUN_BASE + i), "model": model, "trainAccuracy": float(rng.uniform(0.8, 1.0)),
+               "compareAccuracy": float(rng.uniform(0.5, 1.0)), "imputed": model == "gradient"}
+              for i, model in enumerate(MODELS)]
+
+    yield "compare_accuracy", {}, lambda: Render.compare_accuracy(COMPARE_MASK_VALUES, results, colors)
+    yield "compare_accuracy_impute", {}, lambda: Render.compare_accuracy_impute(COMPARE_MASK_VALUES, results, colors)
+    yield "compare_accuracy_bars", {}, lambda: Render.compare_accuracy_bars(models)
+    yield "compare_accuracy_diff", {}, lambda: Render.compare_accuracy_diff(models)
+
+
+def save_compare_models(dataset):
+    """Train one model per type on the native dataset and save it as a run for compare.py.
+
+    Returns:
+        list: Run IDs
+    """
+    X_train, X_test, y_train, y_test = getattr(Dataset, dataset).input()
+    run_ids = []
+    for i, model in enumerate(MODELS):
+        run_id = str(BENCH_RUN_BASE + i)
+        config = Model.load_config(model, dataset)
+        clf = Model.build(model, config).fit(X_train, y_train)
+        Model.save(clf, run_id)
+        Model.save_runtime(run_id=run_id, dataset=dataset, model=model,
+                           dataset_params={"mask": 0, "split": 33, "impute": False, "ignore_columns": []},
+                           model_params=config)
+        Model.save_id(run_id, model, dataset, float((clf.predict(X_test) == y_test).mean()))
+        run_ids.append(run_id)
+    return run_ids
+
+
+def compare_benchmarks(dataset, run_ids, jobs):
+    """Both compare.py modes: saved models (single mask and --sequence) and the fresh sweep."""
+    models = ",".join(run_ids)
+    base = ["compare.py", "--dataset", dataset, "--jobs", str(jobs)]
+    yield "models", {"mask": 20, "impute": True}, base + ["--models", models, "--mask", "20", "--impute"]
+    yield "models", {"sequence": True}, base + ["--models", models, "--sequence"]
+    yield "fresh", {}, base
+
+
+def benchmark_id(group, name, dataset, rows, params):
+    """Stable key used to match results against a baseline."""
+    suffix = ",".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return f"{group}.{name}[{dataset}{f',rows={rows}' if rows else ''}{f',{suffix}' if suffix else ''}]"
+
+
+def run_suite(args):
+    """Run the selected groups and return the result records."""
+    datasets = [d.strip() for d in args.dataset.split(",") if d.strip()]
+    scales = [int(r) for r in args.rows.split(",") if r.strip()]
+    groups = [g.strip() for g in args.groups.split(",") if g.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise SystemExit(f"Unknown groups: {sorted(unknown)} (choose from {GROUPS})")
+
+    Render._directory = os.path.join(WORK_DIR, "images")
+    os.makedirs(Render._directory, exist_ok=True)
+
+    results = []
+
+    def record(group, name, dataset, rows, params, run, child=False):
+        entry = {"id": benchmark_id(group, name, dataset, rows, params), "group": group, "name": name,
+                 "dataset": dataset, "rows": rows, "params": params}
+        try:
+            entry.update(measure_child(run, args.repeat) if child else measure(run, args.repeat))
+        except Exception as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+        print(f"  {entry['id']}: {entry.get('seconds', float('nan')):.4f}s"
+              f"{'  ' + entry['error'] if 'error' in entry else ''}", file=sys.stderr)
+        results.append(entry)
+
+    for dataset in datasets:
+        print(f"Dataset {dataset}", file=sys.stderr)
+        if "dataset" in groups:
+            for name, params, run in dataset_benchmarks(dataset):
+                record("dataset", name, dataset, None, params, run)
+
+        for rows in scales:
+            scaled_groups = [g for g in ("impute", "models", "report", "render") if g in groups]
+            if not scaled_groups:
+                break
+            try:
+                scale = Scale(dataset, rows, args.seed)
+            except Exception as e:
+                print(f"  Skipping {dataset} at {rows} rows: {e}", file=sys.stderr)
+                continue
+
+            for group in scaled_groups:
+                if rows > MAX_ROWS.get(group, rows):
+                    continue
+                benchmarks = {"impute": impute_benchmarks, "models": model_benchmarks,
+                              "report": report_benchmarks, "render": render_benchmarks}[group]
+                for name, params, run in benchmarks(scale):
+                    record(group, name, dataset, rows, params, run)
+
+        if "render" in groups:
+            for name, params, run in compare_render_benchmarks(args.seed):
+                record("render", name, dataset, None, params, run)
+
+        if "compare" in groups:
+            run_ids = save_compare_models(dataset)
+            for name, params, argv in compare_benchmarks(dataset, run_ids, args.compare_jobs):
+                record("compare", name, dataset, None, params, argv, child=True)
+
+    return results
+
+
+def regressions(results, baseline, threshold, min_delta):
+    """Benchmarks slower (or using more memory) than the baseline by more than `threshold`."""
+    previous = {entry["id"]: entry for entry in baseline["results"]}
+    flagged = []
+    for entry in results:
+        before = previous.get(entry["id"])
+        if not before or "error" in entry or "error" in before:
+            continue
+        if entry["seconds"] - before["seconds"] > max(min_delta, before["seconds"] * threshold):
+            flagged.append({"id": entry["id"], "metric": "seconds",
+                            "baseline": before["seconds"], "value": entry["seconds"]})
+        for metric in ("peak_mb", "peak_rss_mb"):
+            if metric in entry and metric in before and entry[metric] > before[metric] * (1 + threshold) + 1:
+                flagged.append({"id": entry["id"], "metric": metric,
+                                "baseline": before[metric], "value": entry[metric]})
+    return flagged
+
+
+def cleanup():
+    """Remove the scratch directory and the temporary compare/report runs."""
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+    runs_dir = os.path.join(ROOT, 'frontend', 'public', 'output')
+    for i in list(range(len(MODELS))) + [99]:
+        shutil.rmtree(os.path.join(runs_dir, str(BENCH_RUN_BASE + i)), ignore_errors=True)
+
+
+def main():
+    args = parse_args()
+
+    import sklearn
+    output = {
+        "meta": {
+            "timestamp": int(time.time()),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "sklearn": sklearn.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "rows": args.rows,
+        },
+    }
+
+    try:
+        output["results"] = run_suite(args)
+    finally:
+        cleanup()
+
+    flagged = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            flagged = regressions(output["results"], json.load(f), args.threshold, args.min_delta)
+        output["regressions"] = flagged
+    output["mismatches"] = MISMATCHES
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+
+    if args.json:
+        print(json.dumps(output, indent=2))
+    else:
+        print(f"{'benchmark':<72} {'seconds':>9} {'min':>9} {'peak MB':>9}")
+        for entry in output["results"]:
+            if "error" in entry:
+                print(f"{entry['id']:<72} {'error':>9}  {entry['error']}")
+                continue
+            peak = entry.get("peak_mb", entry.get("peak_rss_mb"))
+            print(f"{entry['id']:<72} {entry['seconds']:9.4f} {entry['min']:9.4f} {peak:9.1f}")
+        for regression in flagged:
+            print(f"REGRESSION {regression['id']} {regression['metric']}: "
+                  f"{regression['value']:.4f} (baseline {regression['baseline']:.4f})")
+        for mismatch in MISMATCHES:
+            print(f"MISMATCH compiled {mismatch['model']} [{mismatch['dataset']},rows={mismatch['rows']}] "
+                  f"{mismatch['split']}: {mismatch['mismatches']}/{mismatch['of']} labels differ from sklearn")
+
+    if flagged or MISMATCHES:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,23 @@
 """Compare accuracy across training scripts with varying mask rates."""
 
 import argparse
+import collections
+import functools
 import json
 import os
 import subprocess
 import sys
+import tempfile
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
-import joblib
 import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
+from scipy import stats
+import lib.dataset.impute
 
-from lib import Dataset, Render
+from lib import Dataset, Model, Profile, Render
+from lib.profile import MemoryBudgetError, save_memory
 
 SCRIPTS = ["train-tree.py", "train-forest.py", "train-gradient.py", "train-hist-gradient.py"]
 MASK_VALUES = list(range(0, 95, 5))  # 0, 5, 10, ..., 90
@@ -24,6 +29,30 @@ COLORS = {
     "hist-gradient": "purple"
 }
 
+# Seed of the evaluation mask; --seeds K uses MASK_SEED, MASK_SEED + 1, ..., MASK_SEED + K - 1
+MASK_SEED = 42
+
+# Rows of uniforms drawn at a time when masking (bounds the draw to chunk x features floats)
+MASK_CHUNK_ROWS = 65_536
+
+# Confidence level of the --seeds intervals
+CONFIDENCE = 0.95
+
+# Max number of (dataset, mask_rate, impute, ignore_columns) frames kept in memory
+DATASET_CACHE_SIZE = 32
+
+# Max number of imputed --seeds frames kept in memory (shared by models with the same columns)
+SEED_CACHE_SIZE = 32
+
+# Rows per prediction batch in evaluate_model (0 = predict the whole dataset at once)
+BATCH_ROWS = 65_536
+
+# --compiled auto: largest rows x tree depth of a batch scored with the compiled
+# predictor. It only beats sklearn where sklearn's fixed per-tree cost (forests
+# dispatch each tree separately) outweighs the traversal, i.e. on small batches
+# of shallow trees; a 100-tree unlimited-depth forest broke even at ~500 rows
+COMPILED_MAX_ROW_LEVELS = 4096
+
 # Mapping from CLI arg to expected model type in runtime.json
 MODEL_TYPE_MAP = {
     "tree": "tree",
@@ -32,6 +61,48 @@ MODEL_TYPE_MAP = {
     "hist-gradient": "hist-gradient"
 }
 
+# NDJSON progress events (--stream): event output stream, run start time, fatal error sent
+_stream = {"out": None, "start": 0.0, "failed": False}
+
+
+def emit(event, **fields):
+    """Write one NDJSON progress event to stdout when --stream is enabled.
+
+    Args:
+        event: Event type (start, cell, error, finish)
+        **fields: Event payload
+    """
+    out = _stream["out"]
+    if out is None:
+        return
+    if event == "error" and fields.get("fatal"):
+        _stream["failed"] = True
+    record = {"event": event, "elapsed": round(time.time() - _stream["start"], 3), **fields}
+    out.write(json.dumps(record, default=lambda o: o.item() if hasattr(o, "item") else str(o)) + "\n")
+    out.flush()
+
+
+def emit_cell(model, mask, impute, result, seconds=None, run_id=None, name=None):
+    """Emit a cell or error event for one finished (model, mask, impute) evaluation.
+
+    Args:
+        model: Model type
+        mask: Mask percentage
+        impute: Whether the cell used the imputed dataset
+        result: (accuracy, was_imputed) tuple, or the exception raised
+        seconds: Optional time spent on the cell
+        run_id: Run ID (model ID modes)
+        name: Optional model name (model ID modes)
+    """
+    cell = {"runId": run_id, "model": model, "name": name, "mask": mask, "impute": impute}
+    if seconds is not None:
+        cell["seconds"] = round(seconds, 3)
+    if isinstance(result, Exception):
+        emit("error", fatal=False, message=str(result), **cell)
+    else:
+        accuracy, was_imputed = result
+        emit("cell", accuracy=accuracy, imputed=was_imputed, **cell)
+
 
 def get_output_dir(run_id):
     """Get the output directory path for a run_id."""
@@ -63,12 +134,13 @@ def load_runtime(run_id):
         return json.load(f)
 
 
+@Profile.span("validate")
 def validate_model_id(run_id, expected_dataset):
     """Validate a model run ID and auto-detect model type.
 
     Args:
         run_id: Run identifier
-        expected_dataset: Expected dataset name (Iris, Income)
+        expected_dataset: Expected dataset name (Iris, Income, Synthetic)
 
     Returns:
         dict: Runtime configuration if valid (includes 'model' field with detected type)
@@ -105,14 +177,40 @@ def validate_model_id(run_id, expected_dataset):
     return runtime
 
 
-def load_full_dataset(dataset_name, mask_rate=0.0, impute=False, ignore_columns=None):
-    """Load the full dataset without train/test split.
+def _mask_frame(X, mask_rate, seed=MASK_SEED):
+    """Hide the values whose seeded uniform draw is below mask_rate.
+
+    The uniforms are drawn in row chunks of MASK_CHUNK_ROWS and applied column
+    by column into float64 copies, so neither a full rows x features draw nor
+    a boolean mask is allocated. Chunked draws continue one stream, so every
+    value gets the same uniform as a single X.shape draw, and levels of one
+    seed are nested: a value masked at 10% is also masked at 20%.
 
     Args:
-        dataset_name: Dataset name (Iris or Income)
+        X: Feature DataFrame
+        mask_rate: Fraction of values to mask (0.0-1.0)
+        seed: Mask seed (default MASK_SEED)
+
+    Returns:
+        pd.DataFrame: Masked copy of X
+    """
+    rng = np.random.default_rng(seed)
+    columns = [X[col].to_numpy(dtype=np.float64, copy=True) for col in X.columns]
+    for start in range(0, len(X), MASK_CHUNK_ROWS):
+        uniforms = rng.random((min(MASK_CHUNK_ROWS, len(X) - start), len(columns)))
+        for j, values in enumerate(columns):
+            values[start:start + len(uniforms)][uniforms[:, j] < mask_rate] = np.nan
+    return pd.DataFrame(dict(zip(X.columns, columns)), index=X.index, copy=False)
+
+
+@functools.lru_cache(maxsize=DATASET_CACHE_SIZE)
+@Profile.span("dataset.load")
+def _masked_dataset(dataset_name, mask_rate):
+    """Load the full dataset with the seed-42 mask applied (memoized).
+
+    Args:
+        dataset_name: Dataset name (Iris, Income or Synthetic)
         mask_rate: Fraction of values to mask (0.0-1.0)
-        impute: If True, impute missing values
-        ignore_columns: List of column indices to drop
 
     Returns:
         tuple: (X, y) feature matrix and target series
@@ -125,64 +223,461 @@ def load_full_dataset(dataset_name, mask_rate=0.0, impute=False, ignore_columns=
 
     # Apply masking if needed
     if mask_rate > 0:
-        rng = np.random.default_rng(42)
-        mask = rng.random(X.shape) < mask_rate
-        X = X.mask(mask)
+        X = _mask_frame(X, mask_rate)
 
-    # Drop ignored columns
-    if ignore_columns:
-        cols_to_drop = [X.columns[i] for i in ignore_columns if i < len(X.columns)]
-        X = X.drop(columns=cols_to_drop)
+    return X, y
 
-    # Impute missing values if needed
-    if impute and X.isna().any().any():
-        imputer = KNNImputer(n_neighbors=5, weights="distance")
-        X = pd.DataFrame(
-            imputer.fit_transform(X),
-            columns=X.columns,
-            index=X.index
-        )
 
-    return X, y
+def _drop_columns(X, ignore_columns):
+    """Drop the columns at the given indices (out-of-range indices are skipped)."""
+    if not ignore_columns:
+        return X
+    return X.drop(columns=[X.columns[i] for i in ignore_columns if i < len(X.columns)])
+
+
+@Profile.span("dataset.impute")
+def _impute_frame(X):
+    """KNN-impute a frame (same settings as the loaders), keeping its columns and index."""
+    return pd.DataFrame(
+        Dataset.knn_impute(X, n_neighbors=5, weights="distance"),
+        columns=X.columns,
+        index=X.index
+    )
+
+
+@functools.lru_cache(maxsize=DATASET_CACHE_SIZE)
+def _full_dataset(dataset_name, mask_rate, impute, ignore_columns):
+    """Build the masked, column-filtered and optionally imputed dataset (memoized).
+
+    Args:
+        dataset_name: Dataset name (Iris, Income or Synthetic)
+        mask_rate: Fraction of values to mask (0.0-1.0)
+        impute: If True, impute missing values
+        ignore_columns: Sorted tuple of column indices to drop
+
+    Returns:
+        tuple: (X, y) feature matrix and target series
+    """
+    if impute:
+        # Imputation runs on top of the cached non-imputed frame
+        X, y = _full_dataset(dataset_name, mask_rate, False, ignore_columns)
+        if X.isna().any().any():
+            X = _impute_frame(X)
+        return X, y
+
+    X, y = _masked_dataset(dataset_name, mask_rate)
+    return _drop_columns(X, ignore_columns), y
+
+
+def load_full_dataset(dataset_name, mask_rate=0.0, impute=False, ignore_columns=None):
+    """Load the full dataset without train/test split.
 
+    Results are memoized per (dataset, mask_rate, impute, ignore_columns), so models
+    sharing a column configuration reuse the same masked and imputed frames.
+    The returned frames are shared and must not be modified in place.
 
-def evaluate_model(model_path, X, y):
+    Args:
+        dataset_name: Dataset name (Iris, Income or Synthetic)
+        mask_rate: Fraction of values to mask (0.0-1.0)
+        impute: If True, impute missing values
+        ignore_columns: List of column indices to drop
+
+    Returns:
+        tuple: (X, y) feature matrix and target series
+    """
+    return _full_dataset(dataset_name, mask_rate, impute, tuple(sorted(set(ignore_columns or []))))
+
+
+class StreamingScore:
+    """Accuracy and confusion counts accumulated one prediction batch at a time."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rows = 0
+        self.correct = 0
+        self.counts = collections.Counter()  # (true label, predicted label) -> rows
+
+    def update(self, y_true, y_pred):
+        """Add one batch of true and predicted labels."""
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        self.rows += len(y_true)
+        self.correct += int((y_pred == y_true).sum())
+        pairs = pd.DataFrame({"true": y_true, "pred": y_pred}).value_counts(sort=False)
+        for (true, pred), count in pairs.items():
+            self.counts[(true, pred)] += int(count)
+
+    @property
+    def accuracy(self):
+        return self.correct / self.rows if self.rows else float("nan")
+
+    def confusion(self):
+        """Return {"labels": sorted labels, "matrix": rows = true label, columns = predicted}."""
+        labels = sorted({label for pair in self.counts for label in pair}, key=str)
+        index = {label: i for i, label in enumerate(labels)}
+        matrix = [[0] * len(labels) for _ in labels]
+        for (true, pred), count in self.counts.items():
+            matrix[index[true]][index[pred]] = count
+        return {"labels": [label.item() if hasattr(label, "item") else label for label in labels],
+                "matrix": matrix}
+
+
+def iter_batches(X, y, batch_rows=BATCH_ROWS):
+    """Yield (X_batch, y_batch) row slices of a dataset.
+
+    Slices are views, so a frame backed by memory-mapped columns (Synthetic,
+    published .npy matrices) is only read one batch at a time.
+
+    Args:
+        X: Feature DataFrame or array
+        y: Target Series or array
+        batch_rows: Rows per batch (0 or None = one batch)
+    """
+    rows = len(X)
+    batch_rows = batch_rows or rows or 1
+    for start in range(0, rows, batch_rows):
+        end = min(start + batch_rows, rows)
+        X_batch = X.iloc[start:end] if hasattr(X, "iloc") else X[start:end]
+        y_batch = y.iloc[start:end] if hasattr(y, "iloc") else y[start:end]
+        yield X_batch, y_batch
+
+
+def score_batches(model, batches, score=None):
+    """Predict each (X, y) batch and accumulate the results.
+
+    Args:
+        model: Fitted classifier
+        batches: Iterable of (X_batch, y_batch)
+        score: Optional StreamingScore to accumulate into
+
+    Returns:
+        StreamingScore
+    """
+    score = score if score is not None else StreamingScore()
+    for X_batch, y_batch in batches:
+        score.update(y_batch, model.predict(X_batch))
+    return score
+
+
+def load_predictor(model_path, rows, mmap_mode=None, compiled="auto"):
+    """Return the compiled form of a model when it should be used, else the sklearn model.
+
+    Args:
+        model_path: Path to the model pkl file
+        rows: Rows per prediction batch
+        mmap_mode: Optional joblib mmap_mode for loading the sklearn model
+        compiled: "on", "off" or "auto" (compiled for forests whose batch rows x
+            depth is at most COMPILED_MAX_ROW_LEVELS)
+
+    Returns:
+        Object with a predict(X) method
+    """
+    if compiled == "on" or (compiled == "auto" and rows <= COMPILED_MAX_ROW_LEVELS):
+        predictor = Model.load_compiled(model_path)
+        if predictor is not None and (compiled == "on" or (
+                predictor.kind == "forest" and rows * max(predictor.depth, 1) <= COMPILED_MAX_ROW_LEVELS)):
+            return predictor
+    return Model.load(model_path, mmap_mode=mmap_mode)
+
+
+@Profile.span("evaluate")
+def evaluate_model(model_path, X, y, mmap_mode=None, batch_rows=BATCH_ROWS, score=None, compiled="auto"):
     """Load a model and evaluate it on the given data.
 
+    Models come from the process-level cache (Model.load), so repeated
+    evaluations of the same model.pkl only unpickle it once. Predictions run
+    in batches of `batch_rows`, so peak memory follows the batch size rather
+    than the dataset size. Small batches of shallow forests are scored with
+    the compiled predictor (Model.load_compiled, see load_predictor), which
+    gives the same labels with less per-tree overhead.
+
     Args:
         model_path: Path to the model pkl file
         X: Feature matrix
         y: Target series
+        mmap_mode: Optional joblib mmap_mode for loading the model (e.g. 'r')
+        batch_rows: Rows per prediction batch (0 = whole dataset at once)
+        score: Optional StreamingScore that receives the confusion counts
+        compiled: Compiled predictor policy, "auto", "on" or "off"
 
     Returns:
         tuple: (accuracy, imputed) where imputed is True if imputation was applied
     """
-    model = joblib.load(model_path)
+    model = load_predictor(model_path, min(batch_rows or len(X), len(X)), mmap_mode, compiled)
+    score = score if score is not None else StreamingScore()
 
     try:
-        y_pred = model.predict(X)
-        accuracy = (y_pred == y).mean()
-        return accuracy, False
+        score_batches(model, iter_batches(X, y, batch_rows), score)
+        return score.accuracy, False
     except ValueError as e:
         # Check if error is due to NaN values
         if "NaN" in str(e) and X.isna().any().any():
-            # Model doesn't support NaN - impute and retry
-            imputer = KNNImputer(n_neighbors=5, weights="distance")
-            X_imputed = pd.DataFrame(
-                imputer.fit_transform(X),
-                columns=X.columns,
-                index=X.index
-            )
-            y_pred = model.predict(X_imputed)
-            accuracy = (y_pred == y).mean()
-            return accuracy, True
+            # Model doesn't support NaN - impute the whole matrix (KNN donors span all rows) and retry
+            score.reset()
+            score_batches(model, iter_batches(_impute_frame(X), y, batch_rows), score)
+            return score.accuracy, True
         raise
 
 
-def run_script(script, mask, impute=False, use_output=False, run_id=None, dataset="Iris", ignore_columns=None):
+def changed_rows(X_before, X_after):
+    """Rows whose missing-value pattern differs between two mask levels of the same frame.
+
+    Mask levels only replace values with NaN, so every other row is identical
+    in both frames and keeps its prediction.
+    """
+    before = np.asarray(pd.isna(X_before))
+    after = np.asarray(pd.isna(X_after))
+    return np.flatnonzero((before != after).any(axis=1))
+
+
+class MaskSweep:
+    """Evaluate one model across mask levels, re-predicting only the rows that changed.
+
+    The predictions of the last level are kept; the next level only predicts
+    the rows returned by changed_rows(). Accuracy is identical to a full
+    evaluate_model() call. Models that fall back to imputation (no native NaN
+    support) are evaluated in full and nothing is carried over.
+    """
+
+    def __init__(self, model_path, mmap_mode=None, batch_rows=BATCH_ROWS, compiled="auto"):
+        self.model_path = model_path
+        self.mmap_mode = mmap_mode
+        self.batch_rows = batch_rows
+        self.compiled = compiled
+        self.X = None        # Frame of the last natively predicted level
+        self.y_pred = None   # Its predictions
+        self.predicted = 0   # Rows predicted so far (for progress logs)
+
+    @Profile.span("evaluate")
+    def evaluate(self, X, y):
+        """Evaluate the model on the next mask level of the frame.
+
+        Args:
+            X: Masked feature matrix (same rows and columns at every level)
+            y: Target series
+
+        Returns:
+            tuple: (accuracy, imputed) like evaluate_model()
+        """
+        carried = self.X is not None and list(self.X.columns) == list(X.columns) and len(self.X) == len(X)
+        rows = changed_rows(self.X, X) if carried else None
+        X_rows = X.iloc[rows] if carried else X
+        n_rows = len(X_rows)
+
+        try:
+            predictions = []
+            if n_rows:
+                model = load_predictor(self.model_path, min(self.batch_rows or n_rows, n_rows),
+                                       self.mmap_mode, self.compiled)
+                step = self.batch_rows or n_rows
+                predictions = [model.predict(X_rows.iloc[start:start + step]) for start in range(0, n_rows, step)]
+        except ValueError:
+            # Not natively predictable (e.g. NaN without NaN support): evaluate in full
+            self.X = self.y_pred = None
+            self.predicted += len(X)
+            return evaluate_model(self.model_path, X, y, mmap_mode=self.mmap_mode,
+                                  batch_rows=self.batch_rows, compiled=self.compiled)
+
+        if carried:
+            y_pred = self.y_pred.copy()
+            if n_rows:
+                y_pred[rows] = np.concatenate(predictions)
+        else:
+            y_pred = np.concatenate(predictions) if predictions else np.empty(0)
+        self.X, self.y_pred = X, y_pred
+        self.predicted += n_rows
+
+        score = StreamingScore()
+        score.update(y, y_pred)
+        return score.accuracy, False
+
+
+@functools.lru_cache(maxsize=SEED_CACHE_SIZE)
+def _seed_frame(dataset_name, mask_rate, impute, ignore_columns, seed):
+    """Build the feature matrix of one mask seed; only imputed frames are memoized (see seed_frames)."""
+    X, _ = _masked_dataset(dataset_name, 0.0)
+    X = _drop_columns(_mask_frame(X, mask_rate, seed), ignore_columns)
+    if impute and X.isna().any().any():
+        X = _impute_frame(X)
+    return X
+
+
+def seed_frames(dataset_name, mask_rate, impute, ignore_columns, seeds):
+    """Yield the masked (and optionally imputed) feature matrix of each mask seed.
+
+    MASK_SEED comes from load_full_dataset's memo. Masks of other seeds are
+    cheap to redraw and built on the fly; their imputed frames (one KNN
+    imputation per seed) are memoized in _seed_frame so models with the same
+    columns share them.
+
+    Args:
+        dataset_name: Dataset name (Iris, Income or Synthetic)
+        mask_rate: Fraction of values to mask (0.0-1.0)
+        impute: If True, impute missing values (one KNN imputation per seed)
+        ignore_columns: List of column indices to drop
+        seeds: Mask seeds
+    """
+    ignore_columns = tuple(sorted(set(ignore_columns or [])))
+    for seed in seeds:
+        if seed == MASK_SEED:
+            yield load_full_dataset(dataset_name, mask_rate, impute, ignore_columns)[0]
+        elif impute:
+            yield _seed_frame(dataset_name, mask_rate, True, ignore_columns, seed)
+        else:
+            yield _seed_frame.__wrapped__(dataset_name, mask_rate, False, ignore_columns, seed)
+
+
+def _predict_stacked(model_path, group, y, mmap_mode, batch_rows, score, compiled):
+    """Predict copies of a dataset stacked into one matrix; returns the accuracy of each copy.
+
+    `score`, if given, receives the predictions of the first copy only.
+    """
+    X = group[0] if len(group) == 1 else pd.concat(group, ignore_index=True)
+    y_stacked = np.tile(y, len(group))
+    model = load_predictor(model_path, min(batch_rows or len(X), len(X)), mmap_mode, compiled)
+    predictions = np.concatenate([model.predict(X_batch) for X_batch, _ in iter_batches(X, y_stacked, batch_rows)])
+    if score is not None:
+        score.update(y, predictions[:len(y)])
+    correct = (predictions == y_stacked).reshape(len(group), len(y)).sum(axis=1)
+    return [int(count) / len(y) for count in correct]
+
+
+@Profile.span("evaluate")
+def evaluate_seeds(model_path, frames, y, mmap_mode=None, batch_rows=BATCH_ROWS, score=None, compiled="auto"):
+    """Evaluate a model on several masked copies of a dataset with stacked predictions.
+
+    Copies are concatenated into groups of up to `batch_rows` rows (at least
+    one copy per group, all copies when batch_rows is 0) and each group is
+    scored in one pass, so K copies of a small dataset cost a few predict
+    calls instead of K. Models without NaN support fall back to imputing each
+    copy, as in evaluate_model().
+
+    Args:
+        model_path: Path to the model pkl file
+        frames: Iterable of feature matrices with the same rows, one per seed
+        y: Target series shared by all copies
+        mmap_mode: Optional joblib mmap_mode for loading the model (e.g. 'r')
+        batch_rows: Rows per prediction batch (0 = all copies at once)
+        score: Optional StreamingScore that receives the confusion counts of the first copy
+        compiled: Compiled predictor policy, "auto", "on" or "off"
+
+    Returns:
+        tuple: (accuracies, imputed) with one accuracy per frame
+    """
+    y = np.asarray(y)
+    per_group = max(1, batch_rows // len(y)) if batch_rows and len(y) else None
+    accuracies, imputed = [], False
+
+    group = []
+    frames = iter(frames)
+    while True:
+        X = next(frames, None)
+        if X is not None:
+            group.append(X)
+            if per_group is None or len(group) < per_group:
+                continue
+        if not group:
+            break
+        first_score = score if not accuracies else None
+        try:
+            accuracies += _predict_stacked(model_path, group, y, mmap_mode, batch_rows, first_score, compiled)
+        except ValueError as e:
+            if "NaN" not in str(e) or not any(frame.isna().any().any() for frame in group):
+                raise
+            group = [_impute_frame(frame) if frame.isna().any().any() else frame for frame in group]
+            accuracies += _predict_stacked(model_path, group, y, mmap_mode, batch_rows, first_score, compiled)
+            imputed = True
+        group = []
+        if X is None:
+            break
+    return accuracies, imputed
+
+
+def summarize_seeds(seeds, accuracies):
+    """Mean, sample standard deviation and Student-t confidence interval of per-seed accuracies."""
+    mean = float(np.mean(accuracies))
+    std = float(np.std(accuracies, ddof=1)) if len(accuracies) > 1 else 0.0
+    half_width = 0.0
+    if len(accuracies) > 1:
+        half_width = float(stats.t.ppf((1 + CONFIDENCE) / 2, len(accuracies) - 1) * std / np.sqrt(len(accuracies)))
+    return {
+        "seeds": list(seeds),
+        "mean": mean,
+        "std": std,
+        "confidence": CONFIDENCE,
+        "ci": [mean - half_width, mean + half_width],
+        "accuracies": accuracies
+    }
+
+
+def format_interval(summary):
+    """Confidence interval suffix for log lines ("" without a Monte Carlo summary)."""
+    if not summary:
+        return ""
+    low, high = summary["ci"]
+    return f" ({summary['confidence']:.0%} CI {low:.4f}-{high:.4f}, {len(summary['seeds'])} seeds)"
+
+
+def evaluate_monte_carlo(model_path, dataset_name, mask_rate, impute, ignore_columns, seeds,
+                         mmap_mode=None, batch_rows=BATCH_ROWS, score=None, compiled="auto"):
+    """Evaluate a model on one mask rate under several random masks.
+
+    Args:
+        model_path: Path to the model pkl file
+        dataset_name: Dataset name (Iris, Income or Synthetic)
+        mask_rate: Fraction of values to mask (0.0-1.0)
+        impute: If True, impute missing values
+        ignore_columns: List of column indices to drop
+        seeds: Mask seeds (MASK_SEED first reproduces the single-seed accuracy)
+        mmap_mode: Optional joblib mmap_mode for loading the model (e.g. 'r')
+        batch_rows: Rows per prediction batch (0 = all copies at once)
+        score: Optional StreamingScore that receives the confusion counts of the first seed
+        compiled: Compiled predictor policy, "auto", "on" or "off"
+
+    Returns:
+        tuple: (summary, imputed) where summary comes from summarize_seeds()
+    """
+    X, y = load_full_dataset(dataset_name, mask_rate, impute, ignore_columns)
+    if mask_rate == 0:
+        # Nothing is masked, so every seed sees the same matrix
+        accuracy, imputed = evaluate_model(model_path, X, y, mmap_mode=mmap_mode, batch_rows=batch_rows,
+                                           score=score, compiled=compiled)
+        accuracies = [accuracy] * len(seeds)
+    else:
+        frames = seed_frames(dataset_name, mask_rate, impute, ignore_columns, seeds)
+        accuracies, imputed = evaluate_seeds(model_path, frames, y, mmap_mode=mmap_mode, batch_rows=batch_rows,
+                                             score=score, compiled=compiled)
+    return summarize_seeds(seeds, accuracies), imputed
+
+
+def configure_dataset(dataset_name, config):
+    """Apply Synthetic generation parameters, dropping memoized frames when they change.
+
+    Args:
+        dataset_name: Dataset name (Iris, Income or Synthetic)
+        config: Synthetic parameters dict or None
+    """
+    if dataset_name != "Synthetic":
+        if config:
+            raise ValueError(f"--dataset-config is only supported for Synthetic, not {dataset_name}")
+        return
+    if Dataset.Synthetic.configure(**(config or {})):
+        _seed_frame.cache_clear()
+        _masked_dataset.cache_clear()
+        _full_dataset.cache_clear()
+
+
+@Profile.span("train")
+def run_script(script, mask, impute=False, use_output=False, run_id=None, dataset="Iris", ignore_columns=None,
+               dataset_config=None):
     """Run a training script and return accuracy from JSON output."""
     cmd = ["python", "-W", "ignore", script, "--json", "--dataset", dataset]
 
+    if dataset_config:
+        cmd.extend(["--dataset-config", json.dumps(dataset_config)])
+
     if run_id:
         cmd.extend(["--run-id", run_id])
 
@@ -213,13 +708,387 @@ def run_script(script, mask, impute=False, use_output=False, run_id=None, datase
         return None
 
 
+# Masked splits shared with sweep workers: {mask: (X_train, X_test, y_train, y_test)}
+_sweep_dataset = None
+_sweep_splits = {}
+
+
+def _impute_jobs(jobs):
+    """KNN imputation threads per pool worker, so the workers' threads share the cores."""
+    return max(1, (os.cpu_count() or 1) // jobs)
+
+
+def _init_impute_worker(n_jobs):
+    """Process pool initializer: cap this worker's KNN imputation threads (IMPUTE_JOBS)."""
+    lib.dataset.impute.N_JOBS = n_jobs
+
+
+def _init_sweep_worker(dataset, splits, impute_jobs):
+    """Process pool initializer: receive the shared masked splits once per worker."""
+    global _sweep_dataset, _sweep_splits
+    _sweep_dataset = dataset
+    _sweep_splits = splits
+    _init_impute_worker(impute_jobs)
+
+
+def _impute_task(mask):
+    """Impute the training set of a shared masked split (test set unchanged)."""
+    X_train, X_test, _, _ = _sweep_splits[mask]
+    X_train_imputed, _ = getattr(Dataset, _sweep_dataset)._impute(X_train, X_test)
+    return X_train_imputed
+
+
+def _train_task(name, mask, impute, X_train=None):
+    """Fit one model on a shared masked split and score it on the test set.
+
+    Args:
+        name: Model type (tree/forest/gradient/hist-gradient)
+        mask: Mask percentage
+        impute: Whether X_train is the imputed variant
+        X_train: Optional replacement training features (imputed variant)
+
+    Returns:
+        tuple: (name, mask, impute, accuracy, error) - accuracy is None on failure
+    """
+    split_X_train, X_test, y_train, y_test = _sweep_splits[mask]
+    if X_train is None:
+        X_train = split_X_train
+
+    try:
+        clf = Model.build(name, Model.load_config(name, _sweep_dataset))
+        clf.fit(X_train, y_train)
+        accuracy = float((clf.predict(X_test) == y_test).mean())
+        return name, mask, impute, accuracy, None
+    except Exception as e:
+        return name, mask, impute, None, str(e)
+
+
+@Profile.span("train.parallel")
+def run_sweep_parallel(dataset, jobs):
+    """Run the fresh-training sweep in-process on a pool of worker processes.
+
+    Each masked split is generated once in the parent and handed to the workers
+    through the pool initializer. Imputation runs as its own task per mask rate,
+    and the imputed training runs are queued as soon as it finishes. Results are
+    collected out of order.
+
+    Args:
+        dataset: Dataset name (Iris, Income or Synthetic)
+        jobs: Number of worker processes
+
+    Returns:
+        dict: Model name (and {name}_impute) -> accuracy list aligned with MASK_VALUES
+    """
+    names = [script.replace("train-", "").replace(".py", "") for script in SCRIPTS]
+    DataSource = getattr(Dataset, dataset)
+
+    splits = {mask: DataSource.input(mask_rate=mask / 100.0) for mask in MASK_VALUES}
+
+    results = {}
+    for name in names:
+        results[name] = [None] * len(MASK_VALUES)
+        results[f"{name}_impute"] = [None] * len(MASK_VALUES)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_sweep_worker,
+                             initargs=(dataset, splits, _impute_jobs(jobs))) as pool:
+        imputing = {}
+        pending = set()
+        for mask in MASK_VALUES:
+            for name in names:
+                pending.add(pool.submit(_train_task, name, mask, False))
+            if mask > 0:
+                future = pool.submit(_impute_task, mask)
+                imputing[future] = mask
+                pending.add(future)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in imputing:
+                    mask = imputing.pop(future)
+                    try:
+                        X_train_imputed = future.result()
+                    except MemoryBudgetError:
+                        raise
+                    except Exception as e:
+                        print(f"Error: imputation mask={mask}: {e}", file=sys.stderr)
+                        for name in names:
+                            emit_cell(name, mask, True, e)
+                        continue
+                    for name in names:
+                        pending.add(pool.submit(_train_task, name, mask, True, X_train_imputed))
+                    continue
+
+                name, mask, impute, accuracy, error = future.result()
+                idx = MASK_VALUES.index(mask)
+                key = f"{name}_impute" if impute else name
+                results[key][idx] = accuracy
+                if mask == 0:
+                    # Same as without impute for mask=0
+                    results[f"{name}_impute"][idx] = accuracy
+
+                if error:
+                    print(f"Error: {name} mask={mask} impute={impute}: {error}", file=sys.stderr)
+                    emit_cell(name, mask, impute, RuntimeError(error))
+                else:
+                    print(f"  {key} mask={mask}%: {accuracy:.4f}")
+                    emit_cell(name, mask, impute, (accuracy, impute))
+
+    return results
+
+
+def _publish(path, X):
+    """Write a feature matrix as a float64 .npy file workers can memory-map."""
+    np.save(path, np.ascontiguousarray(X.to_numpy(dtype=np.float64)))
+    return path
+
+
+def _impute_published(src_path, dst_path):
+    """Impute a published matrix (KNN, same settings as load_full_dataset) into a new file."""
+    X = np.load(src_path, mmap_mode="r")
+    if np.isnan(X).any():
+        X = Dataset.knn_impute(X, n_neighbors=5, weights="distance")
+    np.save(dst_path, X)
+    return dst_path
+
+
+def _evaluate_published(model_path, X_path, columns, y_path, mmap_mode=None, batch_rows=BATCH_ROWS,
+                        compiled="auto"):
+    """Evaluate a model on memory-mapped published data (runs in a pool worker).
+
+    Batches are sliced from the memory map, so a worker only pages in the rows
+    it is predicting.
+
+    Returns:
+        tuple: ((accuracy, was_imputed), seconds)
+    """
+    start_time = time.time()
+    X = pd.DataFrame(np.load(X_path, mmap_mode="r"), columns=columns, copy=False)
+    y = np.load(y_path, mmap_mode="r")
+    result = evaluate_model(model_path, X, y, mmap_mode=mmap_mode, batch_rows=batch_rows, compiled=compiled)
+    return result, time.time() - start_time
+
+
+def _evaluate_published_levels(model_path, levels, y_path, mmap_mode=None, batch_rows=BATCH_ROWS,
+                               compiled="auto"):
+    """Evaluate a model on published mask levels in increasing order (runs in a pool worker).
+
+    A MaskSweep carries the predictions from one level to the next, so each
+    level only re-predicts the rows whose mask changed.
+
+    Args:
+        levels: List of (key, X_path, columns) sorted by mask rate
+
+    Returns:
+        list: (key, (accuracy, was_imputed) or the exception raised, seconds) per level
+    """
+    y = np.load(y_path, mmap_mode="r")
+    sweep = MaskSweep(model_path, mmap_mode=mmap_mode, batch_rows=batch_rows, compiled=compiled)
+    results = []
+    for key, X_path, columns in levels:
+        start_time = time.time()
+        X = pd.DataFrame(np.load(X_path, mmap_mode="r"), columns=columns, copy=False)
+        try:
+            result = sweep.evaluate(X, y)
+        except Exception as e:
+            result = e
+        results.append((key, result, time.time() - start_time))
+    return results
+
+
+@Profile.span("evaluate.parallel")
+def evaluate_cells_parallel(dataset, cells, jobs, mmap_mode=None, on_result=None, batch_rows=BATCH_ROWS,
+                            compiled="auto"):
+    """Evaluate sequence cells on a pool of worker processes.
+
+    Every distinct (mask_rate, ignore_columns) feature matrix is published once as a
+    .npy file in a temporary directory and memory-mapped by the workers, so no
+    DataFrames are pickled across the process boundary. Imputed matrices are
+    produced by pool tasks; their cells are queued as soon as imputation finishes.
+    The non-imputed cells of a model run as one task over increasing mask rates
+    (see MaskSweep), so their results arrive together when the task finishes.
+
+    Args:
+        dataset: Dataset name (Iris, Income or Synthetic)
+        cells: List of (key, model_path, mask_rate, impute, ignore_columns) with
+            mask_rate in percent
+        jobs: Number of worker processes
+        mmap_mode: Optional joblib mmap_mode for loading models
+        on_result: Optional callback(key, result, seconds) called as each cell finishes
+        batch_rows: Rows per prediction batch in the workers
+        compiled: Compiled predictor policy in the workers ("auto", "on" or "off")
+
+    Returns:
+        dict: key -> (accuracy, was_imputed), or the exception raised for that cell
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="compare-") as tmp_dir:
+        y = load_full_dataset(dataset)[1]
+        y_path = os.path.join(tmp_dir, "y.npy")
+        np.save(y_path, y.to_numpy().astype(str))
+
+        # (mask_rate, ignore_columns) -> (path, columns) of the non-imputed matrix
+        published = {}
+        for _, _, mask_rate, _, ignore_columns in cells:
+            source = (mask_rate, tuple(sorted(set(ignore_columns))))
+            if source not in published:
+                X, _ = load_full_dataset(dataset, mask_rate / 100.0, False, ignore_columns)
+                path = _publish(os.path.join(tmp_dir, f"X_{len(published)}.npy"), X)
+                published[source] = (path, X.columns.tolist())
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_impute_worker,
+                                 initargs=(_impute_jobs(jobs),)) as pool:
+            pending = {}    # future -> cell key, or the list of keys of a MaskSweep task
+            imputing = {}   # future -> source
+            waiting = {}    # source -> [(key, model_path)] cells waiting on imputation
+            chains = {}     # (model_path, ignore_columns) -> [(mask_rate, key, path, columns)]
+
+            for key, model_path, mask_rate, impute, ignore_columns in cells:
+                source = (mask_rate, tuple(sorted(set(ignore_columns))))
+                path, columns = published[source]
+                if not impute:
+                    chains.setdefault((model_path, source[1]), []).append((mask_rate, key, path, columns))
+                    continue
+
+                if source not in waiting:
+                    waiting[source] = []
+                    future = pool.submit(_impute_published, path, path.replace(".npy", "_imputed.npy"))
+                    imputing[future] = source
+                waiting[source].append((key, model_path))
+
+            for (model_path, _), levels in chains.items():
+                levels = [(key, path, columns) for _, key, path, columns in sorted(levels, key=lambda level: level[0])]
+                future = pool.submit(_evaluate_published_levels, model_path, levels, y_path,
+                                     mmap_mode, batch_rows, compiled)
+                pending[future] = [key for key, _, _ in levels]
+
+            while pending or imputing:
+                done, _ = wait(list(pending) + list(imputing), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in imputing:
+                        source = imputing.pop(future)
+                        error = future.exception()
+                        _, columns = published[source]
+                        for key, model_path in waiting.pop(source):
+                            if error is not None:
+                                results[key] = error
+                                if on_result:
+                                    on_result(key, error, None)
+                                continue
+                            cell = pool.submit(_evaluate_published, model_path, future.result(),
+                                               columns, y_path, mmap_mode, batch_rows, compiled)
+                            pending[cell] = key
+                        continue
+
+                    keys = pending.pop(future)
+                    if future.exception() is not None:
+                        finished = [(key, future.exception(), None)
+                                    for key in (keys if isinstance(keys, list) else [keys])]
+                    elif isinstance(keys, list):
+                        finished = future.result()
+                    else:
+                        result, seconds = future.result()
+                        finished = [(keys, result, seconds)]
+                    for key, result, seconds in finished:
+                        results[key] = result
+                        if on_result:
+                            on_result(key, result, seconds)
+
+    return results
+
+
+def _init_monte_carlo_worker(dataset, dataset_config, impute_jobs):
+    """Process pool initializer: apply the Synthetic parameters and cap imputation threads."""
+    configure_dataset(dataset, dataset_config)
+    _init_impute_worker(impute_jobs)
+
+
+def _evaluate_monte_carlo_group(dataset, mask_rate, impute, ignore_columns, models, seeds, mmap_mode=None,
+                                batch_rows=BATCH_ROWS, compiled="auto"):
+    """Evaluate the models of one (mask_rate, impute, ignore_columns) group under every seed (runs in a pool worker).
+
+    The models of a group share the seed frames, so each imputed frame is
+    built once, in the worker that memoizes it.
+
+    Returns:
+        list: (key, (summary, was_imputed) or the exception raised, seconds) per model
+    """
+    finished = []
+    for key, model_path in models:
+        start_time = time.time()
+        try:
+            result = evaluate_monte_carlo(model_path, dataset, mask_rate / 100.0, impute, list(ignore_columns),
+                                          seeds, mmap_mode=mmap_mode, batch_rows=batch_rows, compiled=compiled)
+        except MemoryBudgetError:
+            raise
+        except Exception as e:
+            result = e
+        finished.append((key, result, time.time() - start_time))
+    return finished
+
+
+@Profile.span("evaluate.parallel")
+def evaluate_monte_carlo_parallel(dataset, cells, seeds, jobs, dataset_config=None, mmap_mode=None,
+                                  on_result=None, batch_rows=BATCH_ROWS, compiled="auto"):
+    """Evaluate --seeds sequence cells on a pool of worker processes.
+
+    Cells with the same mask rate, imputation and ignored columns form one task,
+    so the seed frames of a group are masked (and imputed) once.
+
+    Args:
+        dataset: Dataset name (Iris, Income or Synthetic)
+        cells: List of (key, model_path, mask_rate, impute, ignore_columns) with
+            mask_rate in percent
+        seeds: Mask seeds
+        jobs: Number of worker processes
+        dataset_config: Synthetic parameters applied in each worker
+        mmap_mode: Optional joblib mmap_mode for loading models
+        on_result: Optional callback(key, result, seconds) called as each cell finishes
+        batch_rows: Rows per prediction batch in the workers
+        compiled: Compiled predictor policy in the workers ("auto", "on" or "off")
+
+    Returns:
+        dict: key -> (summary, was_imputed), or the exception raised for that cell
+    """
+    groups = {}
+    for key, model_path, mask_rate, impute, ignore_columns in cells:
+        groups.setdefault((mask_rate, impute, tuple(sorted(set(ignore_columns)))), []).append((key, model_path))
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_monte_carlo_worker,
+                             initargs=(dataset, dataset_config, _impute_jobs(jobs))) as pool:
+        pending = {
+            pool.submit(_evaluate_monte_carlo_group, dataset, mask_rate, impute, ignore_columns, models, seeds,
+                        mmap_mode, batch_rows, compiled): [key for key, _ in models]
+            for (mask_rate, impute, ignore_columns), models in groups.items()
+        }
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                keys = pending.pop(future)
+                error = future.exception()
+                if isinstance(error, MemoryBudgetError):
+                    raise error
+                finished = [(key, error, None) for key in keys] if error is not None else future.result()
+                for key, result, seconds in finished:
+                    results[key] = result
+                    if on_result:
+                        on_result(key, result, seconds)
+
+    return results
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="Compare accuracy across training scripts with varying mask rates"
     )
-    parser.add_argument("--dataset", type=str, choices=["Iris", "Income"], default="Iris",
+    parser.add_argument("--dataset", type=str, choices=["Iris", "Income", "Synthetic"], default="Iris",
                         help="Dataset to use (default: Iris)")
+    parser.add_argument("--dataset-config", type=json.loads, default=None,
+                        help="JSON string with Synthetic dataset parameters "
+                             "(default with --models: the first model's training config)")
     parser.add_argument("--models", type=str, default=None,
                         help="Comma-separated run IDs (e.g., 1706540123,1706540456)")
     parser.add_argument("--mask", type=int, default=0,
@@ -228,17 +1097,85 @@ def parse_args():
                         help="Impute missing values during comparison")
     parser.add_argument("--sequence", action="store_true",
                         help="Run sequence comparison across mask rates 0,10,20,30,40,50,60")
+    parser.add_argument("--sequence-step", type=int, default=10,
+                        help="Mask rate step of the --sequence levels in percent (default: 10)")
+    parser.add_argument("--sequence-max", type=int, default=60,
+                        help="Highest --sequence mask rate in percent, at most 99 (default: 60)")
     parser.add_argument("--ignore-columns", type=str, default=None,
                         help="Comma-separated column indices to ignore")
     parser.add_argument("--compare-id", type=str, default=None,
                         help="Optional: Use provided compare ID instead of generating new one")
     parser.add_argument("--images", action="store_true",
                         help="Generate visualization images to frontend/public/output/compare/<compare_id>/")
-    return parser.parse_args()
+    parser.add_argument("--mmap-models", action="store_true",
+                        help="Memory-map numpy arrays when loading model.pkl files")
+    parser.add_argument("--stream", action="store_true",
+                        help="Emit NDJSON progress events (start/cell/error/finish) on stdout; logs go to stderr")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS,
+                        help=f"Rows per prediction batch when scoring saved models; 0 predicts "
+                             f"the whole dataset at once (default: {BATCH_ROWS})")
+    parser.add_argument("--seeds", type=int, default=1,
+                        help=f"Evaluate every masked cell under K random masks (seeds {MASK_SEED}..{MASK_SEED}+K-1) "
+                             f"and report mean and {CONFIDENCE:.0%} confidence interval (default: 1)")
+    parser.add_argument("--compiled", choices=["auto", "on", "off"], default="auto",
+                        help="Score tree, forest and gradient models with the compiled flat-array "
+                             f"predictor: auto uses it only for forests with batch rows x depth <= "
+                             f"{COMPILED_MAX_ROW_LEVELS}, where it beats sklearn (default: auto)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes; >1 runs the fresh sweep or the --sequence cells (also with "
+                             "--seeds) on a process pool. Single-mask model comparisons run in-process "
+                             "(default: 1)")
+    parser.add_argument("--memory", action="store_true",
+                        help="Record peak RSS and tracemalloc top allocations per stage in memory.json "
+                             "(slows the run down)")
+    parser.add_argument("--memory-budget", type=float, default=None, metavar="MB",
+                        help="Fail with MemoryBudgetError once RSS (with worker processes) exceeds MB "
+                             "(default: MEMORY_BUDGET_MB environment variable, unset = no budget)")
+    args = parser.parse_args()
+    if args.seeds < 1:
+        parser.error("--seeds must be at least 1")
+    if args.sequence_step < 1:
+        parser.error("--sequence-step must be at least 1")
+    if not 0 <= args.sequence_max <= 99:
+        parser.error("--sequence-max must be between 0 and 99")
+    return args
 
 
 def main():
     args = parse_args()
+    # Peak memory per stage (memory.json) and the memory budget; see lib/profile
+    Profile.start(memory=args.memory, memory_budget=args.memory_budget)
+    try:
+        if not args.stream:
+            run(args)
+            return
+        stream(args)
+    finally:
+        Profile.reset()
+
+
+def stream(args):
+    """Run with NDJSON progress events on stdout (--stream)."""
+    # stdout carries only events; everything human-readable goes to stderr
+    _stream.update(out=sys.stdout, start=time.time(), failed=False)
+    sys.stdout = sys.stderr
+    try:
+        run(args)
+    except SystemExit as e:
+        if e.code and not _stream["failed"]:
+            emit("error", fatal=True, message=f"compare.py exited with code {e.code}")
+        raise
+    except Exception as e:
+        emit("error", fatal=True, message=str(e))
+        raise
+    finally:
+        sys.stdout = _stream["out"]
+        _stream["out"] = None
+
+
+def run(args):
+    """Run the comparison selected by the parsed arguments."""
+    mmap_mode = "r" if args.mmap_models else None
 
     # Check if --models provided (model ID comparison mode)
     if args.models:
@@ -264,9 +1201,14 @@ def main():
             runtimes.append((run_id, model_type, runtime))
             print(f"Validated {model_type} model: {run_id}", file=sys.stderr)
 
+        # Evaluate on the data the models were trained on unless overridden
+        dataset_config = args.dataset_config
+        if dataset_config is None:
+            dataset_config = runtimes[0][2].get("datasetParams", {}).get("dataset_config")
+        configure_dataset(args.dataset, dataset_config)
+
         # Extract ignore_columns from each model's runtime.json
-        dataset_cls = getattr(Dataset, args.dataset)
-        total_columns = len(dataset_cls._load_raw()[0].columns)
+        total_columns = len(load_full_dataset(args.dataset)[0].columns)
         all_columns = set(range(total_columns))
 
         # Print column info for each model
@@ -277,26 +1219,15 @@ def main():
 
         # Sequence mode: run comparison across multiple mask rates
         if args.sequence:
-            sequence_mask_values = [0, 10, 20, 30, 40, 50, 60]
+            sequence_mask_values = list(range(0, args.sequence_max + 1, args.sequence_step))
             print(f"\nRunning sequence comparison across mask rates: {sequence_mask_values}", file=sys.stderr)
 
             # Pre-compute model labels and names for visualization
             model_labels = {}  # run_id -> display label
             model_names = {}   # run_id -> name (for JSON output)
             for run_id, model_type, runtime in runtimes:
-                output_dir = get_output_dir(run_id)
-                # Get model name from .id file: {model}_{dataset}_{score}[_{name}].id
-                model_name = None
-                try:
-                    for filename in os.listdir(output_dir):
-                        if filename.endswith('.id'):
-                            parts = filename.replace('.id', '').split('_')
-                            # Name is everything after the 3rd part (index 3+)
-                            if len(parts) > 3:
-                                model_name = '_'.join(parts[3:])
-                            break
-                except (FileNotFoundError, OSError):
-                    pass
+                # Get model name from the run registry
+                model_name = (Model.get_run(run_id) or {}).get("name")
 
                 model_names[run_id] = model_name
                 # Format: "name | id (model type)" or just "id (model type)"
@@ -308,6 +1239,92 @@ def main():
             sequence_data = {}  # {mask_rate: {models: [...]}}
             errors = []
 
+            emit("start", compareId=compare_id, mode="sequence", dataset=args.dataset,
+                 masks=sequence_mask_values,
+                 models=[{"runId": run_id, "model": model_type, "name": model_names[run_id]}
+                         for run_id, model_type, _ in runtimes],
+                 total=len(runtimes) * sum(2 if m > 0 else 1 for m in sequence_mask_values))
+
+            model_types = {run_id: model_type for run_id, model_type, _ in runtimes}
+
+            def stream_cell(key, result, seconds):
+                run_id, mask_rate, impute = key
+                emit_cell(model_types[run_id], mask_rate, impute, result, seconds,
+                          run_id=run_id, name=model_names[run_id])
+
+            # Evaluate all (run_id, mask_rate, impute) cells up front on a worker pool
+            cells = {}
+            seeds = [MASK_SEED + i for i in range(args.seeds)]
+            monte_carlo = {}  # (run_id, mask_rate, impute) -> summarize_seeds() result
+            sequence_cells = [
+                ((run_id, mask_rate, impute),
+                 os.path.join(get_output_dir(run_id), 'model.pkl'),
+                 mask_rate,
+                 impute,
+                 runtime.get("datasetParams", {}).get("ignore_columns", []))
+                for mask_rate in sequence_mask_values
+                for run_id, _, runtime in runtimes
+                for impute in ([False, True] if mask_rate > 0 else [False])
+            ]
+            if args.seeds > 1:
+                print(f"  Evaluating {args.seeds} mask seeds per cell", file=sys.stderr)
+
+                def stream_summary(key, result, seconds):
+                    if not isinstance(result, Exception):
+                        summary, was_imputed = result
+                        monte_carlo[key] = summary
+                        result = (summary["mean"], was_imputed)
+                    cells[key] = result
+                    stream_cell(key, result, seconds)
+
+                if args.jobs > 1:
+                    evaluate_monte_carlo_parallel(args.dataset, sequence_cells, seeds, args.jobs,
+                                                  dataset_config=dataset_config, mmap_mode=mmap_mode,
+                                                  on_result=stream_summary, batch_rows=args.batch_rows,
+                                                  compiled=args.compiled)
+            elif args.jobs > 1:
+                cells = evaluate_cells_parallel(args.dataset, sequence_cells, args.jobs, mmap_mode=mmap_mode,
+                                                on_result=stream_cell, batch_rows=args.batch_rows,
+                                                compiled=args.compiled)
+
+            # Non-imputed cells re-predict only the rows whose mask changed since the previous level
+            sweeps = {run_id: MaskSweep(os.path.join(get_output_dir(run_id), 'model.pkl'), mmap_mode=mmap_mode,
+                                        batch_rows=args.batch_rows, compiled=args.compiled)
+                      for run_id, _, _ in runtimes}
+
+            def evaluate_cell(run_id, model_path, mask_rate, impute, ignore_columns):
+                """Return the pooled result for a cell, or evaluate it in-process."""
+                if (run_id, mask_rate, impute) in cells:
+                    result = cells[(run_id, mask_rate, impute)]
+                    if isinstance(result, Exception):
+                        raise result
+                    return result
+                cell_start = time.time()
+                try:
+                    if args.seeds > 1:
+                        summary, was_imputed = evaluate_monte_carlo(
+                            model_path, args.dataset, mask_rate / 100.0, impute, ignore_columns, seeds,
+                            mmap_mode=mmap_mode, batch_rows=args.batch_rows, compiled=args.compiled)
+                        monte_carlo[(run_id, mask_rate, impute)] = summary
+                        result = (summary["mean"], was_imputed)
+                    else:
+                        X, y = load_full_dataset(
+                            args.dataset,
+                            mask_rate=mask_rate / 100.0,
+                            impute=impute,
+                            ignore_columns=ignore_columns
+                        )
+                        if impute:
+                            result = evaluate_model(model_path, X, y, mmap_mode=mmap_mode,
+                                                    batch_rows=args.batch_rows, compiled=args.compiled)
+                        else:
+                            result = sweeps[run_id].evaluate(X, y)
+                except Exception as e:
+                    stream_cell((run_id, mask_rate, impute), e, time.time() - cell_start)
+                    raise
+                stream_cell((run_id, mask_rate, impute), result, time.time() - cell_start)
+                return result
+
             for mask_rate in sequence_mask_values:
                 print(f"\n  Mask {mask_rate}%:", file=sys.stderr)
                 sequence_data[str(mask_rate)] = {"models": []}
@@ -328,15 +1345,11 @@ def main():
 
                     # Test WITHOUT imputation
                     try:
-                        X, y = load_full_dataset(
-                            args.dataset,
-                            mask_rate=mask_rate / 100.0,
-                            impute=False,
-                            ignore_columns=model_ignore_cols
-                        )
-                        accuracy, was_imputed = evaluate_model(model_path, X, y)
+                        accuracy, was_imputed = evaluate_cell(run_id, model_path, mask_rate, False, model_ignore_cols)
                         sequence_results[label].append(accuracy)
-                        print(f"    {model_type}: {accuracy:.4f}{' (auto-imputed)' if was_imputed else ''}", file=sys.stderr)
+                        summary = monte_carlo.get((run_id, mask_rate, False))
+                        print(f"    {model_type}: {accuracy:.4f}{format_interval(summary)}"
+                              f"{' (auto-imputed)' if was_imputed else ''}", file=sys.stderr)
 
                         model_result = {
                             "runId": run_id,
@@ -347,7 +1360,12 @@ def main():
                         }
                         if mask_rate > 0:
                             model_result["imputed"] = False
+                        if summary:
+                            model_result["monteCarlo"] = summary
                         sequence_data[str(mask_rate)]["models"].append(model_result)
+                    except MemoryBudgetError:
+                        # Over the memory budget: fail the comparison instead of the cell
+                        raise
                     except Exception as e:
                         error_msg = f"{model_type} ({run_id}) mask={mask_rate}%: {e}"
                         print(f"    {model_type}: ERROR - {e}", file=sys.stderr)
@@ -357,23 +1375,24 @@ def main():
                     # Test WITH imputation (only for mask > 0)
                     if mask_rate > 0:
                         try:
-                            X, y = load_full_dataset(
-                                args.dataset,
-                                mask_rate=mask_rate / 100.0,
-                                impute=True,
-                                ignore_columns=model_ignore_cols
-                            )
-                            accuracy_imputed, _ = evaluate_model(model_path, X, y)
+                            accuracy_imputed, _ = evaluate_cell(run_id, model_path, mask_rate, True, model_ignore_cols)
                             sequence_results[f"{label}_impute"].append(accuracy_imputed)
-                            print(f"    {model_type} (imputed): {accuracy_imputed:.4f}", file=sys.stderr)
+                            summary = monte_carlo.get((run_id, mask_rate, True))
+                            print(f"    {model_type} (imputed): {accuracy_imputed:.4f}{format_interval(summary)}",
+                                  file=sys.stderr)
 
-                            sequence_data[str(mask_rate)]["models"].append({
+                            model_result = {
                                 "runId": run_id,
                                 "model": model_type,
                                 "name": model_name,
                                 "accuracy": accuracy_imputed,
                                 "imputed": True
-                            })
+                            }
+                            if summary:
+                                model_result["monteCarlo"] = summary
+                            sequence_data[str(mask_rate)]["models"].append(model_result)
+                        except MemoryBudgetError:
+                            raise
                         except Exception as e:
                             error_msg = f"{model_type} ({run_id}) mask={mask_rate}% imputed: {e}"
                             print(f"    {model_type} (imputed): ERROR - {e}", file=sys.stderr)
@@ -383,6 +1402,11 @@ def main():
                         # For mask=0, imputed is same as non-imputed
                         sequence_results[f"{label}_impute"].append(sequence_results[label][-1])
 
+            predicted = sum(sweep.predicted for sweep in sweeps.values())
+            if predicted:
+                full = len(load_full_dataset(args.dataset)[0]) * len(sequence_mask_values) * len(runtimes)
+                print(f"\n  Non-imputed cells predicted {predicted} of {full} rows", file=sys.stderr)
+
             # Generate sequence comparison image if requested
             if args.images:
                 print(f"\nGenerating sequence comparison image...", file=sys.stderr)
@@ -434,8 +1458,14 @@ def main():
             with open(os.path.join(compare_dir, 'runtime.json'), 'w') as f:
                 json.dump(runtime_data, f, indent=2)
 
+            # Peak memory per stage (--memory / --memory-budget)
+            save_memory(Profile.memory(), os.path.join(compare_dir, 'memory.json'))
+
             print(f"  Saved results.json and runtime.json to compare/{compare_id}/", file=sys.stderr)
 
+            emit("finish", success=True, compareId=compare_id, sequence=True,
+                 errors=errors, results=sequence_data)
+
             # Output results as JSON
             print(json.dumps({
                 "success": True,
@@ -452,8 +1482,14 @@ def main():
         results = []
         errors = []
 
+        emit("start", compareId=compare_id, mode="single", dataset=args.dataset,
+             masks=[args.mask], impute=args.impute,
+             models=[{"runId": run_id, "model": model_type} for run_id, model_type, _ in runtimes],
+             total=len(runtimes))
+
         for run_id, model_type, runtime in runtimes:
             output_dir = get_output_dir(run_id)
+            cell_start = time.time()
 
             # Get this model's ignore_columns from its runtime.json
             model_ignore_cols = runtime.get("datasetParams", {}).get("ignore_columns", [])
@@ -467,54 +1503,57 @@ def main():
                     impute=args.impute,
                     ignore_columns=model_ignore_cols
                 )
+            except MemoryBudgetError:
+                raise
             except Exception as e:
                 error_msg = f"{model_type} ({run_id}): failed to load dataset - {e}"
                 print(f"  {error_msg}", file=sys.stderr)
                 errors.append(error_msg)
+                emit_cell(model_type, args.mask, args.impute, RuntimeError(error_msg),
+                          time.time() - cell_start, run_id=run_id)
                 results.append({
                     "runId": run_id,
                     "model": model_type,
                     "columns": model_used_cols,
                     "trainAccuracy": None,
-                    "compareAccuracy": None
+                    "compareAccuracy": None,
+                    "confusion": None
                 })
                 continue
 
-            # Get original training accuracy from result.json (most reliable source)
-            train_accuracy = None
-            result_path = os.path.join(output_dir, 'result.json')
-            try:
-                if os.path.exists(result_path):
-                    with open(result_path) as f:
-                        result_data = json.load(f)
-                    train_accuracy = result_data.get('accuracy')
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"  Warning: Could not read result.json for {model_type}: {e}", file=sys.stderr)
-
-            # Fallback: try parsing from .id filename if result.json failed
+            # Get original training accuracy from the run registry
+            train_accuracy = (Model.get_run(run_id) or {}).get("accuracy")
             if train_accuracy is None:
-                try:
-                    for filename in os.listdir(output_dir):
-                        if filename.endswith('.id'):
-                            # Parse accuracy from filename: {model}_{dataset}_{score}[_{name}].id
-                            # Score is always the 3rd part (index 2)
-                            parts = filename.replace('.id', '').split('_')
-                            score_str = parts[2]  # Score is always index 2
-                            train_accuracy = int(score_str) / 1000000
-                            break  # Use first .id file found
-                except (FileNotFoundError, ValueError, IndexError, OSError) as e:
-                    errors.append(f"{model_type} ({run_id}): failed to read training accuracy - {e}")
+                errors.append(f"{model_type} ({run_id}): training accuracy not found in run registry")
 
             # Load and evaluate the model on the dataset
             model_path = os.path.join(output_dir, 'model.pkl')
+            score = StreamingScore()
+            summary = None
             try:
-                compare_accuracy, was_imputed = evaluate_model(model_path, X, y)
+                if args.seeds > 1:
+                    summary, was_imputed = evaluate_monte_carlo(
+                        model_path, args.dataset, args.mask / 100.0, args.impute, model_ignore_cols,
+                        [MASK_SEED + i for i in range(args.seeds)], mmap_mode=mmap_mode,
+                        batch_rows=args.batch_rows, score=score, compiled=args.compiled)
+                    compare_accuracy = summary["mean"]
+                else:
+                    compare_accuracy, was_imputed = evaluate_model(model_path, X, y, mmap_mode=mmap_mode,
+                                                                   batch_rows=args.batch_rows, score=score,
+                                                                   compiled=args.compiled)
+                emit_cell(model_type, args.mask, args.impute, (compare_accuracy, was_imputed),
+                          time.time() - cell_start, run_id=run_id)
+            except MemoryBudgetError:
+                raise
             except Exception as e:
                 error_msg = f"{model_type} ({run_id}): failed to evaluate model - {e}"
                 print(f"  {error_msg}", file=sys.stderr)
                 errors.append(error_msg)
+                emit_cell(model_type, args.mask, args.impute, RuntimeError(error_msg),
+                          time.time() - cell_start, run_id=run_id)
                 compare_accuracy = None
                 was_imputed = False
+                score = None
 
             results.append({
                 "runId": run_id,
@@ -522,18 +1561,24 @@ def main():
                 "columns": model_used_cols,
                 "trainAccuracy": train_accuracy,
                 "compareAccuracy": compare_accuracy,
-                "imputed": was_imputed
+                "imputed": was_imputed,
+                "confusion": score.confusion() if score else None
             })
+            if summary:
+                results[-1]["monteCarlo"] = summary
 
             if compare_accuracy is not None and train_accuracy is not None:
                 ratio = compare_accuracy / train_accuracy
                 impute_note = " (imputed)" if was_imputed else ""
-                print(f"  {model_type}: train={train_accuracy:.4f}, compare={compare_accuracy:.4f}, ratio={ratio:.4f}{impute_note}", file=sys.stderr)
+                print(f"  {model_type}: train={train_accuracy:.4f}, compare={compare_accuracy:.4f}, ratio={ratio:.4f}"
+                      f"{format_interval(summary)}{impute_note}", file=sys.stderr)
             else:
                 print(f"  {model_type}: error", file=sys.stderr)
 
         # Check if any model failed
         if errors:
+            emit("error", fatal=True, message="One or more models failed to evaluate",
+                 details="\n".join(errors))
             print(json.dumps({
                 "success": False,
                 "error": {
@@ -573,6 +1618,9 @@ def main():
         with open(os.path.join(compare_dir, 'results.json'), 'w') as f:
             json.dump(results_data, f, indent=2)
 
+        # Peak memory per stage (--memory / --memory-budget)
+        save_memory(Profile.memory(), os.path.join(compare_dir, 'memory.json'))
+
         # Save runtime.json with runtime parameters
         runtime_data = {
             "compare_id": compare_id,
@@ -583,6 +1631,8 @@ def main():
             "models": [{"runId": run_id, "model": model_type} for run_id, model_type, _ in runtimes]
         }
 
+        emit("finish", success=True, compareId=compare_id, sequence=False, models=results)
+
         # Output results as JSON (array format)
         print(json.dumps({
             "success": True,
@@ -593,6 +1643,19 @@ def main():
         return
 
     # Original comparison mode: run fresh training
+    configure_dataset(args.dataset, args.dataset_config)
+    names = [script.replace("train-", "").replace(".py", "") for script in SCRIPTS]
+    emit("start", mode="fresh", dataset=args.dataset, masks=MASK_VALUES, models=names,
+         total=len(names) * sum(2 if m > 0 else 1 for m in MASK_VALUES))
+
+    if args.jobs > 1:
+        results = run_sweep_parallel(args.dataset, args.jobs)
+        Render.compare_accuracy(MASK_VALUES, results, COLORS)
+        Render.compare_accuracy_impute(MASK_VALUES, results, COLORS)
+        save_memory(Profile.memory())
+        emit("finish", success=True, masks=MASK_VALUES, results=results)
+        return
+
     results = {}
 
     for script in SCRIPTS:
@@ -610,16 +1673,23 @@ def main():
             name = script.replace("train-", "").replace(".py", "")
 
             # Without impute
+            cell_start = time.time()
             acc = run_script(script, mask, impute=False,
                              use_output=not first_script and mask > 0,
-                             dataset=args.dataset)
+                             dataset=args.dataset, dataset_config=args.dataset_config)
             results[name].append(acc)
+            emit_cell(name, mask, False, (acc, False) if acc is not None else RuntimeError(f"{script} failed"),
+                      time.time() - cell_start)
 
             # With impute (only when mask > 0)
             if mask > 0:
+                cell_start = time.time()
                 acc_impute = run_script(script, mask, impute=True, use_output=True,
-                                        dataset=args.dataset)
+                                        dataset=args.dataset, dataset_config=args.dataset_config)
                 results[f"{name}_impute"].append(acc_impute)
+                emit_cell(name, mask, True,
+                          (acc_impute, True) if acc_impute is not None else RuntimeError(f"{script} failed"),
+                          time.time() - cell_start)
             else:
                 results[f"{name}_impute"].append(acc)  # Same as without impute for mask=0
 
@@ -628,6 +1698,8 @@ def main():
     # Generate comparison plots
     Render.compare_accuracy(MASK_VALUES, results, COLORS)
     Render.compare_accuracy_impute(MASK_VALUES, results, COLORS)
+    save_memory(Profile.memory())
+    emit("finish", success=True, masks=MASK_VALUES, results=results)
 
 
 if __name__ == "__main__":
@@ -3,5 +3,11 @@ import sys
 
 OUTPUT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'output'))
 
+# Parsed dataset cache (encoded columns as .npy, keyed by source file fingerprint)
+CACHE_DIR = os.environ.get(
+    'DATASET_CACHE_DIR',
+    os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'output', 'cache'))
+)
+
 # VERBOSE is False when --json is passed (disables logging)
 VERBOSE = '--json' not in sys.argv
@@ -1,3 +1,3 @@
-from .Config import OUTPUT_DIR, VERBOSE
+from .Config import CACHE_DIR, OUTPUT_DIR, VERBOSE
 
-__all__ = ['OUTPUT_DIR', 'VERBOSE']
+__all__ = ['CACHE_DIR', 'OUTPUT_DIR', 'VERBOSE']
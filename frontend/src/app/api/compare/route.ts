@@ -2,19 +2,25 @@ import { NextRequest, NextResponse } from "next/server";
 import { spawn } from "child_process";
 import path from "path";
 import fs from "fs/promises";
+import readline from "readline";
 import type { ErrorCode } from "@/types/api";
+import { runInWorker, WORKER_POOL_SIZE } from "@/lib/worker";
 
 const SCRIPTS_DIR =
   process.env.SCRIPTS_DIR || path.resolve(process.cwd(), "..");
 const SCRIPT_TIMEOUT = 600000; // 10 minutes for comparison
 const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
 
+// Worker processes compare.py uses for sequence cells (1 = evaluate serially)
+const COMPARE_JOBS = parseInt(process.env.COMPARE_JOBS ?? "1", 10);
+
 interface CompareRequest {
   dataset: string;
   models: string[];  // Array of run IDs
   mask?: number;
   impute?: boolean;
   sequence?: boolean;  // When true, runs full sequence comparison
+  stream?: boolean;    // When true, responds with NDJSON progress events
   // ignore_columns is not used - determined from model's runtime.json
 }
 
@@ -31,15 +37,17 @@ interface SequenceResult {
   models: Array<{ runId: string; model: string; accuracy: number; imputed?: boolean }>;
 }
 
+interface CompareData {
+  compareId: string;
+  images: string[];
+  models?: ModelResult[];  // Standard mode
+  sequence?: boolean;       // Sequence mode flag
+  results?: Record<string, SequenceResult>;  // Sequence mode results
+}
+
 interface CompareResponse {
   success: boolean;
-  data?: {
-    compareId: string;
-    images: string[];
-    models?: ModelResult[];  // Standard mode
-    sequence?: boolean;       // Sequence mode flag
-    results?: Record<string, SequenceResult>;  // Sequence mode results
-  };
+  data?: CompareData;
   error?: {
     message: string;
     code: ErrorCode;
@@ -73,7 +81,35 @@ interface ScriptResult {
   code: number;
 }
 
+async function executeInWorker(args: string[]): Promise<ScriptResult> {
+  let result;
+  try {
+    result = await runInWorker("compare.py", args, SCRIPT_TIMEOUT);
+  } catch (err) {
+    throw new CompareError(
+      `Failed to start Python worker: ${(err as Error).message}`,
+      "SCRIPT_NOT_FOUND",
+      (err as Error).message,
+    );
+  }
+
+  if (result.code !== 0) {
+    throw new CompareError(
+      `Compare script exited with code ${result.code}`,
+      "SCRIPT_EXECUTION_ERROR",
+      result.stderr || result.stdout,
+      extractStackTrace(result.stderr),
+    );
+  }
+
+  return result;
+}
+
 async function executeScript(args: string[]): Promise<ScriptResult> {
+  if (WORKER_POOL_SIZE > 0) {
+    return executeInWorker(args);
+  }
+
   return new Promise((resolve, reject) => {
     const scriptPath = path.join(SCRIPTS_DIR, "compare.py");
 
@@ -120,12 +156,136 @@ async function executeScript(args: string[]): Promise<ScriptResult> {
   });
 }
 
+// Build the response payload from compare.py output (final JSON or finish event)
+async function buildCompareData(compareOutput: {
+  compareId: string;
+  sequence?: boolean;
+  models?: ModelResult[];
+  results?: Record<string, SequenceResult>;
+}): Promise<CompareData> {
+  const compareId = compareOutput.compareId;
+
+  // Check for output images in compare directory
+  const images: string[] = [];
+  const compareDir = path.join(OUTPUT_DIR, "compare", compareId);
+
+  try {
+    const files = await fs.readdir(compareDir);
+    for (const file of files) {
+      if (file.endsWith(".png")) {
+        images.push(`/output/compare/${compareId}/${file}`);
+      }
+    }
+  } catch {
+    // Directory doesn't exist or no images, continue with empty array
+  }
+
+  // Build response based on mode
+  if (compareOutput.sequence === true) {
+    return { compareId, images, sequence: true, results: compareOutput.results };
+  }
+
+  // Standard mode
+  return { compareId, images, models: compareOutput.models };
+}
+
+// Run compare.py --stream directly (the worker pool buffers stdout) and forward
+// its NDJSON events as they arrive, followed by a final "result" event that
+// carries the same payload as the non-streaming response.
+function streamScript(args: string[]): Response {
+  const encoder = new TextEncoder();
+  let child: ReturnType<typeof spawn> | null = null;
+
+  const stream = new ReadableStream({
+    start(controller) {
+      let closed = false;
+      const send = (event: object) => {
+        if (!closed) controller.enqueue(encoder.encode(JSON.stringify(event) + "\n"));
+      };
+      const close = () => {
+        if (!closed) controller.close();
+        closed = true;
+      };
+
+      child = spawn(
+        "python",
+        ["-W", "ignore", path.join(SCRIPTS_DIR, "compare.py"), ...args, "--stream"],
+        { cwd: SCRIPTS_DIR, timeout: SCRIPT_TIMEOUT },
+      );
+
+      let stderr = "";
+      let finish: Parameters<typeof buildCompareData>[0] | null = null;
+      let failure: { message?: string; details?: string } | null = null;
+
+      readline
+        .createInterface({ input: child.stdout! })
+        .on("line", (line) => {
+          let event;
+          try {
+            event = JSON.parse(line);
+          } catch {
+            return;
+          }
+          if (event.event === "finish") finish = event;
+          if (event.event === "error" && event.fatal) failure = event;
+          send(event);
+        });
+
+      child.stderr!.on("data", (data) => {
+        stderr = (stderr + data.toString()).slice(-10000);
+      });
+
+      child.on("close", async (code) => {
+        if (code === 0 && finish) {
+          send({ event: "result", success: true, data: await buildCompareData(finish) });
+        } else {
+          send({
+            event: "result",
+            success: false,
+            error: {
+              message: failure?.message || `Compare script exited with code ${code}`,
+              code: "SCRIPT_EXECUTION_ERROR",
+              details: failure?.details || stderr,
+              stackTrace: extractStackTrace(stderr),
+            },
+          });
+        }
+        close();
+      });
+
+      child.on("error", (err) => {
+        send({
+          event: "result",
+          success: false,
+          error: {
+            message: `Failed to execute compare script: ${err.message}`,
+            code: "SCRIPT_NOT_FOUND",
+            details: err.message,
+          },
+        });
+        close();
+      });
+    },
+    cancel() {
+      // Client went away; stop the comparison
+      child?.kill();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "application/x-ndjson",
+      "Cache-Control": "no-cache",
+    },
+  });
+}
+
 export async function POST(
   request: NextRequest,
-): Promise<NextResponse<CompareResponse>> {
+): Promise<NextResponse<CompareResponse> | Response> {
   try {
     const body: CompareRequest = await request.json();
-    const { dataset, models: modelIds, mask, impute, sequence } = body;
+    const { dataset, models: modelIds, mask, impute, sequence, stream } = body;
 
     // Validate required fields
     if (!dataset || !modelIds || !Array.isArray(modelIds) || modelIds.length === 0) {
@@ -152,6 +312,9 @@ export async function POST(
     // Sequence mode: runs comparison across multiple mask rates
     if (sequence) {
       args.push("--sequence");
+      if (COMPARE_JOBS > 1) {
+        args.push("--jobs", String(COMPARE_JOBS));
+      }
     } else {
       // Standard mode: single mask rate
       // Add optional mask parameter
@@ -170,6 +333,10 @@ export async function POST(
     // Always generate images for frontend
     args.push("--images");
 
+    if (stream) {
+      return streamScript(args);
+    }
+
     const scriptResult = await executeScript(args);
 
     // Parse JSON output from compare.py
@@ -226,46 +393,9 @@ export async function POST(
       );
     }
 
-    const compareId = compareOutput.compareId;
-    const isSequence = compareOutput.sequence === true;
-
-    // Check for output images in compare directory
-    const images: string[] = [];
-    const compareDir = path.join(OUTPUT_DIR, "compare", compareId);
-
-    try {
-      const files = await fs.readdir(compareDir);
-      for (const file of files) {
-        if (file.endsWith(".png")) {
-          images.push(`/output/compare/${compareId}/${file}`);
-        }
-      }
-    } catch {
-      // Directory doesn't exist or no images, continue with empty array
-    }
-
-    // Build response based on mode
-    if (isSequence) {
-      return NextResponse.json({
-        success: true,
-        data: {
-          compareId,
-          images,
-          sequence: true,
-          results: compareOutput.results,
-        },
-      });
-    }
-
-    // Standard mode
-    const modelResults = compareOutput.models as ModelResult[];
     return NextResponse.json({
       success: true,
-      data: {
-        compareId,
-        images,
-        models: modelResults,
-      },
+      data: await buildCompareData(compareOutput),
     });
   } catch (error) {
     if (error instanceof CompareError) {
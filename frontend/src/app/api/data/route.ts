@@ -0,0 +1,47 @@
+import { NextRequest, NextResponse } from "next/server";
+import path from "path";
+import { readPage } from "@/lib/columnar";
+import type { DataPage } from "@/types/api";
+
+const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
+const MAX_LIMIT = 500;
+
+interface DataError {
+  error: string;
+}
+
+// GET /api/data?runId=&split=train|test&offset=0&limit=25&columns=a,b&sort=a&order=asc|desc
+export async function GET(
+  request: NextRequest,
+): Promise<NextResponse<DataPage | DataError>> {
+  const searchParams = request.nextUrl.searchParams;
+  const runId = searchParams.get("runId") ?? "";
+  const split = searchParams.get("split") ?? "train";
+
+  if (!/^\d{10}$/.test(runId)) {
+    return NextResponse.json({ error: "Invalid run ID format" }, { status: 400 });
+  }
+  if (split !== "train" && split !== "test") {
+    return NextResponse.json({ error: "Invalid split" }, { status: 400 });
+  }
+
+  const offset = parseInt(searchParams.get("offset") ?? "0", 10) || 0;
+  const limit = Math.min(
+    parseInt(searchParams.get("limit") ?? "25", 10) || 25,
+    MAX_LIMIT,
+  );
+  const columns = searchParams.get("columns")?.split(",").filter(Boolean);
+
+  try {
+    const page = await readPage(path.join(OUTPUT_DIR, runId, "data"), split, {
+      offset,
+      limit,
+      columns: columns && columns.length > 0 ? columns : undefined,
+      sort: searchParams.get("sort") ?? undefined,
+      descending: searchParams.get("order") === "desc",
+    });
+    return NextResponse.json(page);
+  } catch {
+    return NextResponse.json({ error: "Data not found" }, { status: 404 });
+  }
+}
@@ -1,8 +1,10 @@
 import { NextRequest, NextResponse } from "next/server";
 import fs from "fs";
 import path from "path";
+import { runPython } from "@/lib/python";
 
 const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
+const REGISTRY_TIMEOUT = 30000;
 
 interface DeleteResponse {
   success: boolean;
@@ -37,6 +39,15 @@ export async function DELETE(
     // Remove the entire run directory
     fs.rmSync(runDir, { recursive: true, force: true });
 
+    const result = await runPython(
+      "registry.py",
+      ["delete", "--run-id", runId],
+      REGISTRY_TIMEOUT,
+    );
+    if (result.code !== 0) {
+      console.error("Failed to update run registry:", result.stdout);
+    }
+
     return NextResponse.json({ success: true });
   } catch (error) {
     console.error("Failed to delete run:", error);
@@ -1,6 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
-import fs from "fs";
-import path from "path";
+import { lastJsonLine, runPython } from "@/lib/python";
 
 export interface HistoryRun {
   runId: string;
@@ -13,70 +12,63 @@ export interface HistoryRun {
 
 export interface HistoryResponse {
   runs: HistoryRun[];
+  total?: number;
+  error?: string;
 }
 
-const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
+const REGISTRY_TIMEOUT = 30000;
+const SORT_KEYS = ["timestamp", "accuracy", "model", "name"];
 
+// GET /api/history?model=&dataset=&minAccuracy=&sort=timestamp&order=desc&limit=&offset=
+// Runs come from the SQLite run registry (registry.py list on the helper pool)
+// instead of a directory scan, so filtering, sorting and paging happen in
+// indexed queries. Registry failures are reported as 500, not as an empty list
 export async function GET(
   request: NextRequest,
 ): Promise<NextResponse<HistoryResponse>> {
   const searchParams = request.nextUrl.searchParams;
-  const modelFilter = searchParams.get("model");
-  const datasetFilter = searchParams.get("dataset");
+  const args = ["list", "--json"];
 
-  const runs: HistoryRun[] = [];
+  const model = searchParams.get("model");
+  const dataset = searchParams.get("dataset");
+  if (model) args.push("--model", model);
+  if (dataset) args.push("--dataset", dataset);
 
-  try {
-    if (!fs.existsSync(OUTPUT_DIR)) {
-      return NextResponse.json({ runs: [] });
-    }
-
-    const dirs = fs.readdirSync(OUTPUT_DIR);
-
-    for (const dir of dirs) {
-      // Check if directory name is a 10-digit timestamp
-      if (!/^\d{10}$/.test(dir)) continue;
-
-      const runDir = path.join(OUTPUT_DIR, dir);
-      const stat = fs.statSync(runDir);
-      if (!stat.isDirectory()) continue;
-
-      // Look for .id files matching pattern: <model>_<dataset>_<score>.id
-      const files = fs.readdirSync(runDir);
-      for (const file of files) {
-        if (!file.endsWith(".id")) continue;
-
-        // Match pattern: <model>_<dataset>_<score>[_<name>].id
-        // Score is stored as accuracy * 1000000 (e.g., 0.98 -> 980000)
-        const match = file.match(/^([^_]+)_([^_]+)_(\d+)(?:_(.+))?\.id$/);
-        if (!match) continue;
+  const minAccuracy = parseFloat(searchParams.get("minAccuracy") ?? "");
+  if (!Number.isNaN(minAccuracy)) {
+    args.push("--min-accuracy", String(minAccuracy));
+  }
 
-        const [, model, dataset, scoreStr, rawName] = match;
-        // Convert -- back to / (was escaped for filesystem safety)
-        const name = rawName?.replace(/--/g, "/");
-        const accuracy = parseInt(scoreStr, 10) / 1000000;
-        const timestamp = parseInt(dir, 10);
+  const sort = searchParams.get("sort");
+  if (sort && SORT_KEYS.includes(sort)) args.push("--sort", sort);
+  if (searchParams.get("order") === "asc") args.push("--order", "asc");
 
-        // Apply filters if provided
-        if (modelFilter && model !== modelFilter) continue;
-        if (datasetFilter && dataset !== datasetFilter) continue;
+  const limit = parseInt(searchParams.get("limit") ?? "", 10);
+  if (limit > 0) args.push("--limit", String(limit));
+  const offset = parseInt(searchParams.get("offset") ?? "", 10);
+  if (offset > 0) args.push("--offset", String(offset));
 
-        runs.push({
-          runId: dir,
-          model,
-          dataset,
-          accuracy,
-          timestamp,
-          name,
-        });
-      }
+  try {
+    const result = await runPython("registry.py", args, REGISTRY_TIMEOUT);
+    if (result.code !== 0) {
+      console.error("Failed to list run registry:", result.stdout);
+      return NextResponse.json(
+        { runs: [], error: "Failed to read run history" },
+        { status: 500 },
+      );
     }
-
-    // Sort by timestamp descending (most recent first)
-    runs.sort((a, b) => b.timestamp - a.timestamp);
-
-    return NextResponse.json({ runs });
-  } catch {
-    return NextResponse.json({ runs: [] });
+    const output = lastJsonLine<{ total: number; runs: HistoryRun[] }>(
+      result.stdout,
+    );
+    const runs = output.runs.map(({ name, ...run }) =>
+      name ? { ...run, name } : run,
+    );
+    return NextResponse.json({ runs, total: output.total });
+  } catch (error) {
+    console.error("Failed to list run registry:", error);
+    return NextResponse.json(
+      { runs: [], error: "Failed to read run history" },
+      { status: 500 },
+    );
   }
 }
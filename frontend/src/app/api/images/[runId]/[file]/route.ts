@@ -0,0 +1,99 @@
+import { NextRequest, NextResponse } from "next/server";
+import fs from "fs";
+import path from "path";
+import { lastJsonLine, runPython } from "@/lib/python";
+
+const SCRIPT_TIMEOUT = 300000; // 5 minutes
+const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
+
+interface RenderOutput {
+  success: boolean;
+  files?: string[];
+  error?: { message: string };
+}
+
+interface RenderManifest {
+  renders: Array<{ status: string; files: string[] }>;
+}
+
+// One render.py call per run at a time; concurrent gallery requests share it
+const globalForRenders = globalThis as unknown as {
+  lazyRenders?: Map<string, Promise<RenderOutput>>;
+};
+const lazyRenders = (globalForRenders.lazyRenders ??= new Map());
+
+// Every lazily recorded file of a run that has not been drawn yet
+function pendingFiles(runDir: string): string[] {
+  try {
+    const manifest: RenderManifest = JSON.parse(
+      fs.readFileSync(path.join(runDir, "renders.json"), "utf-8"),
+    );
+    return manifest.renders
+      .filter((render) => render.status === "lazy")
+      .flatMap((render) => render.files)
+      .filter((file) => !fs.existsSync(path.join(runDir, file)));
+  } catch {
+    return [];
+  }
+}
+
+// Draw all of a run's pending lazy images in a single render.py job
+function renderRun(runId: string, file: string): Promise<RenderOutput> {
+  const running = lazyRenders.get(runId);
+  if (running) return running;
+
+  const files = pendingFiles(path.join(OUTPUT_DIR, runId));
+  if (!files.includes(file)) files.push(file);
+
+  const render = runPython(
+    "render.py",
+    ["--json", "--run-id", runId, ...files.flatMap((f) => ["--file", f])],
+    SCRIPT_TIMEOUT,
+  )
+    .then((result) => lastJsonLine<RenderOutput>(result.stdout))
+    .finally(() => lazyRenders.delete(runId));
+  lazyRenders.set(runId, render);
+  return render;
+}
+
+// GET /api/images/<runId>/<file>: draw a lazily recorded image on first request
+// (render.py, content-addressed cache), then redirect to the static file. The
+// first request renders every pending image of the run in one batch
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ runId: string; file: string }> },
+): Promise<NextResponse> {
+  const { runId, file } = await params;
+
+  if (!/^\d{10}$/.test(runId) || !/^[\w.-]+\.png$/.test(file)) {
+    return NextResponse.json({ error: "Invalid image path" }, { status: 400 });
+  }
+
+  const staticUrl = new URL(`/output/${runId}/${file}`, request.url);
+  const filePath = path.join(OUTPUT_DIR, runId, file);
+  if (fs.existsSync(filePath)) {
+    return NextResponse.redirect(staticUrl);
+  }
+
+  try {
+    // A batch started by another image may not include this one (or may
+    // have failed on a different file); it then gets its own render
+    let output = await renderRun(runId, file);
+    if (!fs.existsSync(filePath)) {
+      output = await renderRun(runId, file);
+    }
+    if (!fs.existsSync(filePath)) {
+      return NextResponse.json(
+        { error: output.error?.message ?? "Render failed" },
+        { status: 404 },
+      );
+    }
+  } catch (err) {
+    return NextResponse.json(
+      { error: `Render failed: ${(err as Error).message}` },
+      { status: 500 },
+    );
+  }
+
+  return NextResponse.redirect(staticUrl);
+}
@@ -4,6 +4,20 @@ import path from "path";
 
 export interface ImagesResponse {
   images: string[];
+  pending?: number;  // Background renders still running (see renders.json)
+}
+
+interface RenderManifest {
+  status: "rendering" | "done";
+  renders: Array<{ status: "pending" | "lazy" | "done" | "error"; files: string[] }>;
+}
+
+function readManifest(targetDir: string): RenderManifest | null {
+  try {
+    return JSON.parse(fs.readFileSync(path.join(targetDir, "renders.json"), "utf-8"));
+  } catch {
+    return null;
+  }
 }
 
 const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
@@ -39,7 +53,19 @@ export async function GET(
       .filter((file) => file.endsWith(".png"))
       .map((file) => `${urlPrefix}/${file}`);
 
-    return NextResponse.json({ images });
+    // Lazy renders (--lazy-images) are drawn when their URL is first requested
+    const manifest = readManifest(targetDir);
+    const renders = manifest?.renders ?? [];
+    if (runId) {
+      for (const render of renders.filter((r) => r.status === "lazy")) {
+        for (const file of render.files.filter((f) => !files.includes(f))) {
+          images.push(`/api/images/${runId}/${file}`);
+        }
+      }
+    }
+    const pending = renders.filter((r) => r.status === "pending").length;
+
+    return NextResponse.json({ images, pending });
   } catch {
     return NextResponse.json({ images: [] });
   }
@@ -1,10 +1,12 @@
 import { NextRequest, NextResponse } from "next/server";
 import fs from "fs";
 import path from "path";
+import { runPython } from "@/lib/python";
 
 const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
 const NAME_PATTERN = /^[a-zA-Z0-9_./,-]*$/;
 const MAX_LENGTH = 50;
+const REGISTRY_TIMEOUT = 30000;
 
 interface RenameRequest {
   runId: string;
@@ -76,6 +78,17 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       fs.renameSync(oldPath, newPath);
     }
 
+    // Keep the run registry in sync (the .id file stays the source of truth;
+    // `registry.py rebuild` re-indexes it if this update fails)
+    const result = await runPython(
+      "registry.py",
+      ["rename", "--run-id", runId, "--name", name],
+      REGISTRY_TIMEOUT,
+    );
+    if (result.code !== 0) {
+      console.error("Failed to update run registry:", result.stdout);
+    }
+
     return NextResponse.json({ success: true, name });
   } catch {
     return NextResponse.json(
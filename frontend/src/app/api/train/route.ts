@@ -8,14 +8,24 @@ import type {
   TrainResult,
   ErrorCode,
   ModelInfo,
+  StageTimings,
 } from "@/types/api";
 import { MODELS } from "@/types/model";
+import { runInWorker, WORKER_POOL_SIZE } from "@/lib/worker";
 
 const SCRIPTS_DIR =
   process.env.SCRIPTS_DIR || path.resolve(process.cwd(), "..");
 const SCRIPT_TIMEOUT = 300000; // 5 minutes
 const OUTPUT_DIR = path.join(process.cwd(), "public", "output");
 
+// How --images renders are produced: "background" (detached pool after
+// training), "lazy" (on first request, see api/images/[runId]/[file]) or
+// "inline" (before responding)
+const RENDER_MODE = process.env.RENDER_MODE ?? "background";
+
+// Background render pool size for RENDER_MODE=background
+const RENDER_WORKERS = parseInt(process.env.RENDER_WORKERS ?? "2", 10);
+
 class ScriptError extends Error {
   constructor(
     message: string,
@@ -58,8 +68,14 @@ function buildArgs(request: TrainRequest, runId: string): string[] {
     args.push("--impute");
   }
 
-  // Always generate images
+  // Always generate images; lazy and background renders let the result return
+  // right after training (status in the run's renders.json)
   args.push("--images");
+  if (RENDER_MODE === "lazy") {
+    args.push("--lazy-images");
+  } else if (RENDER_MODE === "background") {
+    args.push("--render-workers", String(RENDER_WORKERS));
+  }
 
   if (datasetParams.ignore_columns && datasetParams.ignore_columns.length > 0) {
     args.push("--dataset-ignore-columns", datasetParams.ignore_columns.join(","));
@@ -77,6 +93,10 @@ async function executeScript(
   script: string,
   args: string[],
 ): Promise<ScriptResult> {
+  if (WORKER_POOL_SIZE > 0) {
+    return executeInWorker(script, args);
+  }
+
   return new Promise((resolve, reject) => {
     const scriptPath = path.join(SCRIPTS_DIR, script);
 
@@ -100,14 +120,7 @@ async function executeScript(
       if (code === 0) {
         resolve({ stdout, stderr, code });
       } else {
-        reject(
-          new ScriptError(
-            `Script exited with code ${code}`,
-            "SCRIPT_EXECUTION_ERROR",
-            stderr || stdout,
-            extractStackTrace(stderr),
-          ),
-        );
+        reject(executionError(code, stdout, stderr));
       }
     });
 
@@ -123,6 +136,45 @@ async function executeScript(
   });
 }
 
+async function executeInWorker(
+  script: string,
+  args: string[],
+): Promise<ScriptResult> {
+  let result;
+  try {
+    result = await runInWorker(script, args, SCRIPT_TIMEOUT);
+  } catch (err) {
+    throw new ScriptError(
+      `Failed to start Python worker: ${(err as Error).message}`,
+      "SCRIPT_NOT_FOUND",
+      (err as Error).message,
+    );
+  }
+
+  if (result.code !== 0) {
+    throw executionError(result.code, result.stdout, result.stderr);
+  }
+
+  return result;
+}
+
+// A run over its --memory-budget / MEMORY_BUDGET_MB fails with MemoryBudgetError
+const MEMORY_BUDGET_ERROR = /MemoryBudgetError: (.+)/;
+
+function executionError(
+  code: number | null,
+  stdout: string,
+  stderr: string,
+): ScriptError {
+  const memory = stderr.match(MEMORY_BUDGET_ERROR);
+  return new ScriptError(
+    memory ? memory[1] : `Script exited with code ${code}`,
+    memory ? "MEMORY_BUDGET_EXCEEDED" : "SCRIPT_EXECUTION_ERROR",
+    stderr || stdout,
+    extractStackTrace(stderr),
+  );
+}
+
 function extractStackTrace(stderr: string): string | undefined {
   const lines = stderr.split("\n");
   const traceStart = lines.findIndex((line) => line.includes("Traceback"));
@@ -130,18 +182,22 @@ function extractStackTrace(stderr: string): string | undefined {
   return lines.slice(traceStart).join("\n");
 }
 
+// Also returns the final stage timings the script wrote into result.json on
+// exit; the --json output was printed before the render stages finished
 async function updateResultWithExecutionTime(
   runId: string,
   executionTime: number,
-): Promise<void> {
+): Promise<StageTimings | undefined> {
   const resultPath = path.join(OUTPUT_DIR, runId, "result.json");
   try {
     const content = await fs.readFile(resultPath, "utf-8");
     const result = JSON.parse(content);
     result.execution_time = executionTime;
     await fs.writeFile(resultPath, JSON.stringify(result, null, 2));
+    return result.timings;
   } catch {
     // Ignore errors - result.json may not exist yet
+    return undefined;
   }
 }
 
@@ -187,6 +243,16 @@ interface PythonOutput {
   train_labels?: string[];
   test_labels?: string[];
   feature_names?: string[];
+  data?: {
+    path: string;
+    format: string;
+    train_rows: number;
+    test_rows: number;
+  };
+  timings?: {
+    total: number;
+    stages: Record<string, number>;
+  };
 }
 
 function parseJsonOutput(stdout: string): TrainResult | null {
@@ -295,6 +361,17 @@ function parseJsonOutput(stdout: string): TrainResult | null {
       result.featureNames = jsonOutput.feature_names;
     }
 
+    if (jsonOutput.data) {
+      result.dataRows = {
+        train: jsonOutput.data.train_rows,
+        test: jsonOutput.data.test_rows,
+      };
+    }
+
+    if (jsonOutput.timings) {
+      result.timings = jsonOutput.timings;
+    }
+
     return result;
   } catch {
     return null;
@@ -350,7 +427,10 @@ export async function POST(
     const executionTime = Date.now() - startTime;
 
     // Save execution time to result.json
-    await updateResultWithExecutionTime(runId, executionTime);
+    const timings = await updateResultWithExecutionTime(runId, executionTime);
+    if (timings) {
+      jsonOutput.timings = timings;
+    }
 
     return NextResponse.json({
       success: true,
@@ -108,6 +108,7 @@ function HomeContent() {
     isComparing,
     compareResult,
     compareError,
+    compareProgress,
     runCompare,
     clearCompareResult,
     canCompare,
@@ -285,6 +286,17 @@ function HomeContent() {
             trainResult.featureNames = resultData.feature_names;
           }
 
+          if (resultData.timings) {
+            trainResult.timings = resultData.timings;
+          }
+
+          if (resultData.data) {
+            trainResult.dataRows = {
+              train: resultData.data.train_rows,
+              test: resultData.data.test_rows,
+            };
+          }
+
           // Mark as successfully loaded and navigated
           loadedRunId.current = targetRunId;
           hasNavigatedForResult.current = targetRunId;
@@ -954,8 +966,29 @@ function HomeContent() {
               <Card>
                 <div className="flex items-center justify-center gap-3 py-12 text-gray-500">
                   <Spinner className="h-5 w-5" />
-                  <p>Loading...</p>
+                  <p>
+                    {compareProgress && compareProgress.total > 0
+                      ? `Evaluated ${compareProgress.done} of ${compareProgress.total} cells...`
+                      : "Loading..."}
+                  </p>
                 </div>
+                {compareProgress && compareProgress.cells.length > 0 && (
+                  <ul className="max-h-64 overflow-y-auto border-t border-gray-100 px-4 py-2 text-sm text-gray-600">
+                    {compareProgress.cells.map((cell, i) => (
+                      <li key={i} className="flex justify-between py-0.5">
+                        <span>
+                          {cell.name || cell.runId || cell.model} ({cell.model}) mask={cell.mask}%
+                          {cell.impute ? " imputed" : ""}
+                        </span>
+                        {cell.error ? (
+                          <span className="text-red-600" title={cell.error}>error</span>
+                        ) : (
+                          <span className="font-mono">{cell.accuracy?.toFixed(4)}</span>
+                        )}
+                      </li>
+                    ))}
+                  </ul>
+                )}
               </Card>
             )}
 
@@ -2,6 +2,9 @@
 
 import { useState, useEffect, useRef } from 'react';
 
+// How often to re-list images while background renders are pending (ms)
+const RENDER_POLL_INTERVAL = 2000;
+
 function Spinner() {
   return (
     <svg
@@ -220,10 +223,14 @@ export function ImageGallery({ runId, compareId }: ImageGalleryProps) {
   const [images, setImages] = useState<string[]>([]);
   const [selectedImage, setSelectedImage] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [pending, setPending] = useState(0);
 
   useEffect(() => {
-    async function fetchImages() {
-      setIsLoading(true);
+    let pollTimer: ReturnType<typeof setTimeout> | null = null;
+    let cancelled = false;
+
+    async function fetchImages(initial = true) {
+      if (initial) setIsLoading(true);
       try {
         let url: string;
         if (compareId) {
@@ -237,14 +244,25 @@ export function ImageGallery({ runId, compareId }: ImageGalleryProps) {
         }
         const res = await fetch(url);
         const data = await res.json();
+        if (cancelled) return;
         setImages(data.images || []);
+        setPending(data.pending || 0);
+        // Poll while background renders are still being written
+        if (data.pending > 0) {
+          pollTimer = setTimeout(() => fetchImages(false), RENDER_POLL_INTERVAL);
+        }
       } catch {
-        setImages([]);
+        if (!cancelled) setImages([]);
       } finally {
-        setIsLoading(false);
+        if (!cancelled) setIsLoading(false);
       }
     }
     fetchImages();
+
+    return () => {
+      cancelled = true;
+      if (pollTimer) clearTimeout(pollTimer);
+    };
   }, [runId, compareId]);
 
   if (isLoading) {
@@ -255,13 +273,20 @@ export function ImageGallery({ runId, compareId }: ImageGalleryProps) {
     );
   }
 
-  if (images.length === 0) {
+  if (images.length === 0 && pending === 0) {
     return null;
   }
 
   return (
     <div>
-      <h4 className="text-sm font-medium text-gray-700 mb-3">Visuals</h4>
+      <h4 className="flex items-center gap-2 text-sm font-medium text-gray-700 mb-3">
+        Visuals
+        {pending > 0 && (
+          <span className="flex items-center gap-1 font-normal text-gray-500">
+            <Spinner /> rendering {pending} more...
+          </span>
+        )}
+      </h4>
       <div className="grid grid-cols-2 sm:grid-cols-3 lg:grid-cols-4 gap-3">
         {images.map((src) => (
           <button
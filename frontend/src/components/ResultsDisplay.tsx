@@ -3,7 +3,7 @@
 import { useState, useMemo, useEffect } from 'react';
 import { Card, CardHeader, CardTitle, Badge, Tabs, Modal } from './ui';
 import { ImageGallery } from './ImageGallery';
-import type { TrainResult } from '@/types/api';
+import type { DataPage, StageTimings, TrainResult } from '@/types/api';
 
 interface ResultsDisplayProps {
   result: TrainResult;
@@ -35,6 +35,27 @@ function Spinner() {
   );
 }
 
+const TIMING_STAGES = 2;
+
+function formatSeconds(seconds: number) {
+  return seconds < 1 ? `${(seconds * 1000).toFixed(0)}ms` : `${seconds.toFixed(2)}s`;
+}
+
+// Total run time and its slowest stages; the tooltip lists every stage
+function TimingSummary({ timings }: { timings: StageTimings }) {
+  const stages = Object.entries(timings.stages);
+  const slowest = [...stages].sort((a, b) => b[1] - a[1]).slice(0, TIMING_STAGES);
+  const title = stages.map(([name, seconds]) => `${name}: ${formatSeconds(seconds)}`).join('\n');
+
+  return (
+    <span className="text-xs text-gray-500" title={title}>
+      {formatSeconds(timings.total)}
+      {slowest.length > 0 &&
+        ` (${slowest.map(([name, seconds]) => `${name} ${formatSeconds(seconds)}`).join(', ')})`}
+    </span>
+  );
+}
+
 interface FeatureImportanceBarProps {
   name: string;
   value: number;
@@ -69,24 +90,69 @@ interface SortableColumn {
   direction: 'asc' | 'desc';
 }
 
+// Rows served page by page from the run's columnar sidecar
+interface DatasetSource {
+  runId: string;
+  split: 'train' | 'test';
+  total: number;
+}
+
+function useDataPage(
+  source: DatasetSource | undefined,
+  page: number,
+  pageSize: number,
+  sort: SortableColumn | null
+): DataPage | null {
+  const [dataPage, setDataPage] = useState<DataPage | null>(null);
+  const runId = source?.runId;
+  const split = source?.split;
+
+  useEffect(() => {
+    if (!runId || !split) return;
+    const controller = new AbortController();
+    const params = new URLSearchParams({
+      runId,
+      split,
+      offset: String(page * pageSize),
+      limit: String(pageSize),
+    });
+    if (sort) {
+      params.set('sort', sort.key);
+      params.set('order', sort.direction);
+    }
+
+    fetch(`/api/data?${params}`, { signal: controller.signal })
+      .then((res) => (res.ok ? res.json() : null))
+      .then((json: DataPage | null) => setDataPage(json))
+      .catch(() => {});
+
+    return () => controller.abort();
+  }, [runId, split, page, pageSize, sort]);
+
+  return dataPage;
+}
+
 interface DatasetTableProps {
-  data: Record<string, unknown>[];
+  data?: Record<string, unknown>[];
   labels?: string[];
   featureNames?: string[];
+  source?: DatasetSource;
   pageSize?: number;
 }
 
-function DatasetTable({ data, labels, featureNames, pageSize = 10 }: DatasetTableProps) {
+function DatasetTable({ data, labels, featureNames, source, pageSize = 10 }: DatasetTableProps) {
   const [sort, setSort] = useState<SortableColumn | null>(null);
   const [page, setPage] = useState(0);
+  const dataPage = useDataPage(source, page, pageSize, sort);
 
   const columns = useMemo(() => {
     if (featureNames && featureNames.length > 0) return featureNames;
-    if (data.length > 0) return Object.keys(data[0]);
-    return [];
-  }, [data, featureNames]);
+    if (data && data.length > 0) return Object.keys(data[0]);
+    return dataPage?.columns ?? [];
+  }, [data, featureNames, dataPage]);
 
   const sortedData = useMemo(() => {
+    if (!data) return [];
     if (!sort) return data;
     return [...data].sort((a, b) => {
       const aVal = a[sort.key];
@@ -99,8 +165,14 @@ function DatasetTable({ data, labels, featureNames, pageSize = 10 }: DatasetTabl
     });
   }, [data, sort]);
 
-  const pagedData = sortedData.slice(page * pageSize, (page + 1) * pageSize);
-  const totalPages = Math.ceil(data.length / pageSize);
+  const totalRows = source ? source.total : sortedData.length;
+  const pagedData: Record<string, unknown>[] = source
+    ? dataPage?.rows ?? []
+    : sortedData.slice(page * pageSize, (page + 1) * pageSize);
+  const pagedLabels = source
+    ? dataPage?.labels
+    : labels?.slice(page * pageSize, (page + 1) * pageSize);
+  const totalPages = Math.ceil(totalRows / pageSize);
 
   const handleSort = (key: string) => {
     setSort((prev) => {
@@ -133,7 +205,7 @@ function DatasetTable({ data, labels, featureNames, pageSize = 10 }: DatasetTabl
                   </span>
                 </th>
               ))}
-              {labels && (
+              {(labels || source) && (
                 <th className="text-left py-2 px-3 font-medium text-gray-600">
                   Label
                 </th>
@@ -148,9 +220,9 @@ function DatasetTable({ data, labels, featureNames, pageSize = 10 }: DatasetTabl
                     {formatCellValue(row[col])}
                   </td>
                 ))}
-                {labels && (
+                {(labels || source) && (
                   <td className="py-2 px-3 text-gray-700 whitespace-nowrap">
-                    {labels[page * pageSize + i]}
+                    {pagedLabels?.[i]}
                   </td>
                 )}
               </tr>
@@ -161,7 +233,7 @@ function DatasetTable({ data, labels, featureNames, pageSize = 10 }: DatasetTabl
 
       <div className="flex items-center justify-between mt-4 text-sm text-gray-600">
         <span>
-          Showing {page * pageSize + 1}-{Math.min((page + 1) * pageSize, data.length)} of {data.length} rows
+          Showing {page * pageSize + 1}-{Math.min((page + 1) * pageSize, totalRows)} of {totalRows} rows
         </span>
         {totalPages > 1 && (
           <div className="flex gap-2">
@@ -225,7 +297,17 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
       .sort((a, b) => b.value - a.value);
   }, [featureImportance]);
 
-  const hasDataset = result.trainData || result.testData;
+  const hasDataset = Boolean(result.trainData || result.testData || (result.dataRows && runId));
+  const trainRows = result.trainData?.length ?? result.dataRows?.train ?? 0;
+  const testRows = result.testData?.length ?? result.dataRows?.test ?? 0;
+  const trainSource: DatasetSource | undefined =
+    !result.trainData && result.dataRows && runId
+      ? { runId, split: 'train', total: result.dataRows.train }
+      : undefined;
+  const testSource: DatasetSource | undefined =
+    !result.testData && result.dataRows && runId
+      ? { runId, split: 'test', total: result.dataRows.test }
+      : undefined;
 
   return (
     <Card variant="elevated">
@@ -233,6 +315,7 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
         <CardTitle>Results</CardTitle>
         <div className="flex items-center gap-2">
           {isLoading && <Spinner />}
+          {result.timings && <TimingSummary timings={result.timings} />}
           <Badge variant={accuracy >= 0.9 ? 'success' : accuracy >= 0.7 ? 'warning' : 'error'}>
             {(accuracy * 100).toFixed(2)}%
           </Badge>
@@ -362,7 +445,7 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
                           : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
                       }`}
                     >
-                      Train ({result.trainData?.length ?? 0} rows)
+                      Train ({trainRows} rows)
                     </button>
                     <button
                       onClick={() => setDatasetView('test')}
@@ -372,7 +455,7 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
                           : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
                       }`}
                     >
-                      Test ({result.testData?.length ?? 0} rows)
+                      Test ({testRows} rows)
                     </button>
                   </div>
                   <button
@@ -385,18 +468,20 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
                 </div>
 
                 <div className="overflow-x-auto">
-                  {datasetView === 'train' && result.trainData && (
+                  {datasetView === 'train' && (result.trainData || trainSource) && (
                     <DatasetTable
                       data={result.trainData}
                       labels={result.trainLabels}
                       featureNames={result.featureNames}
+                      source={trainSource}
                     />
                   )}
-                  {datasetView === 'test' && result.testData && (
+                  {datasetView === 'test' && (result.testData || testSource) && (
                     <DatasetTable
                       data={result.testData}
                       labels={result.testLabels}
                       featureNames={result.featureNames}
+                      source={testSource}
                     />
                   )}
                 </div>
@@ -416,7 +501,7 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
                             : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
                         }`}
                       >
-                        Train ({result.trainData?.length ?? 0} rows)
+                        Train ({trainRows} rows)
                       </button>
                       <button
                         onClick={() => setDatasetView('test')}
@@ -426,24 +511,26 @@ export function ResultsDisplay({ result, isLoading }: ResultsDisplayProps) {
                             : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
                         }`}
                       >
-                        Test ({result.testData?.length ?? 0} rows)
+                        Test ({testRows} rows)
                       </button>
                     </div>
 
                     <div className="overflow-x-auto">
-                      {datasetView === 'train' && result.trainData && (
+                      {datasetView === 'train' && (result.trainData || trainSource) && (
                         <DatasetTable
                           data={result.trainData}
                           labels={result.trainLabels}
                           featureNames={result.featureNames}
+                          source={trainSource}
                           pageSize={25}
                         />
                       )}
-                      {datasetView === 'test' && result.testData && (
+                      {datasetView === 'test' && (result.testData || testSource) && (
                         <DatasetTable
                           data={result.testData}
                           labels={result.testLabels}
                           featureNames={result.featureNames}
+                          source={testSource}
                           pageSize={25}
                         />
                       )}
@@ -51,17 +51,23 @@ export function TrainHistoryModal({
 }: TrainHistoryModalProps) {
   const [history, setHistory] = useState<HistoryRun[]>([]);
   const [isLoading, setIsLoading] = useState(false);
+  const [loadError, setLoadError] = useState<string | null>(null);
   const [deleteConfirmId, setDeleteConfirmId] = useState<string | null>(null);
   const [deletingId, setDeletingId] = useState<string | null>(null);
 
   const fetchHistory = useCallback(async () => {
     setIsLoading(true);
+    setLoadError(null);
     try {
       const res = await fetch(`/api/history?model=${model}&dataset=${dataset}`);
       const data = await res.json();
+      if (!res.ok) {
+        throw new Error(data.error || "Failed to load history");
+      }
       setHistory(data.runs || []);
-    } catch {
+    } catch (error) {
       setHistory([]);
+      setLoadError(error instanceof Error ? error.message : "Failed to load history");
     } finally {
       setIsLoading(false);
     }
@@ -132,6 +138,10 @@ export function TrainHistoryModal({
         <div className="flex justify-center py-8">
           <Spinner className="h-6 w-6" />
         </div>
+      ) : loadError ? (
+        <div className="text-center py-8 text-red-600">
+          {loadError}
+        </div>
       ) : history.length === 0 ? (
         <div className="text-center py-8 text-gray-500">
           No history found
@@ -44,6 +44,24 @@ export interface CompareResult {
   results?: Record<string, { models: Array<{ runId: string; model: string; name?: string; accuracy: number; imputed?: boolean }> }>;
 }
 
+// One finished (model, mask, impute) cell from the NDJSON progress stream
+export interface CompareProgressCell {
+  runId: string | null;
+  model: string;
+  name?: string | null;
+  mask: number;
+  impute: boolean;
+  accuracy?: number;
+  error?: string;
+  seconds?: number;
+}
+
+export interface CompareProgress {
+  done: number;
+  total: number;
+  cells: CompareProgressCell[];
+}
+
 export interface CompareHistoryModelInfo {
   runId: string;
   model: string;
@@ -78,6 +96,7 @@ interface UseCompareReturn {
   isComparing: boolean;
   compareResult: CompareResult | null;
   compareError: TrainError | null;
+  compareProgress: CompareProgress | null;
   runCompare: () => Promise<void>;
   clearCompareResult: () => void;
   canCompare: boolean;
@@ -171,6 +190,58 @@ function getDuplicateRunIds(models: CompareModelEntry[]): Set<string> {
   return duplicates;
 }
 
+// Read compare.py NDJSON events, reporting progress until the final "result" event
+async function readCompareStream(
+  response: Response,
+  onProgress: (progress: CompareProgress) => void,
+): Promise<{ success: boolean; data?: CompareResult; error?: TrainError }> {
+  const reader = response.body!.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let progress: CompareProgress = { done: 0, total: 0, cells: [] };
+  let result: { success: boolean; data?: CompareResult; error?: TrainError } | null = null;
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+    const lines = buffer.split('\n');
+    buffer = done ? '' : lines.pop() ?? '';
+
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line);
+      if (event.event === 'start') {
+        progress = { done: 0, total: event.total, cells: [] };
+      } else if (event.event === 'cell' || (event.event === 'error' && !event.fatal)) {
+        const cell: CompareProgressCell = {
+          runId: event.runId,
+          model: event.model,
+          name: event.name,
+          mask: event.mask,
+          impute: event.impute,
+          accuracy: event.accuracy,
+          error: event.event === 'error' ? event.message : undefined,
+          seconds: event.seconds,
+        };
+        progress = { ...progress, done: progress.done + 1, cells: [...progress.cells, cell] };
+      } else if (event.event === 'result') {
+        result = event;
+        continue;
+      } else {
+        continue;
+      }
+      onProgress(progress);
+    }
+
+    if (done) break;
+  }
+
+  return result ?? {
+    success: false,
+    error: { message: 'Compare stream ended without a result', code: 'UNKNOWN_ERROR' },
+  };
+}
+
 export function useCompare(options: UseCompareOptions): UseCompareReturn {
   const { dataset, isCompareMode } = options;
 
@@ -179,6 +250,7 @@ export function useCompare(options: UseCompareOptions): UseCompareReturn {
   const [isComparing, setIsComparing] = useState(false);
   const [compareResult, setCompareResult] = useState<CompareResult | null>(null);
   const [compareError, setCompareError] = useState<TrainError | null>(null);
+  const [compareProgress, setCompareProgress] = useState<CompareProgress | null>(null);
 
   const [history, setHistory] = useState<HistoryRun[]>([]);
   const [isLoadingHistory, setIsLoadingHistory] = useState(false);
@@ -267,6 +339,7 @@ export function useCompare(options: UseCompareOptions): UseCompareReturn {
 
     setIsComparing(true);
     setCompareError(null);
+    setCompareProgress(null);
 
     try {
       const modelIds = models
@@ -274,11 +347,13 @@ export function useCompare(options: UseCompareOptions): UseCompareReturn {
         .map((m) => m.runId as string);
 
       // Build request body based on sequence mode
+      // Sequence comparisons stream per-cell progress as NDJSON
       const requestBody = datasetParams.sequence
         ? {
             dataset,
             models: modelIds,
             sequence: true,
+            stream: true,
           }
         : {
             dataset,
@@ -294,7 +369,9 @@ export function useCompare(options: UseCompareOptions): UseCompareReturn {
         body: JSON.stringify(requestBody),
       });
 
-      const data = await response.json();
+      const data = response.headers.get('Content-Type')?.includes('application/x-ndjson')
+        ? await readCompareStream(response, setCompareProgress)
+        : await response.json();
 
       if (!response.ok || !data.success) {
         setCompareError(data.error || {
@@ -314,6 +391,7 @@ export function useCompare(options: UseCompareOptions): UseCompareReturn {
       setCompareResult(null);
     } finally {
       setIsComparing(false);
+      setCompareProgress(null);
     }
   }, [dataset, models, datasetParams, canCompare]);
 
@@ -449,6 +527,7 @@ export function useCompare(options: UseCompareOptions): UseCompareReturn {
     isComparing,
     compareResult,
     compareError,
+    compareProgress,
     runCompare,
     clearCompareResult,
     canCompare,
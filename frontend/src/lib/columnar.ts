@@ -0,0 +1,152 @@
+import fs from "fs/promises";
+import path from "path";
+import type { DataPage } from "@/types/api";
+
+// Reader for the per-run columnar sidecar written by lib/model/data.py
+// (frontend/public/output/<runId>/data/: one .npy file per column + meta.json)
+
+export interface DataMeta {
+  format: "npy";
+  feature_names: string[];
+  label_classes: string[];
+  splits: Record<string, { rows: number }>;
+}
+
+export interface PageOptions {
+  offset: number;
+  limit: number;
+  columns?: string[];
+  sort?: string;
+  descending?: boolean;
+}
+
+interface NpyHeader {
+  dtype: "<f8" | "<i4";
+  length: number;
+  dataOffset: number;
+}
+
+const ITEM_SIZE = { "<f8": 8, "<i4": 4 } as const;
+
+async function readHeader(file: fs.FileHandle): Promise<NpyHeader> {
+  const prefix = Buffer.alloc(12);
+  await file.read(prefix, 0, 12, 0);
+  if (prefix.toString("latin1", 1, 6) !== "NUMPY") {
+    throw new Error("Not a .npy file");
+  }
+
+  // Version 1.x stores the header length as uint16, 2.x/3.x as uint32
+  const major = prefix[6];
+  const headerStart = major === 1 ? 10 : 12;
+  const headerLength =
+    major === 1 ? prefix.readUInt16LE(8) : prefix.readUInt32LE(8);
+
+  const header = Buffer.alloc(headerLength);
+  await file.read(header, 0, headerLength, headerStart);
+  const text = header.toString("latin1");
+
+  const dtype = text.match(/'descr':\s*'([^']+)'/)?.[1];
+  const length = text.match(/'shape':\s*\((\d+),?\)/)?.[1];
+  if ((dtype !== "<f8" && dtype !== "<i4") || length === undefined) {
+    throw new Error(`Unsupported .npy header: ${text}`);
+  }
+
+  return {
+    dtype,
+    length: parseInt(length, 10),
+    dataOffset: headerStart + headerLength,
+  };
+}
+
+// Read elements [start, end) of a 1-D .npy column without loading the rest
+async function readRange(
+  filePath: string,
+  start: number,
+  end: number,
+): Promise<Float64Array | Int32Array> {
+  const file = await fs.open(filePath, "r");
+  try {
+    const header = await readHeader(file);
+    const size = ITEM_SIZE[header.dtype];
+    const count = Math.max(0, Math.min(end, header.length) - start);
+    const buffer = Buffer.alloc(count * size);
+    await file.read(buffer, 0, buffer.length, header.dataOffset + start * size);
+    const bytes = buffer.buffer.slice(
+      buffer.byteOffset,
+      buffer.byteOffset + buffer.length,
+    );
+    return header.dtype === "<f8"
+      ? new Float64Array(bytes)
+      : new Int32Array(bytes);
+  } finally {
+    await file.close();
+  }
+}
+
+export async function readMeta(dataDir: string): Promise<DataMeta> {
+  return JSON.parse(
+    await fs.readFile(path.join(dataDir, "meta.json"), "utf-8"),
+  );
+}
+
+function columnPath(dataDir: string, split: string, index: number): string {
+  return path.join(dataDir, `${split}_${String(index).padStart(3, "0")}.npy`);
+}
+
+export async function readPage(
+  dataDir: string,
+  split: string,
+  options: PageOptions,
+): Promise<DataPage> {
+  const meta = await readMeta(dataDir);
+  if (!meta.splits[split]) {
+    throw new Error(`Unknown split: ${split}`);
+  }
+
+  const names = meta.feature_names;
+  const columns = (options.columns ?? names).filter((c) => names.includes(c));
+  const total = meta.splits[split].rows;
+  const offset = Math.max(0, options.offset);
+  const end = Math.min(offset + options.limit, total);
+
+  // Contiguous pages read byte ranges; sorted pages gather rows by index
+  let index: number[] | null = null;
+  if (options.sort && names.includes(options.sort)) {
+    const values = await readRange(
+      columnPath(dataDir, split, names.indexOf(options.sort)),
+      0,
+      total,
+    );
+    const present: number[] = [];
+    const missing: number[] = [];
+    values.forEach((v, i) => (Number.isNaN(v) ? missing : present).push(i));
+    present.sort((a, b) => values[a] - values[b] || a - b);
+    if (options.descending) present.reverse();
+    index = present.concat(missing).slice(offset, end);
+  }
+
+  async function gather(filePath: string): Promise<ArrayLike<number>> {
+    if (!index) return readRange(filePath, offset, end);
+    const all = await readRange(filePath, 0, total);
+    return index.map((i) => all[i]);
+  }
+
+  const data = await Promise.all(
+    columns.map((c) => gather(columnPath(dataDir, split, names.indexOf(c)))),
+  );
+  const codes = await gather(path.join(dataDir, `${split}_labels.npy`));
+
+  const rows = Array.from({ length: codes.length }, (_, i) =>
+    Object.fromEntries(
+      columns.map((c, j) => [c, Number.isNaN(data[j][i]) ? null : data[j][i]]),
+    ),
+  );
+
+  return {
+    total,
+    offset,
+    columns,
+    rows,
+    labels: Array.from(codes, (c) => meta.label_classes[c]),
+  };
+}
@@ -0,0 +1,43 @@
+import { spawn } from "child_process";
+import path from "path";
+import { HELPER_POOL_SIZE, runInWorker } from "@/lib/worker";
+
+const SCRIPTS_DIR =
+  process.env.SCRIPTS_DIR || path.resolve(process.cwd(), "..");
+
+export interface PythonResult {
+  stdout: string;
+  code: number;
+}
+
+// Run a short-lived helper script (render.py, registry.py) on the helper pool,
+// which is separate from the training pool, or as a fresh `python` process
+// when the helper pool is disabled
+export function runPython(
+  script: string,
+  args: string[],
+  timeout: number,
+): Promise<PythonResult> {
+  if (HELPER_POOL_SIZE > 0) {
+    return runInWorker(script, args, timeout, "helper");
+  }
+
+  return new Promise((resolve) => {
+    const child = spawn(
+      "python",
+      ["-W", "ignore", path.join(SCRIPTS_DIR, script), ...args],
+      { cwd: SCRIPTS_DIR, timeout },
+    );
+    let stdout = "";
+    child.stdout.on("data", (data) => {
+      stdout += data.toString();
+    });
+    child.on("close", (code) => resolve({ stdout, code: code ?? 1 }));
+    child.on("error", (err) => resolve({ stdout: err.message, code: 1 }));
+  });
+}
+
+// Parse the JSON object printed on the last stdout line
+export function lastJsonLine<T>(stdout: string): T {
+  return JSON.parse(stdout.trim().split("\n").pop() ?? "");
+}
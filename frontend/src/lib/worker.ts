@@ -0,0 +1,215 @@
+import { spawn, type ChildProcessWithoutNullStreams } from "child_process";
+import path from "path";
+import readline from "readline";
+
+const SCRIPTS_DIR =
+  process.env.SCRIPTS_DIR || path.resolve(process.cwd(), "..");
+
+// Number of long-lived Python workers (0 disables the pool and spawns per request)
+export const WORKER_POOL_SIZE = parseInt(process.env.PYTHON_WORKERS ?? "2", 10);
+
+// Separate workers for short helper scripts (registry.py, render.py), so they
+// never queue behind training or compare jobs (0 spawns per request)
+export const HELPER_POOL_SIZE = parseInt(
+  process.env.PYTHON_HELPER_WORKERS ?? "1",
+  10,
+);
+
+export type PoolName = "train" | "helper";
+
+// Datasets each worker loads at startup (comma-separated, e.g. "Iris,Income")
+const WORKER_PRELOAD = process.env.PYTHON_WORKER_PRELOAD || "";
+
+export interface WorkerResult {
+  stdout: string;
+  stderr: string;
+  code: number;
+}
+
+interface Job {
+  id: string;
+  script: string;
+  args: string[];
+  timeout: number;
+  resolve: (result: WorkerResult) => void;
+  reject: (error: Error) => void;
+}
+
+class PythonWorker {
+  private child: ChildProcessWithoutNullStreams;
+  private job: Job | null = null;
+  private timer: NodeJS.Timeout | null = null;
+  private stderr = "";
+  ready = false;
+  alive = true;
+
+  constructor(
+    private onIdle: () => void,
+    private onStartupFailure: (stderr: string) => void,
+  ) {
+    this.child = spawn(
+      "python",
+      ["-W", "ignore", path.join(SCRIPTS_DIR, "worker.py"), "--preload", WORKER_PRELOAD],
+      { cwd: SCRIPTS_DIR },
+    );
+
+    readline
+      .createInterface({ input: this.child.stdout })
+      .on("line", (line) => this.handleLine(line));
+
+    // Worker-level stderr (outside of jobs), kept for crash reports
+    this.child.stderr.on("data", (data) => {
+      this.stderr = (this.stderr + data.toString()).slice(-10000);
+    });
+
+    this.child.on("exit", (code) => {
+      this.alive = false;
+      const stderr = this.stderr || `Python worker exited with code ${code}`;
+      if (!this.ready) {
+        this.onStartupFailure(stderr);
+      }
+      this.finish({ stdout: "", stderr, code: code ?? 1 });
+      this.onIdle();
+    });
+
+    this.child.on("error", (err) => {
+      this.alive = false;
+      if (!this.ready) {
+        this.onStartupFailure(err.message);
+      }
+      this.fail(err);
+    });
+  }
+
+  get idle(): boolean {
+    return this.alive && this.ready && this.job === null;
+  }
+
+  run(job: Job): void {
+    this.job = job;
+    this.timer = setTimeout(() => {
+      // A stuck job cannot be interrupted in-process; replace the worker
+      this.finish({
+        stdout: "",
+        stderr: `Script timed out after ${job.timeout}ms`,
+        code: 1,
+      });
+      this.kill();
+    }, job.timeout);
+    this.child.stdin.write(
+      JSON.stringify({ id: job.id, script: job.script, args: job.args }) + "\n",
+    );
+  }
+
+  kill(): void {
+    this.alive = false;
+    this.child.kill("SIGKILL");
+  }
+
+  private handleLine(line: string): void {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch {
+      return;
+    }
+
+    if (message.ready) {
+      this.ready = true;
+      this.onIdle();
+      return;
+    }
+
+    if (this.job && message.id === this.job.id) {
+      this.finish({
+        stdout: message.stdout ?? "",
+        stderr: message.stderr ?? "",
+        code: message.code ?? 1,
+      });
+      this.onIdle();
+    }
+  }
+
+  private finish(result: WorkerResult): void {
+    const job = this.job;
+    this.clearJob();
+    job?.resolve(result);
+  }
+
+  private fail(error: Error): void {
+    const job = this.job;
+    this.clearJob();
+    job?.reject(error);
+  }
+
+  private clearJob(): void {
+    if (this.timer) clearTimeout(this.timer);
+    this.timer = null;
+    this.job = null;
+  }
+}
+
+class WorkerPool {
+  private workers: PythonWorker[] = [];
+  private queue: Job[] = [];
+  private nextId = 0;
+
+  constructor(private size: number) {}
+
+  run(script: string, args: string[], timeout: number): Promise<WorkerResult> {
+    return new Promise((resolve, reject) => {
+      this.queue.push({
+        id: String(++this.nextId),
+        script,
+        args,
+        timeout,
+        resolve,
+        reject,
+      });
+      this.dispatch();
+    });
+  }
+
+  private dispatch(): void {
+    // Drop dead workers and start new ones only while jobs are waiting
+    this.workers = this.workers.filter((w) => w.alive);
+    while (this.workers.length < this.size && this.queue.length > 0) {
+      this.workers.push(
+        new PythonWorker(
+          () => this.dispatch(),
+          (stderr) => this.queue.shift()?.reject(new Error(stderr)),
+        ),
+      );
+    }
+
+    for (const worker of this.workers) {
+      if (this.queue.length === 0) break;
+      if (worker.idle) {
+        worker.run(this.queue.shift()!);
+      }
+    }
+  }
+}
+
+const POOL_SIZES: Record<PoolName, number> = {
+  train: WORKER_POOL_SIZE,
+  helper: HELPER_POOL_SIZE,
+};
+
+// Keep one pool per name across Next.js route module reloads
+const globalForWorkers = globalThis as unknown as {
+  pythonWorkerPools?: Partial<Record<PoolName, WorkerPool>>;
+};
+
+export function runInWorker(
+  script: string,
+  args: string[],
+  timeout: number,
+  pool: PoolName = "train",
+): Promise<WorkerResult> {
+  const pools = (globalForWorkers.pythonWorkerPools ??= {});
+  if (!pools[pool]) {
+    pools[pool] = new WorkerPool(POOL_SIZES[pool]);
+  }
+  return pools[pool]!.run(script, args, timeout);
+}
@@ -61,16 +61,34 @@ export interface TrainResult {
   trainLabels?: string[];
   testLabels?: string[];
   featureNames?: string[];
+  dataRows?: { train: number; test: number };
+  timings?: StageTimings;
   executionTime: number;
   runId?: string;
 }
 
+// Seconds per top-level stage of a train script (Profile spans, in start order)
+export interface StageTimings {
+  total: number;
+  stages: Record<string, number>;
+}
+
+// One page of rows from a run's columnar data sidecar (GET /api/data)
+export interface DataPage {
+  total: number;
+  offset: number;
+  columns: string[];
+  rows: Record<string, number | null>[];
+  labels: string[];
+}
+
 export type ErrorCode =
   | 'SCRIPT_NOT_FOUND'
   | 'SCRIPT_EXECUTION_ERROR'
   | 'INVALID_JSON_OUTPUT'
   | 'INVALID_PARAMS'
   | 'TIMEOUT'
+  | 'MEMORY_BUDGET_EXCEEDED'
   | 'UNKNOWN_ERROR';
 
 export interface TrainError {
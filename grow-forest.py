@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Add trees to a saved random forest run (warm_start).
+
+Loads model.pkl of a forest run, fits --estimators more trees on the run's
+stored training split (train.csv) and re-evaluates on its test split. Only the
+new trees are fitted; with an integer random_state the grown forest matches one
+trained with the larger n_estimators from scratch.
+
+    python grow-forest.py --run-id 1706540123 --estimators 100 --json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+import joblib
+import pandas as pd
+
+from lib import Dataset, Model
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Grow a saved random forest run with more trees")
+    parser.add_argument("--run-id", type=str, required=True, help="Forest run to extend")
+    parser.add_argument("--estimators", type=int, default=100,
+                        help="Number of trees to add (default: 100)")
+    parser.add_argument("--json", action="store_true", help="Output summary as JSON")
+    args = parser.parse_args()
+    if args.estimators < 1:
+        parser.error("--estimators must be at least 1")
+    return args
+
+
+def get_output_dir(run_id):
+    """Get the output directory path for a run_id."""
+    return os.path.realpath(os.path.join(
+        os.path.dirname(__file__), 'frontend', 'public', 'output', run_id
+    ))
+
+
+def fail(message, as_json):
+    """Print an error (JSON when requested) and exit with status 1."""
+    if as_json:
+        print(json.dumps({"success": False, "error": {"message": message}}))
+    else:
+        print(f"Error: {message}", file=sys.stderr)
+    sys.exit(1)
+
+
+def read_split(output_dir, split):
+    """Read a stored split (train.csv/test.csv, target in the last column).
+
+    Returns:
+        tuple: (X, y)
+    """
+    frame = pd.read_csv(os.path.join(output_dir, f"{split}.csv"))
+    return frame.iloc[:, :-1], frame.iloc[:, -1]
+
+
+def main():
+    args = parse_args()
+    output_dir = get_output_dir(args.run_id)
+
+    # Validate the run
+    for filename in ("model.pkl", "runtime.json", "train.csv", "test.csv"):
+        if not os.path.exists(os.path.join(output_dir, filename)):
+            fail(f"{filename} not found for run {args.run_id}", args.json)
+
+    with open(os.path.join(output_dir, 'runtime.json')) as f:
+        runtime = json.load(f)
+    if runtime.get("model") != "forest":
+        fail(f"Run {args.run_id} is a {runtime.get('model')} model, not forest", args.json)
+
+    clf = joblib.load(os.path.join(output_dir, 'model.pkl'))
+    X_train, y_train = read_split(output_dir, "train")
+    X_test, y_test = read_split(output_dir, "test")
+    if runtime.get("datasetParams", {}).get("compact"):
+        X_train, X_test = Dataset.compact(X_train), Dataset.compact(X_test)
+    previous = (Model.get_run(args.run_id) or {}).get("accuracy")
+
+    # Fit only the additional trees
+    before = len(clf.estimators_)
+    warm_start = clf.warm_start
+    clf.set_params(warm_start=True, n_estimators=before + args.estimators)
+    start_time = time.time()
+    clf.fit(X_train, y_train)
+    fit_seconds = time.time() - start_time
+    clf.set_params(warm_start=warm_start)
+
+    y_pred = clf.predict(X_test)
+    accuracy = (y_pred == y_test).mean()
+
+    # Update model.pkl, runtime.json, .id marker and registry
+    model_params = {**runtime.get("modelParams", {}), "n_estimators": clf.n_estimators}
+    dataset_params = runtime.get("datasetParams", {})
+    Model.save(clf, args.run_id)
+    Model.save_runtime(
+        run_id=args.run_id,
+        dataset=runtime["dataset"],
+        model="forest",
+        dataset_params=dataset_params,
+        model_params=model_params
+    )
+    Model.save_id(args.run_id, "forest", runtime["dataset"], accuracy)
+
+    model_info = {
+        "type": "forest",
+        "n_estimators": clf.n_estimators,
+        "grow": {"from": before, "added": args.estimators, "seconds": round(fit_seconds, 3)}
+    }
+    if hasattr(clf, 'oob_score_'):
+        model_info["oob_score"] = clf.oob_score_
+
+    params = {
+        "dataset": runtime["dataset"],
+        **{key: dataset_params.get(key)
+           for key in ("mask", "split", "impute", "compact", "ignore_columns", "dataset_config")},
+        "run_id": args.run_id,
+        "model_config": model_params
+    }
+
+    # result.json is rewritten on every grow; the summary only goes to stdout with --json
+    stdout = sys.stdout if args.json else io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        Model.report(
+            y_test, y_pred,
+            json_output=True,
+            model_info=model_info,
+            params=params,
+            feature_importance=dict(zip(X_train.columns.tolist(), clf.feature_importances_.tolist())),
+            X_train=X_train,
+            X_test=X_test,
+            y_train=y_train,
+            y_test=y_test
+        )
+
+    if not args.json:
+        change = f" (was {previous:.4f})" if previous is not None else ""
+        print(f"Grew forest {args.run_id}: {before} -> {clf.n_estimators} trees in {fit_seconds:.2f}s")
+        print(f"Accuracy: {accuracy:.4f}{change}")
+
+
+if __name__ == "__main__":
+    main()
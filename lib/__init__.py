@@ -1,6 +1,25 @@
-from .args import Args
-from .dataset import Dataset
-from .dataset.render import Render
-from .model import Model
+import importlib
 
-__all__ = ["Args", "Dataset", "Model", "Render"]
+# Facades are imported on first access (PEP 562), so `from lib import Args`
+# does not pull in the dataset, model or plotting stacks
+_EXPORTS = {
+    "Args": ".args",
+    "Dataset": ".dataset",
+    "Model": ".model",
+    "Profile": ".profile",
+    "Render": ".dataset.render",
+}
+
+__all__ = ["Args", "Dataset", "Model", "Profile", "Render"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
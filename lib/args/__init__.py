@@ -39,8 +39,15 @@ class Args:
                 - test_size: float, test size (0.1-0.9)
                 - use_output: bool, reuse cached dataset
                 - impute: bool, impute training missing values
+                - compact: bool, load features as C-contiguous float32 frames
                 - images: bool, generate plot images
+                - render_workers: int or None, render images on a background pool
+                - lazy_images: bool, record image specs and render on first request
                 - json: bool, output summary as JSON
+                - profile: bool, cProfile the run (profile.pstats/profile.txt)
+                - memory: bool, trace allocations per stage (memory.json)
+                - memory_budget: float or None, max RSS in MB before failing
+                - dataset_config: dict or None, generation parameters for --dataset Synthetic
         """
         parser = argparse.ArgumentParser()
         parser.add_argument("--mask", type=int, nargs="?", const=10, default=0,
@@ -52,12 +59,33 @@ class Args:
                             help="Reuse dataset from CSV files (true/false)")
         parser.add_argument("--impute", action="store_true",
                             help="Impute missing values in training set only")
+        parser.add_argument("--compact", action="store_true",
+                            help="Load features compactly (uint8 codes + missing mask, float32) and hand "
+                                 "sklearn one C-contiguous float32 matrix per split")
         parser.add_argument("--images", action="store_true",
                             help="Generate plot images")
+        parser.add_argument("--render-workers", type=int, default=None,
+                            help="Render --images in a detached background process on a pool of N workers "
+                                 "(0 = no pool) and exit right after training; progress in renders.json")
+        parser.add_argument("--lazy-images", action="store_true",
+                            help="Record --images renders as specs; each image is drawn on first request "
+                                 "(python render.py) and cached by content hash")
         parser.add_argument("--json", action="store_true",
                             help="Output summary as JSON")
-        parser.add_argument("--dataset", type=str, choices=["Iris", "Income"], default="Iris",
+        parser.add_argument("--profile", action="store_true",
+                            help="Run under cProfile; writes profile.pstats and profile.txt next to runtime.json "
+                                 "(stderr without --run-id)")
+        parser.add_argument("--memory", action="store_true",
+                            help="Record peak RSS and tracemalloc top allocations per stage in memory.json "
+                                 "(slows the run down)")
+        parser.add_argument("--memory-budget", type=float, default=None, metavar="MB",
+                            help="Fail with MemoryBudgetError once RSS (with child processes) exceeds MB "
+                                 "(default: MEMORY_BUDGET_MB environment variable, unset = no budget)")
+        parser.add_argument("--dataset", type=str, choices=["Iris", "Income", "Synthetic"], default="Iris",
                             help="Dataset to use (default: Iris)")
+        parser.add_argument("--dataset-config", type=str, default=None,
+                            help="JSON string with Synthetic dataset parameters "
+                                 "(e.g. '{\"rows\": 1000000, \"imbalance\": 9}')")
         parser.add_argument("--model-config", type=str, default=None,
                             help="JSON string with model config overrides (snake_case keys)")
         parser.add_argument("--dataset-ignore-columns", type=str, default=None,
@@ -70,6 +98,13 @@ class Args:
         args.mask_rate = args.mask / 100.0
         args.test_size = args.split / 100.0
 
+        # Parse dataset config (Synthetic generation parameters)
+        if args.dataset_config:
+            try:
+                args.dataset_config = json.loads(args.dataset_config)
+            except json.JSONDecodeError as e:
+                parser.error(f"--dataset-config is not valid JSON: {e}")
+
         # Parse ignore_columns
         if args.dataset_ignore_columns:
             args.ignore_columns = [int(x.strip()) for x in args.dataset_ignore_columns.split(",")]
@@ -1,7 +1,34 @@
+from . import compact, impute
 from .income import Income
 from .iris import Iris
+from .synthetic import Synthetic
 
 
 class Dataset:
     Income = Income
     Iris = Iris
+    Synthetic = Synthetic
+    knn_impute = staticmethod(impute.knn)
+    compact = staticmethod(compact.frame)
+
+    @staticmethod
+    def get(name, config=None):
+        """Return a dataset source by name, applying its configuration.
+
+        Args:
+            name: Dataset name (Iris, Income or Synthetic)
+            config: Optional dict of generation parameters (Synthetic only);
+                Synthetic falls back to its defaults when omitted
+
+        Returns:
+            Dataset source class
+
+        Raises:
+            ValueError: If config is given for a dataset that takes none
+        """
+        source = getattr(Dataset, name)
+        if hasattr(source, "configure"):
+            source.configure(**(config or {}))
+        elif config:
+            raise ValueError(f"Dataset {name} takes no configuration")
+        return source
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import shutil
+import joblib
+import numpy as np
+import pandas as pd
+from config import CACHE_DIR
+
+# Entries already read in this process (long-lived workers), keyed by cache directory
+_loaded = {}
+
+
+def _fingerprint(path):
+    """Compute a content fingerprint for a source file.
+
+    Args:
+        path: Path to the source file
+
+    Returns:
+        str: First 16 hex digits of the file's SHA-256
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _known_fingerprint(name):
+    """Return the fingerprint of the last seen source file if it is unchanged.
+
+    Avoids calling the (possibly networked) source resolver on warm loads.
+
+    Args:
+        name: Cache namespace
+
+    Returns:
+        str or None: Fingerprint if the recorded source file still matches its stat
+    """
+    source = _read_json(os.path.join(CACHE_DIR, name, 'source.json'))
+    if not source:
+        return None
+    try:
+        stat = os.stat(source['path'])
+    except (OSError, KeyError):
+        return None
+    if stat.st_size != source.get('size') or stat.st_mtime_ns != source.get('mtime_ns'):
+        return None
+    return source.get('fingerprint')
+
+
+def _remember_source(name, path, fingerprint):
+    stat = os.stat(path)
+    source = {
+        "path": path,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "fingerprint": fingerprint
+    }
+    source_path = os.path.join(CACHE_DIR, name, 'source.json')
+    tmp_path = f"{source_path}.{os.getpid()}"
+    with open(tmp_path, 'w') as f:
+        json.dump(source, f, indent=2)
+    os.replace(tmp_path, source_path)
+
+
+def write(directory, X, y, encoders=None):
+    """Write an encoded dataset as one .npy file per column.
+
+    The directory is written under a temporary name and renamed into place,
+    so readers never observe a partially written cache entry.
+
+    Args:
+        directory: Target cache directory
+        X: Feature DataFrame (numeric columns)
+        y: Target Series
+        encoders: Optional dict of fitted encoders keyed by column name
+    """
+    tmp_dir = f"{directory}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    for i, col in enumerate(X.columns):
+        np.save(os.path.join(tmp_dir, f"X_{i:03d}.npy"), np.ascontiguousarray(X[col].to_numpy()))
+    np.save(os.path.join(tmp_dir, 'y.npy'), y.to_numpy().astype(str))
+    joblib.dump(encoders or {}, os.path.join(tmp_dir, 'encoders.pkl'))
+
+    meta = {
+        "columns": X.columns.tolist(),
+        "target": y.name,
+        "rows": len(X)
+    }
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    try:
+        os.replace(tmp_dir, directory)
+    except OSError:
+        # Another process already populated this entry
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def read(directory, mmap_mode='r', copy=True):
+    """Read an encoded dataset written by write().
+
+    Args:
+        directory: Cache directory
+        mmap_mode: numpy memory-map mode for column files (None to read into memory)
+        copy: If False, the frames stay backed by the (read-only) memory-mapped files
+
+    Returns:
+        tuple: (X, y, encoders)
+    """
+    with open(os.path.join(directory, 'meta.json')) as f:
+        meta = json.load(f)
+
+    X = pd.DataFrame({
+        col: np.load(os.path.join(directory, f"X_{i:03d}.npy"), mmap_mode=mmap_mode)
+        for i, col in enumerate(meta["columns"])
+    }, copy=copy)
+    y = pd.Series(
+        np.load(os.path.join(directory, 'y.npy'), mmap_mode=mmap_mode),
+        name=meta["target"],
+        copy=copy
+    )
+    encoders = joblib.load(os.path.join(directory, 'encoders.pkl'))
+
+    return X, y, encoders
+
+
+def _read_memoized(directory):
+    """Read a cache entry once per process and hand out copies.
+
+    Args:
+        directory: Cache directory
+
+    Returns:
+        tuple: (X, y, encoders) - X and y are fresh copies callers may modify
+    """
+    if directory not in _loaded:
+        _loaded[directory] = read(directory)
+    X, y, encoders = _loaded[directory]
+    return X.copy(), y.copy(), encoders
+
+
+def load(name, source, parse):
+    """Load a parsed dataset, reusing the on-disk cache when the source is unchanged.
+
+    Cache entries live in CACHE_DIR/<name>/<fingerprint>/ where the fingerprint
+    is a hash of the source file contents.
+
+    Args:
+        name: Cache namespace (e.g. "income")
+        source: Callable returning the path to the source CSV file
+        parse: Callable taking the source path and returning (X, y, encoders)
+
+    Returns:
+        tuple: (X, y, encoders)
+    """
+    fingerprint = _known_fingerprint(name)
+    if fingerprint:
+        directory = os.path.join(CACHE_DIR, name, fingerprint)
+        if os.path.exists(os.path.join(directory, 'meta.json')):
+            return _read_memoized(directory)
+
+    path = source()
+    fingerprint = _fingerprint(path)
+    directory = os.path.join(CACHE_DIR, name, fingerprint)
+
+    if not os.path.exists(os.path.join(directory, 'meta.json')):
+        X, y, encoders = parse(path)
+        os.makedirs(os.path.dirname(directory), exist_ok=True)
+        write(directory, X, y, encoders)
+
+    _remember_source(name, path, fingerprint)
+    return _read_memoized(directory)
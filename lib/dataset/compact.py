@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+from ..lazy import LazyModule
+
+model_selection = LazyModule("sklearn.model_selection")
+
+# Smallest first: categorical codes use the first dtype that holds every level
+CODE_DTYPES = (np.uint8, np.uint16, np.uint32)
+
+# sklearn's tree estimators validate X as float32 (sklearn.tree._tree.DTYPE)
+MATRIX_DTYPE = np.float32
+
+
+def code_dtype(levels):
+    """Return the smallest unsigned integer dtype holding codes 0..levels-1."""
+    for dtype in CODE_DTYPES:
+        if levels <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+class Columns:
+    """Compact column store for a feature matrix.
+
+    Categorical columns hold their codes as small unsigned ints, numeric columns
+    hold float32 values, and missing values live in a separate boolean mask per
+    column (None while nothing is missing) instead of NaN-upcasting the codes.
+    Masking shares the value arrays; only matrix() builds the float32 matrix.
+    """
+
+    def __init__(self, names, values, missing=None):
+        self.names = list(names)
+        self.values = list(values)
+        self.missing = list(missing) if missing is not None else [None] * len(self.values)
+
+    @staticmethod
+    def from_frame(X, categorical=()):
+        """Compact a numeric feature frame.
+
+        Args:
+            X: Feature DataFrame (categorical columns as integer codes, NaN = missing)
+            categorical: Names of the categorical columns (e.g. the label encoder keys)
+
+        Returns:
+            Columns
+        """
+        values, missing = [], []
+        for col in X.columns:
+            column = X[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            hidden = np.isnan(column)
+            if col in categorical:
+                codes = np.where(hidden, 0, column)
+                values.append(codes.astype(code_dtype(int(codes.max(initial=0)) + 1)))
+            else:
+                values.append(column.astype(np.float32))
+            missing.append(hidden if hidden.any() else None)
+        return Columns(X.columns, values, missing)
+
+    def __len__(self):
+        return len(self.values[0]) if self.values else 0
+
+    @property
+    def shape(self):
+        return len(self), len(self.names)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the values and missing masks."""
+        return sum(v.nbytes for v in self.values) + sum(m.nbytes for m in self.missing if m is not None)
+
+    def mask(self, hidden):
+        """Return a copy with the values where hidden is True marked missing.
+
+        Args:
+            hidden: Boolean (rows, columns) array, e.g. rng.random(X.shape) < mask_rate
+
+        Returns:
+            Columns sharing this store's value arrays
+        """
+        missing = [
+            hidden[:, j] | current if current is not None else hidden[:, j].copy()
+            for j, current in enumerate(self.missing)
+        ]
+        return Columns(self.names, self.values, missing)
+
+    def matrix(self, rows=None):
+        """Build the C-contiguous float32 feature matrix (NaN = missing).
+
+        Args:
+            rows: Optional row indices to take (default: all rows)
+
+        Returns:
+            ndarray: (rows, columns) float32 matrix
+        """
+        n = len(self) if rows is None else len(rows)
+        out = np.empty((n, len(self.names)), dtype=MATRIX_DTYPE)
+        for j, (values, missing) in enumerate(zip(self.values, self.missing)):
+            out[:, j] = values if rows is None else values[rows]
+            if missing is not None:
+                out[missing if rows is None else missing[rows], j] = np.nan
+        return out
+
+
+def frame(X, columns=None, index=None):
+    """Wrap a feature matrix as a compact frame sklearn can use without copying.
+
+    The frame is a single float32 block whose values are C-contiguous, so
+    check_array in fit/predict (and every predict of permutation importance)
+    gets a view instead of a converted copy. Frames already in this layout are
+    returned unchanged.
+
+    Args:
+        X: Feature DataFrame or 2D array
+        columns: Column names (default: X.columns)
+        index: Row index (default: X.index, or a RangeIndex for arrays)
+
+    Returns:
+        pd.DataFrame
+    """
+    if isinstance(X, pd.DataFrame):
+        values = X.to_numpy()
+        if values.dtype == MATRIX_DTYPE and values.flags.c_contiguous and columns is None and index is None:
+            return X
+        columns = X.columns if columns is None else columns
+        index = X.index if index is None else index
+        X = values
+    values = np.ascontiguousarray(X, dtype=MATRIX_DTYPE)
+    return pd.DataFrame(values, columns=columns, index=index, copy=False)
+
+
+def split(columns, y, test_size=0.33, random_state=42):
+    """Train/test split of a compact store into compact frames.
+
+    Splits row indices with the same train_test_split call the loaders use on
+    frames, so the rows match the non-compact split exactly; each side's matrix
+    is gathered straight into its own float32 array.
+
+    Args:
+        columns: Columns store
+        y: Target Series
+        test_size: Fraction of data for test set (default 0.33)
+        random_state: Split seed (default 42)
+
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test)
+    """
+    train, test = model_selection.train_test_split(
+        np.arange(len(y)), test_size=test_size, random_state=random_state
+    )
+    return (
+        frame(columns.matrix(train), columns.names, y.index[train]),
+        frame(columns.matrix(test), columns.names, y.index[test]),
+        y.iloc[train],
+        y.iloc[test]
+    )
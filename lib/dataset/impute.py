@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import numpy as np
+from joblib import Parallel, delayed
+from config import VERBOSE
+from ..lazy import LazyModule
+
+# Only loaded when imputation actually runs
+pairwise = LazyModule("sklearn.metrics.pairwise")
+threadpoolctl = LazyModule("threadpoolctl")
+
+# Upper bound on one chunk's receiver x donor distance matrix (MB, per worker thread)
+WORKING_MEMORY = int(os.environ.get('IMPUTE_WORKING_MEMORY', 256))
+
+# Worker threads (-1 = all cores)
+N_JOBS = int(os.environ.get('IMPUTE_JOBS', -1))
+
+# Timing and size of the most recent knn() call
+last_stats = {}
+
+
+def _weights(donors_dist, weights):
+    """Donor weights, matching KNNImputer ('distance': 1/d, exact matches win)."""
+    if weights == "uniform":
+        weight_matrix = np.ones_like(donors_dist)
+        weight_matrix[np.isnan(donors_dist)] = 0.0
+        return weight_matrix
+
+    with np.errstate(divide="ignore"):
+        weight_matrix = 1.0 / donors_dist
+    inf_mask = np.isinf(weight_matrix)
+    inf_row = np.any(inf_mask, axis=1)
+    weight_matrix[inf_row] = inf_mask[inf_row]
+    weight_matrix[np.isnan(weight_matrix)] = 0.0
+    return weight_matrix
+
+
+def _impute_chunk(X, mask, donors, col_means, out, rows, n_neighbors, weights):
+    """Impute the receiver rows of one chunk into out.
+
+    Args:
+        X: Original feature matrix (NaN = missing), also the donor set
+        mask: Missing value mask of X
+        donors: Per column, indices of rows where the column is observed
+        col_means: Per column mean of the observed values
+        out: Output matrix, written in place for rows only
+        rows: Receiver row indices of this chunk
+        n_neighbors: Number of donors per receiver
+        weights: 'distance' or 'uniform'
+
+    Returns:
+        tuple: (distance_time, impute_time) in seconds
+    """
+    start_time = time.perf_counter()
+    dist_chunk = pairwise.nan_euclidean_distances(X[rows], X)
+    distance_time = time.perf_counter() - start_time
+
+    for col in range(X.shape[1]):
+        col_mask = mask[rows, col]
+        if not col_mask.any() or len(donors[col]) == 0:
+            continue
+
+        receivers = np.flatnonzero(col_mask)
+        dist_subset = dist_chunk[np.ix_(receivers, donors[col])]
+
+        # Receivers sharing no observed feature with any donor get the column mean
+        all_nan = np.isnan(dist_subset).all(axis=1)
+        if all_nan.any():
+            out[rows[receivers[all_nan]], col] = col_means[col]
+            if all_nan.all():
+                continue
+            receivers = receivers[~all_nan]
+            dist_subset = dist_subset[~all_nan]
+
+        k = min(n_neighbors, len(donors[col]))
+        donors_idx = np.argpartition(dist_subset, k - 1, axis=1)[:, :k]
+        donors_dist = dist_subset[np.arange(donors_idx.shape[0])[:, None], donors_idx]
+
+        donor_values = np.ma.array(
+            X[donors[col], col].take(donors_idx),
+            mask=mask[donors[col], col].take(donors_idx)
+        )
+        out[rows[receivers], col] = np.ma.average(
+            donor_values, axis=1, weights=_weights(donors_dist, weights)
+        ).data
+
+    return distance_time, time.perf_counter() - start_time - distance_time
+
+
+def knn(X, n_neighbors=5, weights="distance", working_memory=None, n_jobs=None):
+    """Impute missing values from the k nearest neighbors, in bounded-memory chunks.
+
+    Equivalent to KNNImputer(n_neighbors, weights).fit_transform(X): nan-euclidean
+    distances to every row, donors per column restricted to rows observing that
+    column, argpartition selection of the k closest, and the column mean for
+    receivers that share no observed feature with any donor. Receiver rows are
+    processed in chunks sized so each chunk's distance matrix stays within
+    working_memory, and chunks run on a thread pool. Columns that are entirely
+    missing are left as NaN.
+
+    A tree index cannot serve this metric exactly (distances are rescaled by the
+    features both rows observe), so each chunk computes its distances directly.
+
+    Args:
+        X: Feature matrix (DataFrame or array-like, NaN = missing)
+        n_neighbors: Number of donors per missing value
+        weights: 'distance' (inverse distance) or 'uniform'
+        working_memory: Distance matrix budget per chunk in MB (default WORKING_MEMORY)
+        n_jobs: Worker threads (default N_JOBS, -1 = all cores)
+
+    Returns:
+        ndarray: Imputed float64 matrix. Timing is recorded in last_stats.
+    """
+    start_time = time.perf_counter()
+    working_memory = working_memory or WORKING_MEMORY
+    n_jobs = n_jobs or N_JOBS
+
+    X = np.asarray(X, dtype=np.float64)
+    mask = np.isnan(X)
+    out = X.copy()
+
+    receivers = np.flatnonzero(mask.any(axis=1))
+    chunk_rows = max(1, int(working_memory * 2**20 // (8 * max(len(X), 1))))
+    chunks = [receivers[i:i + chunk_rows] for i in range(0, len(receivers), chunk_rows)]
+
+    donors = [np.flatnonzero(~mask[:, col]) for col in range(X.shape[1])]
+    col_means = [X[donors[col], col].mean() if len(donors[col]) else np.nan for col in range(X.shape[1])]
+
+    # One BLAS thread per worker so chunk threads don't oversubscribe the cores
+    with threadpoolctl.threadpool_limits(limits=1 if n_jobs != 1 else None, user_api="blas"):
+        times = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_impute_chunk)(X, mask, donors, col_means, out, rows, n_neighbors, weights)
+            for rows in chunks
+        )
+
+    last_stats.clear()
+    last_stats.update({
+        "rows": len(X),
+        "receivers": len(receivers),
+        "chunks": len(chunks),
+        "chunk_rows": chunk_rows,
+        "distance_time": round(sum(t[0] for t in times), 3),
+        "impute_time": round(sum(t[1] for t in times), 3),
+        "elapsed": round(time.perf_counter() - start_time, 3)
+    })
+
+    if VERBOSE and receivers.size:
+        print(f"KNN imputation: {len(receivers)}/{len(X)} rows in {last_stats['elapsed']:.2f}s "
+              f"({len(chunks)} chunks of {chunk_rows} rows)", file=sys.stderr)
+
+    return out
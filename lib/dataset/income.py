@@ -1,25 +1,43 @@
 import os
-import kagglehub
 import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
 from config import OUTPUT_DIR
+from . import cache
+from .compact import Columns, frame as compact_frame, split as compact_split
+from .impute import knn
+from ..lazy import LazyModule
+from ..profile import Profile
+
+model_selection = LazyModule("sklearn.model_selection")
+preprocessing = LazyModule("sklearn.preprocessing")
 
 
 class Income:
     _label_encoders = {}
 
     @staticmethod
-    def _load_raw():
-        """Load raw Adult Income dataset via kagglehub.
+    def _source():
+        """Download the Adult Income dataset via kagglehub.
 
         Returns:
-            tuple: (X, y) feature matrix and target series
+            str: Path to the source CSV file
         """
+        # Only needed on a dataset cache miss (see cache.load)
+        import kagglehub
         path = kagglehub.dataset_download("uciml/adult-census-income")
-        df = pd.read_csv(f"{path}/adult.csv")
+        return f"{path}/adult.csv"
+
+    @staticmethod
+    def _parse(csv_path):
+        """Parse the Adult Income CSV and label-encode categorical columns.
+
+        Args:
+            csv_path: Path to adult.csv
+
+        Returns:
+            tuple: (X, y, encoders) where encoders maps column name to fitted LabelEncoder
+        """
+        df = pd.read_csv(csv_path)
 
         # Target column
         y = df["income"]
@@ -29,53 +47,81 @@ class Income:
 
         # Encode categorical columns for sklearn compatibility
         categorical_cols = X.select_dtypes(include=["object"]).columns
-        Income._label_encoders = {}
+        encoders = {}
 
         for col in categorical_cols:
-            le = LabelEncoder()
+            le = preprocessing.LabelEncoder()
             X[col] = le.fit_transform(X[col].astype(str))
-            Income._label_encoders[col] = le
+            encoders[col] = le
+
+        return X, y, encoders
+
+    @staticmethod
+    def _load_raw(compact=False):
+        """Load raw Adult Income dataset, using the parsed dataset cache when warm.
+
+        Args:
+            compact: If True, return X as a compact Columns store (label-encoded
+                columns as uint8 codes, numerics as float32)
+
+        Returns:
+            tuple: (X, y) feature matrix and target series
+        """
+        X, y, Income._label_encoders = cache.load("income", Income._source, Income._parse)
+
+        if compact:
+            X = Columns.from_frame(X, categorical=Income._label_encoders)
 
         return X, y
 
     @staticmethod
-    def load(test_size=0.33):
+    def load(test_size=0.33, compact=False):
         """Load Income dataset and return train/test splits.
 
         Args:
             test_size: Fraction of data for test set (default 0.33)
+            compact: If True, return compact float32 frames (see lib/dataset/compact.py)
 
         Returns:
             tuple: (X_train, X_test, y_train, y_test)
         """
-        X, y = Income._load_raw()
+        X, y = Income._load_raw(compact=compact)
+
+        if compact:
+            return compact_split(X, y, test_size=test_size)
 
-        X_train, X_test, y_train, y_test = train_test_split(
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
             X, y, test_size=test_size, random_state=42
         )
 
         return X_train, X_test, y_train, y_test
 
     @staticmethod
-    def load_masked(mask_rate=0.1, test_size=0.33, random_state=42):
+    def load_masked(mask_rate=0.1, test_size=0.33, random_state=42, compact=False):
         """Load Income dataset with missing data.
 
         Args:
             mask_rate: Fraction of values to set as missing (default 0.1)
             test_size: Fraction of data for test set (default 0.33)
             random_state: Random seed for reproducibility
+            compact: If True, keep the codes and record the mask separately instead
+                of upcasting to float64, and return compact float32 frames
 
         Returns:
             tuple: (X_train, X_test, y_train, y_test)
         """
-        X, y = Income._load_raw()
+        X, y = Income._load_raw(compact=compact)
 
         # Introduce missing values
-        rng = np.random.default_rng(random_state)
-        mask = rng.random(X.shape) < mask_rate
-        X = X.mask(mask)
+        with Profile.span("dataset.mask"):
+            rng = np.random.default_rng(random_state)
+            mask = rng.random(X.shape) < mask_rate
+            X = X.mask(mask)
+
+        if compact:
+            return compact_split(X, y, test_size=test_size)
 
-        X_train, X_test, y_train, y_test = train_test_split(
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
             X, y, test_size=test_size, random_state=42
         )
 
@@ -124,11 +170,10 @@ class Income:
         Returns:
             tuple: (X_train_imputed, X_test) - train imputed, test unchanged
         """
-        imputer = KNNImputer(n_neighbors=5, weights="distance")
         columns = X_train.columns
 
         X_train_imputed = pd.DataFrame(
-            imputer.fit_transform(X_train),
+            knn(X_train, n_neighbors=5, weights="distance"),
             columns=columns,
             index=X_train.index
         )
@@ -136,7 +181,8 @@ class Income:
         return X_train_imputed, X_test
 
     @staticmethod
-    def input(mask_rate=0.0, test_size=0.33, reuse_dataset=False, impute=False, ignore_columns=None):
+    def input(mask_rate=0.0, test_size=0.33, reuse_dataset=False, impute=False, ignore_columns=None,
+              compact=False):
         """Load Income dataset based on input parameters.
 
         Args:
@@ -145,16 +191,21 @@ class Income:
             reuse_dataset: If True, load from previously exported CSV files
             impute: If True, impute missing values in training set only
             ignore_columns: List of column indices to drop (default None)
+            compact: If True, return float32 frames backed by one C-contiguous
+                matrix each, which sklearn uses without re-validating copies
 
         Returns:
             tuple: (X_train, X_test, y_train, y_test)
         """
-        if reuse_dataset:
-            X_train, X_test, y_train, y_test = Income.load_from_csv(mask_rate)
-        elif mask_rate > 0:
-            X_train, X_test, y_train, y_test = Income.load_masked(mask_rate=mask_rate, test_size=test_size)
-        else:
-            X_train, X_test, y_train, y_test = Income.load(test_size=test_size)
+        with Profile.span("dataset.load"):
+            if reuse_dataset:
+                X_train, X_test, y_train, y_test = Income.load_from_csv(mask_rate)
+            elif mask_rate > 0:
+                X_train, X_test, y_train, y_test = Income.load_masked(
+                    mask_rate=mask_rate, test_size=test_size, compact=compact
+                )
+            else:
+                X_train, X_test, y_train, y_test = Income.load(test_size=test_size, compact=compact)
 
         # Drop ignored columns
         if ignore_columns:
@@ -164,7 +215,12 @@ class Income:
 
         # Impute missing values in training set if impute is enabled
         if impute:
-            X_train, X_test = Income._impute(X_train, X_test)
+            with Profile.span("dataset.impute"):
+                X_train, X_test = Income._impute(X_train, X_test)
+
+        # Dropping, imputing and CSV reloads leave other layouts; no-op otherwise
+        if compact:
+            X_train, X_test = compact_frame(X_train), compact_frame(X_test)
 
         return X_train, X_test, y_train, y_test
 
@@ -1,26 +1,55 @@
 import os
-import kagglehub
 import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
-from sklearn.model_selection import train_test_split
 from config import OUTPUT_DIR
+from . import cache
+from .compact import frame as compact_frame
+from .impute import knn
+from ..lazy import LazyModule
+from ..profile import Profile
+
+model_selection = LazyModule("sklearn.model_selection")
 
 
 class Iris:
     @staticmethod
-    def _load_raw():
-        """Load raw Iris dataset.
+    def _source():
+        """Download the Iris dataset via kagglehub.
 
         Returns:
-            tuple: (X, y) feature matrix and target series
+            str: Path to the source CSV file
         """
+        # Only needed on a dataset cache miss (see cache.load)
+        import kagglehub
         path = kagglehub.dataset_download("saurabh00007/iriscsv")
-        df = pd.read_csv(f"{path}/Iris.csv")
+        return f"{path}/Iris.csv"
+
+    @staticmethod
+    def _parse(csv_path):
+        """Parse the Iris CSV into features and target.
+
+        Args:
+            csv_path: Path to Iris.csv
+
+        Returns:
+            tuple: (X, y, encoders) - Iris has no categorical features, encoders is empty
+        """
+        df = pd.read_csv(csv_path)
 
         X = df.drop(columns=["Id", "Species"])
         y = df["Species"]
 
+        return X, y, {}
+
+    @staticmethod
+    def _load_raw():
+        """Load raw Iris dataset, using the parsed dataset cache when warm.
+
+        Returns:
+            tuple: (X, y) feature matrix and target series
+        """
+        X, y, _ = cache.load("iris", Iris._source, Iris._parse)
+
         return X, y
 
     @staticmethod
@@ -35,7 +64,7 @@ class Iris:
         """
         X, y = Iris._load_raw()
 
-        X_train, X_test, y_train, y_test = train_test_split(
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
             X, y, test_size=test_size, random_state=42
         )
 
@@ -56,11 +85,12 @@ class Iris:
         X, y = Iris._load_raw()
 
         # Introduce missing values
-        rng = np.random.default_rng(random_state)
-        mask = rng.random(X.shape) < mask_rate
-        X = X.mask(mask)
+        with Profile.span("dataset.mask"):
+            rng = np.random.default_rng(random_state)
+            mask = rng.random(X.shape) < mask_rate
+            X = X.mask(mask)
 
-        X_train, X_test, y_train, y_test = train_test_split(
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
             X, y, test_size=test_size, random_state=42
         )
 
@@ -114,11 +144,10 @@ class Iris:
         Returns:
             tuple: (X_train_imputed, X_test) - train imputed, test unchanged
         """
-        imputer = KNNImputer(n_neighbors=5, weights="distance")
         columns = X_train.columns
 
         X_train_imputed = pd.DataFrame(
-            imputer.fit_transform(X_train),
+            knn(X_train, n_neighbors=5, weights="distance"),
             columns=columns,
             index=X_train.index
         )
@@ -126,7 +155,8 @@ class Iris:
         return X_train_imputed, X_test
 
     @staticmethod
-    def input(mask_rate=0.0, test_size=0.33, reuse_dataset=False, impute=False, ignore_columns=None):
+    def input(mask_rate=0.0, test_size=0.33, reuse_dataset=False, impute=False, ignore_columns=None,
+              compact=False):
         """Load Iris dataset based on input parameters.
 
         Args:
@@ -135,16 +165,18 @@ class Iris:
             reuse_dataset: If True, load from previously exported CSV files
             impute: If True, impute missing values in training set only
             ignore_columns: List of column indices to drop (default None)
+            compact: If True, return float32 frames (see lib/dataset/compact.py)
 
         Returns:
             tuple: (X_train, X_test, y_train, y_test)
         """
-        if reuse_dataset:
-            X_train, X_test, y_train, y_test = Iris.load_from_csv(mask_rate)
-        elif mask_rate > 0:
-            X_train, X_test, y_train, y_test = Iris.load_masked(mask_rate=mask_rate, test_size=test_size)
-        else:
-            X_train, X_test, y_train, y_test = Iris.load(test_size=test_size)
+        with Profile.span("dataset.load"):
+            if reuse_dataset:
+                X_train, X_test, y_train, y_test = Iris.load_from_csv(mask_rate)
+            elif mask_rate > 0:
+                X_train, X_test, y_train, y_test = Iris.load_masked(mask_rate=mask_rate, test_size=test_size)
+            else:
+                X_train, X_test, y_train, y_test = Iris.load(test_size=test_size)
 
         # Drop ignored columns
         if ignore_columns:
@@ -154,7 +186,11 @@ class Iris:
 
         # Impute missing values in training set if impute is enabled
         if impute:
-            X_train, X_test = Iris._impute(X_train, X_test)
+            with Profile.span("dataset.impute"):
+                X_train, X_test = Iris._impute(X_train, X_test)
+
+        if compact:
+            X_train, X_test = compact_frame(X_train), compact_frame(X_test)
 
         return X_train, X_test, y_train, y_test
 
@@ -1,15 +1,268 @@
+import functools
+import inspect
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import joblib
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
-from sklearn.tree import plot_tree
-from sklearn.metrics import accuracy_score
-from sklearn.inspection import PartialDependenceDisplay, DecisionBoundaryDisplay
-from sklearn.manifold import MDS
-from sklearn.preprocessing import LabelEncoder
 from itertools import combinations
-from config import OUTPUT_DIR, VERBOSE
+from scipy import sparse
+from config import CACHE_DIR, OUTPUT_DIR, VERBOSE
+from ..lazy import LazyModule
+from ..model.proximity import proximity as forest_proximity_matrix
+from ..profile import Profile
+
+# Plotting and sklearn modules are imported on first draw, not with the package
+plt = LazyModule("matplotlib.pyplot")
+sns = LazyModule("seaborn")
+sk_tree = LazyModule("sklearn.tree")
+metrics = LazyModule("sklearn.metrics")
+inspection = LazyModule("sklearn.inspection")
+manifold = LazyModule("sklearn.manifold")
+preprocessing = LazyModule("sklearn.preprocessing")
+
+# Max samples drawn in the proximity heatmap (larger inputs are subsampled)
+PROXIMITY_HEATMAP_MAX = 500
+
+# Max samples embedded with metric MDS (larger inputs use a spectral embedding)
+PROXIMITY_MDS_MAX = 2000
+
+# Render pool size for flush() (0 = render in the calling process)
+RENDER_WORKERS = int(os.environ.get('RENDER_WORKERS', os.cpu_count() or 1))
+
+# Per-output-directory render manifest written by flush()
+MANIFEST = 'renders.json'
+
+# Entry point of the background renderer started by flush(detach=True)
+RENDER_SCRIPT = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'render.py'))
+
+# Content-addressed render cache: <hash>/spec.pkl (lazy specs) and <hash>/images/*.png
+RENDER_CACHE_DIR = os.environ.get('RENDER_CACHE_DIR', os.path.join(CACHE_DIR, 'renders'))
+
+# Upper bound on the summed size of the render cache entries (bytes); least recently used go first
+RENDER_CACHE_BYTES = int(os.environ.get('RENDER_CACHE_BYTES', 1024 * 1024 * 1024))
+
+# Part of every render hash: bump when shared drawing code (header/footer, styles) changes.
+# Each render method's own source is hashed as well, so editing it invalidates its entries
+RENDER_VERSION = 1
+
+# Default forest_trees grid layouts
+FOREST_TREE_GRIDS = [(2, 2), (3, 3), (4, 4)]
+
+
+def _outputs(arguments):
+    """Filenames a render call writes, from its bound arguments."""
+    if "filename" in arguments:
+        return [arguments["filename"]]
+    prefix = arguments["filename_prefix"]
+    if "grid_sizes" in arguments:
+        return [f"{prefix}_{rows}x{cols}.png" for rows, cols in arguments["grid_sizes"] or FOREST_TREE_GRIDS]
+    return [f"{prefix}.png"]
+
+
+@functools.lru_cache(maxsize=None)
+def _source_hash(method):
+    """Hash of a render method's source code (part of its cache key)."""
+    try:
+        return joblib.hash(inspect.getsource(method))
+    except (OSError, TypeError):
+        return None
+
+
+def _deferrable(method):
+    """Record calls as render jobs while Render.defer() is active.
+
+    A job's hash covers RENDER_VERSION, the render name and source, and all
+    bound arguments (data, fitted model, filenames), not the output directory,
+    so identical plots of different runs share one cache entry.
+    """
+    @functools.wraps(method)
+    def wrapper(cls, *args, **kwargs):
+        if cls._jobs is None:
+            with Profile.span(f"render.{method.__name__}"):
+                return method(cls, *args, **kwargs)
+
+        bound = inspect.signature(method).bind(cls, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(list(bound.arguments.items())[1:])
+        cls._jobs.append({
+            "render": method.__name__,
+            "hash": joblib.hash([RENDER_VERSION, method.__name__, _source_hash(method), arguments]),
+            "files": [os.path.basename(cls.get_output_path(name)) for name in _outputs(arguments)],
+            "args": args,
+            "kwargs": kwargs,
+            "context": (cls._mask_pct, cls._run_id, cls._compare_id)
+        })
+    return wrapper
+
+
+def _cached_images(key):
+    """Rendered files of a cache entry, or None if it was never rendered."""
+    directory = os.path.join(RENDER_CACHE_DIR, key, 'images')
+    if not os.path.isdir(directory):
+        return None
+    _touch(key)
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.png'))
+
+
+def _touch(key):
+    """Mark a cache entry as used (its directory mtime is the LRU clock)."""
+    try:
+        os.utime(os.path.join(RENDER_CACHE_DIR, key))
+    except OSError:
+        pass
+
+
+def _entry_bytes(directory):
+    total = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def prune_cache(max_bytes=None):
+    """Evict least recently used render cache entries until the cache fits max_bytes.
+
+    Entries are <hash>/ directories (spec.pkl and/or images/). Images already
+    linked into run directories stay there; an evicted lazy spec can no longer
+    be materialized.
+
+    Args:
+        max_bytes: Size bound (default RENDER_CACHE_BYTES)
+
+    Returns:
+        int: Number of evicted entries
+    """
+    max_bytes = RENDER_CACHE_BYTES if max_bytes is None else max_bytes
+    if not os.path.isdir(RENDER_CACHE_DIR):
+        return 0
+
+    entries = []
+    for name in os.listdir(RENDER_CACHE_DIR):
+        path = os.path.join(RENDER_CACHE_DIR, name)
+        try:
+            if os.path.isdir(path):
+                entries.append((os.stat(path).st_mtime, path, _entry_bytes(path)))
+        except OSError:
+            pass
+    total = sum(size for _, _, size in entries)
+
+    evicted = 0
+    for _, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def _link(src, dst):
+    """Atomically place a cached image at dst (hard link, copy across filesystems)."""
+    tmp_path = f"{dst}.{os.getpid()}.tmp"
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def _publish(job, images):
+    """Link cached images into the job's output directory.
+
+    Returns:
+        list: Output filenames
+    """
+    Render._mask_pct, Render._run_id, Render._compare_id = job["context"]
+    files = []
+    for image in images:
+        dst = Render.get_output_path(os.path.basename(image))
+        _link(image, dst)
+        files.append(os.path.basename(dst))
+    return files
+
+
+def _write_manifest(path, manifest):
+    """Atomically replace a render manifest."""
+    manifest["updated"] = round(time.time(), 3)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _init_render_worker():
+    """Pool initializer: headless backend, no recording."""
+    plt.switch_backend("Agg")
+    Render._jobs = None
+
+
+def _render_job(job):
+    """Execute one recorded render through the cache (runs in a pool worker).
+
+    The render is drawn into a temporary directory that is renamed to
+    <hash>/images when complete, so concurrent renders of the same hash never
+    expose partial files. Cache hits skip drawing.
+
+    Returns:
+        tuple: (output filenames, seconds)
+    """
+    start_time = time.time()
+    images = _cached_images(job["hash"])
+    if images is None:
+        entry = os.path.join(RENDER_CACHE_DIR, job["hash"])
+        os.makedirs(entry, exist_ok=True)
+        directory = tempfile.mkdtemp(dir=entry)
+        Render._directory = directory
+        try:
+            getattr(Render, job["render"])(*job["args"], **job["kwargs"])
+        except Exception:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        finally:
+            Render._directory = None
+            plt.close("all")
+        try:
+            os.rename(directory, os.path.join(entry, 'images'))
+        except OSError:
+            # Another process finished the same render first
+            shutil.rmtree(directory, ignore_errors=True)
+        images = _cached_images(job["hash"])
+    return _publish(job, images), time.time() - start_time
+
+
+def _spawn_background(pending, manifests, workers):
+    """Hand pending render jobs to a new `render.py --background` process.
+
+    The jobs are pickled into the render cache and the renderer is started as
+    a fresh interpreter in its own session with stdin/stdout/stderr on
+    /dev/null and no other inherited descriptors, so it outlives the caller
+    and never holds the caller's pipes open. Nothing is forked from the caller,
+    which may be multi-threaded (worker.py, the memory sampler).
+    """
+    os.makedirs(RENDER_CACHE_DIR, exist_ok=True)
+    fd, batch_path = tempfile.mkstemp(prefix='background-', suffix='.pkl', dir=RENDER_CACHE_DIR)
+    with os.fdopen(fd, 'wb') as f:
+        joblib.dump({"pending": pending, "manifests": manifests}, f)
+
+    subprocess.Popen(
+        [sys.executable, "-W", "ignore", RENDER_SCRIPT, "--background", batch_path, "--workers", str(workers)],
+        cwd=os.path.dirname(RENDER_SCRIPT),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
 
 
 class Render:
@@ -18,6 +271,8 @@ class Render:
     _mask_pct = 0
     _run_id = None
     _compare_id = None
+    _jobs = None
+    _directory = None
 
     @classmethod
     def set_mask(cls, mask_rate):
@@ -50,7 +305,7 @@ class Render:
     def get_output_path(cls, filename):
         """Get full output path based on compare_id, run_id, or legacy mode.
 
-        Priority: compare_id > run_id > legacy mode
+        Priority: render cache directory (set by render jobs) > compare_id > run_id > legacy mode
 
         Args:
             filename: Base filename
@@ -58,7 +313,9 @@ class Render:
         Returns:
             Full path to output file
         """
-        if cls._compare_id:
+        if cls._directory:
+            return os.path.join(cls._directory, filename)
+        elif cls._compare_id:
             # Output to compare directory
             output_dir = os.path.realpath(os.path.join(
                 os.path.dirname(__file__), '..', '..', 'frontend', 'public', 'output', 'compare', cls._compare_id
@@ -79,6 +336,188 @@ class Render:
             prefixed_name = f"{base}_{cls._mask_pct}{ext}"
             return os.path.join(OUTPUT_DIR, prefixed_name)
 
+    @classmethod
+    def defer(cls):
+        """Record subsequent render calls as jobs instead of drawing them.
+
+        Jobs keep the mask/run_id/compare_id active when they were recorded and
+        run when flush() is called.
+        """
+        cls._jobs = []
+
+    @classmethod
+    def deferred(cls):
+        """Whether render calls are currently being recorded."""
+        return cls._jobs is not None
+
+    @classmethod
+    def flush(cls, workers=None, detach=False, lazy=False):
+        """Run the recorded render jobs and stop recording.
+
+        Renders go through the content-addressed cache in RENDER_CACHE_DIR:
+        jobs whose hash was rendered before (by any run) are linked into the
+        output directory right away. The rest run on a process pool with the
+        Agg backend and finish in any order, or with lazy=True are stored as
+        specs and drawn on first request by materialize(). A MANIFEST
+        (renders.json) in each output directory lists every render with its
+        hash, files and status (pending, lazy, done, error), and is rewritten
+        as each render finishes.
+
+        Args:
+            workers: Pool size (default RENDER_WORKERS, 0 = render in this process)
+            detach: Render in a detached background process and return right away
+            lazy: Store render specs instead of rendering
+
+        Returns:
+            list: Manifest entries, or None when detached
+        """
+        jobs, cls._jobs = cls._jobs or [], None
+        if not jobs:
+            return []
+        workers = RENDER_WORKERS if workers is None else workers
+
+        # Manifests are written before rendering so readers see pending renders immediately
+        context = (cls._mask_pct, cls._run_id, cls._compare_id)
+        manifests = {}
+        entries = []
+        pending = []
+        for job in jobs:
+            cls._mask_pct, cls._run_id, cls._compare_id = job["context"]
+            path = cls.get_output_path(MANIFEST)
+            manifest = manifests.setdefault(path, {"status": "done", "started": round(time.time(), 3), "renders": []})
+            entry = {"render": job["render"], "hash": job["hash"], "status": "pending", "files": job["files"]}
+
+            images = _cached_images(job["hash"])
+            if images is not None:
+                entry.update(status="done", cached=True, files=_publish(job, images))
+            elif lazy:
+                spec_path = os.path.join(RENDER_CACHE_DIR, job["hash"], 'spec.pkl')
+                if not os.path.exists(spec_path):
+                    os.makedirs(os.path.dirname(spec_path), exist_ok=True)
+                    spec = {key: job[key] for key in ("render", "hash", "args", "kwargs")}
+                    joblib.dump(spec, f"{spec_path}.{os.getpid()}.tmp")
+                    os.replace(f"{spec_path}.{os.getpid()}.tmp", spec_path)
+                else:
+                    _touch(job["hash"])
+                entry["status"] = "lazy"
+            else:
+                manifest["status"] = "rendering"
+                pending.append((job, path, entry))
+
+            manifest["renders"].append(entry)
+            entries.append(entry)
+        cls._mask_pct, cls._run_id, cls._compare_id = context
+        for path, manifest in manifests.items():
+            _write_manifest(path, manifest)
+        if lazy:
+            prune_cache()
+
+        if pending and detach:
+            _spawn_background(pending, manifests, workers)
+            return None
+
+        cls._run_jobs(pending, manifests, workers)
+        return entries
+
+    @classmethod
+    def _run_jobs(cls, pending, manifests, workers):
+        """Execute (job, manifest path, entry) items, updating the manifest as each one finishes."""
+        def finish(index, result=None, error=None):
+            _, path, entry = pending[index]
+            if error is None:
+                entry["status"] = "done"
+                entry["files"], seconds = result
+                entry["seconds"] = round(seconds, 3)
+            else:
+                entry["status"] = "error"
+                entry["error"] = str(error)
+            manifest = manifests[path]
+            if all(e["status"] != "pending" for e in manifest["renders"]):
+                manifest["status"] = "done"
+            _write_manifest(path, manifest)
+
+        if not pending:
+            return
+
+        if workers == 0:
+            context = (cls._mask_pct, cls._run_id, cls._compare_id)
+            for index, (job, _, _) in enumerate(pending):
+                try:
+                    finish(index, _render_job(job))
+                except Exception as e:
+                    finish(index, error=e)
+            cls._mask_pct, cls._run_id, cls._compare_id = context
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+                futures = {pool.submit(_render_job, job): index for index, (job, _, _) in enumerate(pending)}
+                for future in as_completed(futures):
+                    error = future.exception()
+                    finish(futures[future], None if error else future.result(), error)
+        prune_cache()
+
+    @classmethod
+    def run_background(cls, batch_path, workers=None):
+        """Run a job batch written by flush(detach=True) (render.py --background).
+
+        Args:
+            batch_path: Pickled {"pending", "manifests"}; removed once loaded
+            workers: Pool size (default RENDER_WORKERS, 0 = render in this process)
+        """
+        batch = joblib.load(batch_path)
+        os.remove(batch_path)
+        cls._run_jobs(batch["pending"], batch["manifests"], RENDER_WORKERS if workers is None else workers)
+
+    @classmethod
+    def materialize(cls, filename):
+        """Draw a lazily recorded image of the current run or compare directory.
+
+        Looks up the manifest entry that lists filename, renders its stored spec
+        through the cache (a no-op if any run already rendered the same hash)
+        and links the result into the output directory.
+
+        Args:
+            filename: Image filename listed in the directory's renders.json
+
+        Returns:
+            list: Output filenames written for the entry
+
+        Raises:
+            FileNotFoundError: If no manifest entry lists filename, or its spec is missing
+        """
+        path = cls.get_output_path(MANIFEST)
+        with open(path) as f:
+            manifest = json.load(f)
+        index = next((i for i, entry in enumerate(manifest["renders"]) if filename in entry["files"]), None)
+        if index is None:
+            raise FileNotFoundError(f"No render of {filename} in {path}")
+
+        entry = manifest["renders"][index]
+        if entry["status"] == "done" and all(
+            os.path.exists(os.path.join(os.path.dirname(path), name)) for name in entry["files"]
+        ):
+            return entry["files"]
+
+        spec_path = os.path.join(RENDER_CACHE_DIR, entry["hash"], 'spec.pkl')
+        if _cached_images(entry["hash"]) is None and not os.path.exists(spec_path):
+            raise FileNotFoundError(f"Render spec {entry['hash']} not found in {RENDER_CACHE_DIR}")
+
+        context = (cls._mask_pct, cls._run_id, cls._compare_id)
+        job = {"hash": entry["hash"], "context": context}
+        if _cached_images(entry["hash"]) is None:
+            job.update(joblib.load(spec_path))
+        try:
+            files, seconds = _render_job(job)
+        finally:
+            cls._mask_pct, cls._run_id, cls._compare_id = context
+
+        # Re-read so concurrent materializations of other entries are kept
+        with open(path) as f:
+            manifest = json.load(f)
+        manifest["renders"][index].update(status="done", files=files, seconds=round(seconds, 3))
+        _write_manifest(path, manifest)
+        prune_cache()
+        return files
+
     @classmethod
     def _filename(cls, name):
         """Build output path and ensure directory exists.
@@ -129,6 +568,7 @@ class Render:
         cls._axes = None
 
     @classmethod
+    @_deferrable
     def heatmap(cls, X, filename="feature_correlation_heatmap.png"):
         """Render feature correlation heatmap.
 
@@ -143,6 +583,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def clustering(cls, X, y, filename="clustering.png"):
         """Render MDS clustering visualization based on feature space.
 
@@ -158,12 +599,12 @@ class Render:
         X_scaled = StandardScaler().fit_transform(X_filled)
 
         # Apply MDS
-        mds = MDS(n_components=2, random_state=42, normalized_stress="auto")
+        mds = manifold.MDS(n_components=2, random_state=42, normalized_stress="auto")
         embedding = mds.fit_transform(X_scaled)
 
         # Plot
         cls.header(figsize=(10, 8))
-        scatter = plt.scatter(embedding[:, 0], embedding[:, 1], c=LabelEncoder().fit_transform(y),
+        scatter = plt.scatter(embedding[:, 0], embedding[:, 1], c=preprocessing.LabelEncoder().fit_transform(y),
                              cmap="viridis", alpha=0.7, s=50)
         plt.colorbar(scatter, label="Class")
         plt.xlabel("MDS 1")
@@ -171,6 +612,7 @@ class Render:
         cls.footer(filename, title="Feature Space Clustering (MDS)")
 
     @classmethod
+    @_deferrable
     def tree(cls, clf, feature_names, class_names, filename="decision_tree.png"):
         """Render single decision tree visualization.
 
@@ -181,7 +623,7 @@ class Render:
             filename: Output filename
         """
         cls.header(figsize=(20, 12))
-        plot_tree(
+        sk_tree.plot_tree(
             clf,
             feature_names=feature_names,
             class_names=class_names,
@@ -193,6 +635,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def tree_importance(cls, clf, feature_names, filename="tree_feature_importance.png"):
         """Render feature importance bar chart for decision tree.
 
@@ -210,6 +653,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def tree_boundaries(cls, clf, X, y, feature_names, filename_prefix="tree_boundaries"):
         """Render decision boundaries for all feature pairs.
 
@@ -220,7 +664,7 @@ class Render:
             feature_names: List of feature names
             filename_prefix: Prefix for output filenames
         """
-        le = LabelEncoder()
+        le = preprocessing.LabelEncoder()
         y_encoded = le.fit_transform(y)
         class_names = le.classes_
 
@@ -242,7 +686,7 @@ class Render:
             clf_2d = clf.__class__(random_state=42)
             clf_2d.fit(X_pair, y)
 
-            DecisionBoundaryDisplay.from_estimator(
+            inspection.DecisionBoundaryDisplay.from_estimator(
                 clf_2d, X_pair, ax=ax,
                 response_method="predict",
                 cmap="RdYlBu",
@@ -262,6 +706,7 @@ class Render:
         cls.footer(f"{filename_prefix}.png", title="Decision Boundaries")
 
     @classmethod
+    @_deferrable
     def forest_importance(cls, clf, feature_names, filename="forest_feature_importance.png", color="forestgreen", title="Random Forest Feature Importance"):
         """Render feature importance bar chart.
 
@@ -281,6 +726,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def forest_trees(cls, clf, feature_names, class_names, grid_sizes=None, filename_prefix="forest_trees"):
         """Render sample trees from random forest in grid layouts.
 
@@ -292,7 +738,7 @@ class Render:
             filename_prefix: Prefix for output filenames
         """
         if grid_sizes is None:
-            grid_sizes = [(2, 2), (3, 3), (4, 4)]
+            grid_sizes = FOREST_TREE_GRIDS
 
         n_estimators = len(clf.estimators_)
         for rows, cols in grid_sizes:
@@ -304,7 +750,7 @@ class Render:
                 subplots=(rows, cols)
             )
             for idx, ax in enumerate(axes.flatten()):
-                plot_tree(
+                sk_tree.plot_tree(
                     clf.estimators_[idx],
                     feature_names=feature_names,
                     class_names=class_names,
@@ -321,6 +767,7 @@ class Render:
             )
 
     @classmethod
+    @_deferrable
     def forest_pdp(cls, clf, X, feature_names, filename="forest_pdp.png", target=0):
         """Render Partial Dependence Plots for random forest.
 
@@ -336,7 +783,7 @@ class Render:
             figsize=(4 * n_features, 4),
             subplots=(1, n_features)
         )
-        PartialDependenceDisplay.from_estimator(
+        inspection.PartialDependenceDisplay.from_estimator(
             clf, X, features=range(n_features),
             feature_names=feature_names,
             ax=axes,
@@ -346,6 +793,7 @@ class Render:
         cls.footer(filename, title=f"Partial Dependence Plots (target={target})")
 
     @classmethod
+    @_deferrable
     def forest_ice(cls, clf, X, feature_names, filename="forest_ice.png", target=0):
         """Render Individual Conditional Expectation plots for random forest.
 
@@ -361,7 +809,7 @@ class Render:
             figsize=(4 * n_features, 4),
             subplots=(1, n_features)
         )
-        PartialDependenceDisplay.from_estimator(
+        inspection.PartialDependenceDisplay.from_estimator(
             clf, X, features=range(n_features),
             feature_names=feature_names,
             ax=axes,
@@ -373,6 +821,7 @@ class Render:
         cls.footer(filename, title=f"ICE Plots (target={target})")
 
     @classmethod
+    @_deferrable
     def forest_oob(cls, clf, filename="forest_oob.png"):
         """Render OOB error visualization for random forest.
 
@@ -396,28 +845,30 @@ class Render:
         cls.footer(filename)
 
     @classmethod
-    def forest_proximity(cls, clf, X, filename="forest_proximity.png"):
+    @_deferrable
+    def forest_proximity(cls, clf, X, filename="forest_proximity.png", proximity=None):
         """Render proximity matrix heatmap for random forest.
 
+        Inputs larger than PROXIMITY_HEATMAP_MAX are drawn from an evenly spaced
+        sample of rows.
+
         Args:
             clf: Trained RandomForestClassifier
             X: Feature data
             filename: Output filename
+            proximity: Optional precomputed proximity matrix (dense or sparse top-k)
         """
-        # Compute proximity matrix
-        leaves = clf.apply(X)
         n_samples = len(X)
-        proximity = np.zeros((n_samples, n_samples))
-
-        for tree_leaves in leaves.T:
-            for i in range(n_samples):
-                for j in range(i, n_samples):
-                    if tree_leaves[i] == tree_leaves[j]:
-                        proximity[i, j] += 1
-                        proximity[j, i] += 1
-
-        proximity /= clf.n_estimators
-        np.fill_diagonal(proximity, 1)
+        if n_samples > PROXIMITY_HEATMAP_MAX:
+            sample = np.linspace(0, n_samples - 1, PROXIMITY_HEATMAP_MAX).astype(int)
+            if proximity is not None and not sparse.issparse(proximity):
+                proximity = proximity[np.ix_(sample, sample)]
+            else:
+                proximity = forest_proximity_matrix(clf, X.iloc[sample])
+        elif proximity is None:
+            proximity = forest_proximity_matrix(clf, X)
+        elif sparse.issparse(proximity):
+            proximity = proximity.toarray()
 
         cls.header(figsize=(10, 8))
         sns.heatmap(proximity, cmap="YlGnBu", square=True,
@@ -427,47 +878,55 @@ class Render:
         cls.footer(filename, title="Random Forest Proximity Matrix")
 
     @classmethod
-    def forest_clustering(cls, clf, X, y, filename="forest_clustering.png"):
-        """Render t-SNE clustering visualization based on proximity matrix.
+    @_deferrable
+    def forest_clustering(cls, clf, X, y, filename="forest_clustering.png", proximity=None, top_k=None):
+        """Render clustering visualization based on proximity matrix.
+
+        Dense proximities up to PROXIMITY_MDS_MAX samples are embedded with MDS of
+        the dissimilarity (1 - proximity). Sparse top-k proximities and larger inputs
+        are embedded with a spectral embedding of the proximity graph.
 
         Args:
             clf: Trained RandomForestClassifier
             X: Feature data
             y: Target labels
             filename: Output filename
+            proximity: Optional precomputed proximity matrix (dense or sparse top-k)
+            top_k: Neighbors kept per row when the proximity is computed here (None = dense)
         """
-        # Compute proximity matrix
-        leaves = clf.apply(X)
-        n_samples = len(X)
-        proximity = np.zeros((n_samples, n_samples))
-
-        for tree_leaves in leaves.T:
-            for i in range(n_samples):
-                for j in range(i, n_samples):
-                    if tree_leaves[i] == tree_leaves[j]:
-                        proximity[i, j] += 1
-                        proximity[j, i] += 1
-
-        proximity /= clf.n_estimators
-        np.fill_diagonal(proximity, 1)
-
-        # Convert proximity to dissimilarity (1 - proximity)
-        dissimilarity = 1 - proximity
+        if proximity is None:
+            proximity = forest_proximity_matrix(clf, X, top_k=top_k)
+
+        if sparse.issparse(proximity) or len(X) > PROXIMITY_MDS_MAX:
+            # Symmetrize the (possibly row-wise top-k) proximity graph
+            affinity = sparse.csr_matrix(proximity)
+            affinity = affinity.maximum(affinity.T)
+            embedding = manifold.SpectralEmbedding(
+                n_components=2, affinity="precomputed", random_state=42
+            ).fit_transform(affinity)
+            title = "Random Forest Clustering (Spectral Embedding of Proximity)"
+            xlabel, ylabel = "Component 1", "Component 2"
+        else:
+            # Convert proximity to dissimilarity (1 - proximity)
+            dissimilarity = 1 - proximity
 
-        # Apply MDS on dissimilarity matrix
-        mds = MDS(n_components=2, dissimilarity="precomputed", random_state=42, normalized_stress="auto")
-        embedding = mds.fit_transform(dissimilarity)
+            # Apply MDS on dissimilarity matrix
+            mds = manifold.MDS(n_components=2, dissimilarity="precomputed", random_state=42, normalized_stress="auto")
+            embedding = mds.fit_transform(dissimilarity)
+            title = "Random Forest Clustering (MDS of Proximity)"
+            xlabel, ylabel = "MDS 1", "MDS 2"
 
         # Plot
         cls.header(figsize=(10, 8))
-        scatter = plt.scatter(embedding[:, 0], embedding[:, 1], c=LabelEncoder().fit_transform(y),
+        scatter = plt.scatter(embedding[:, 0], embedding[:, 1], c=preprocessing.LabelEncoder().fit_transform(y),
                              cmap="viridis", alpha=0.7, s=50)
         plt.colorbar(scatter, label="Class")
-        plt.xlabel("MDS 1")
-        plt.ylabel("MDS 2")
-        cls.footer(filename, title="Random Forest Clustering (MDS of Proximity)")
+        plt.xlabel(xlabel)
+        plt.ylabel(ylabel)
+        cls.footer(filename, title=title)
 
     @classmethod
+    @_deferrable
     def gradient_forest_importance(cls, importances, feature_names, filename="gradient_forest_feature_importance.png"):
         """Render feature importance bar chart for gradient boosted trees.
 
@@ -485,6 +944,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def gradient_forest_staged(cls, clf, X_train, X_test, y_train, y_test, filename="gradient_forest_staged_accuracy.png"):
         """Render staged training accuracy for gradient boosting.
 
@@ -499,9 +959,9 @@ class Render:
         train_scores = []
         test_scores = []
         for y_pred_staged in clf.staged_predict(X_train):
-            train_scores.append(accuracy_score(y_train, y_pred_staged))
+            train_scores.append(metrics.accuracy_score(y_train, y_pred_staged))
         for y_pred_staged in clf.staged_predict(X_test):
-            test_scores.append(accuracy_score(y_test, y_pred_staged))
+            test_scores.append(metrics.accuracy_score(y_test, y_pred_staged))
 
         plt.plot(range(1, len(train_scores) + 1), train_scores, label="Train", color="blue")
         plt.plot(range(1, len(test_scores) + 1), test_scores, label="Test", color="red")
@@ -512,6 +972,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def gradient_forest_trees(cls, clf, feature_names, filename="gradient_forest_trees.png"):
         """Render sample trees from gradient boosting by class and iteration.
 
@@ -529,7 +990,7 @@ class Render:
         for class_idx in range(n_classes):
             for iter_idx in range(4):
                 ax = axes[class_idx, iter_idx]
-                plot_tree(
+                sk_tree.plot_tree(
                     clf.estimators_[iter_idx, class_idx],
                     feature_names=feature_names,
                     filled=True,
@@ -542,6 +1003,7 @@ class Render:
         cls.footer(filename, title="Gradient Boosting Sample Trees (by class and iteration)")
 
     @classmethod
+    @_deferrable
     def compare_accuracy(cls, mask_values, results, colors, filename="accuracy_comparison.png"):
         """Render accuracy comparison across models.
 
@@ -570,6 +1032,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def compare_accuracy_impute(cls, mask_values, results, colors, filename="accuracy_comparison_impute.png"):
         """Render accuracy comparison with imputation variants.
 
@@ -602,6 +1065,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def compare_accuracy_bars(cls, models, filename="accuracy_bars.png"):
         """Render bar chart comparing train vs compare accuracy for each model.
 
@@ -673,6 +1137,7 @@ class Render:
         cls.footer(filename)
 
     @classmethod
+    @_deferrable
     def compare_accuracy_diff(cls, models, filename="accuracy_diff.png"):
         """Render visual representation of accuracy differences (ratio chart).
 
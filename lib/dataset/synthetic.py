@@ -0,0 +1,389 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import joblib
+import numpy as np
+import pandas as pd
+from config import CACHE_DIR, OUTPUT_DIR, VERBOSE
+from . import cache
+from .compact import frame as compact_frame
+from .impute import knn
+from ..lazy import LazyModule
+from ..profile import Profile
+
+model_selection = LazyModule("sklearn.model_selection")
+
+# Generation parameters (override with Synthetic.configure() / --dataset-config)
+DEFAULTS = {
+    "rows": 100_000,       # total rows (train + test)
+    "features": 20,        # total feature columns
+    "categorical": 4,      # how many of them are categorical (integer codes)
+    "cardinality": 8,      # levels per categorical feature
+    "classes": 2,          # target classes
+    "imbalance": 1.0,      # largest / smallest class frequency (1.0 = balanced)
+    "informative": None,   # numeric features that depend on the class (default: half of them)
+    "separation": 1.0,     # distance scale between class centroids
+    "seed": 42
+}
+
+# Rows generated per chunk. Part of the data format: each chunk draws from its own
+# seeded stream, so the generated values depend on it (not on memory or workers)
+CHUNK_ROWS = 262_144
+
+TARGET = "label"
+
+
+def resolve(config=None):
+    """Merge a partial configuration with DEFAULTS and validate it.
+
+    Args:
+        config: Optional dict of overrides (keys of DEFAULTS)
+
+    Returns:
+        dict: Complete configuration
+
+    Raises:
+        ValueError: On unknown keys or out-of-range values
+    """
+    config = dict(config or {})
+    unknown = set(config) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown synthetic dataset options: {sorted(unknown)}")
+
+    resolved = {**DEFAULTS, **config}
+    numeric = resolved["features"] - resolved["categorical"]
+    if resolved["informative"] is None:
+        resolved["informative"] = max(1, numeric // 2) if numeric else 0
+
+    if resolved["rows"] < 2 or resolved["features"] < 1 or resolved["classes"] < 2:
+        raise ValueError("Synthetic dataset needs rows >= 2, features >= 1 and classes >= 2")
+    if not 0 <= resolved["categorical"] <= resolved["features"]:
+        raise ValueError("categorical must be between 0 and features")
+    if resolved["categorical"] and resolved["cardinality"] < 2:
+        raise ValueError("cardinality must be at least 2")
+    if not 0 <= resolved["informative"] <= numeric:
+        raise ValueError("informative must be between 0 and the number of numeric features")
+    if resolved["imbalance"] < 1.0:
+        raise ValueError("imbalance must be >= 1.0")
+    return resolved
+
+
+def _fingerprint(config):
+    """Cache key of a resolved configuration (includes the chunk layout)."""
+    payload = json.dumps({**config, "chunk_rows": CHUNK_ROWS}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _model(config):
+    """Class priors, numeric centroids and per-class categorical distributions.
+
+    Drawn from the seed alone, so every chunk shares the same underlying model.
+    """
+    rng = np.random.default_rng([config["seed"], 0])
+    classes = config["classes"]
+
+    # Geometric priors: class 0 is imbalance times as frequent as the last class
+    priors = config["imbalance"] ** -(np.arange(classes) / (classes - 1))
+    priors /= priors.sum()
+
+    centroids = rng.standard_normal((classes, config["informative"])) * config["separation"]
+    categories = rng.dirichlet(np.ones(config["cardinality"]), size=(config["categorical"], classes)) \
+        if config["categorical"] else None
+    return priors, centroids, categories
+
+
+def _columns(config):
+    numeric = config["features"] - config["categorical"]
+    return [f"num_{i:03d}" for i in range(numeric)] + [f"cat_{i:03d}" for i in range(config["categorical"])]
+
+
+def _csv_prefix(mask_rate, config):
+    """Filename prefix of the --use-output CSVs, keyed by the configuration fingerprint."""
+    return f"synthetic_{_fingerprint(config)}_masked_{int(mask_rate * 100)}"
+
+
+def _generate(directory, config):
+    """Generate a dataset chunk by chunk into memory-mapped .npy columns.
+
+    Writes the cache.read() layout (X_<i>.npy, y.npy, encoders.pkl, meta.json)
+    under a temporary name and renames it into place. Peak memory is one chunk.
+    """
+    rows = config["rows"]
+    columns = _columns(config)
+    numeric = config["features"] - config["categorical"]
+    priors, centroids, categories = _model(config)
+    labels = np.array([f"class_{k}" for k in range(config["classes"])])
+
+    tmp_dir = f"{directory}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    X_files = [
+        np.lib.format.open_memmap(os.path.join(tmp_dir, f"X_{i:03d}.npy"), mode="w+",
+                                  dtype=np.float64 if i < numeric else np.int64, shape=(rows,))
+        for i in range(len(columns))
+    ]
+    y_file = np.lib.format.open_memmap(os.path.join(tmp_dir, 'y.npy'), mode="w+",
+                                       dtype=labels.dtype, shape=(rows,))
+
+    for chunk, start in enumerate(range(0, rows, CHUNK_ROWS)):
+        end = min(start + CHUNK_ROWS, rows)
+        n = end - start
+        rng = np.random.default_rng([config["seed"], chunk + 1])
+
+        y = rng.choice(config["classes"], size=n, p=priors)
+        y_file[start:end] = labels[y]
+
+        values = rng.standard_normal((n, numeric))
+        values[:, :config["informative"]] += centroids[y]
+        for i in range(numeric):
+            X_files[i][start:end] = values[:, i]
+
+        for j in range(config["categorical"]):
+            codes = np.empty(n, dtype=np.int64)
+            for k in range(config["classes"]):
+                members = y == k
+                codes[members] = rng.choice(config["cardinality"], size=int(members.sum()), p=categories[j, k])
+            X_files[numeric + j][start:end] = codes
+
+        if VERBOSE:
+            print(f"Synthetic: generated {end:,}/{rows:,} rows", file=sys.stderr)
+
+    for array in X_files + [y_file]:
+        array.flush()
+    del X_files, y_file
+
+    joblib.dump({}, os.path.join(tmp_dir, 'encoders.pkl'))
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+        json.dump({"columns": columns, "target": TARGET, "rows": rows, "config": config}, f, indent=2)
+
+    try:
+        os.replace(tmp_dir, directory)
+    except OSError:
+        # Another process already generated this entry
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class Synthetic:
+    _config = resolve()
+    _loaded = {}
+
+    @staticmethod
+    def configure(**config):
+        """Set the generation parameters (unspecified keys fall back to DEFAULTS).
+
+        Args:
+            **config: Any of rows, features, categorical, cardinality, classes,
+                imbalance, informative, separation, seed
+
+        Returns:
+            bool: True if the configuration changed
+        """
+        resolved = resolve(config)
+        changed = resolved != Synthetic._config
+        Synthetic._config = resolved
+        return changed
+
+    @staticmethod
+    def config():
+        """Return the current resolved configuration."""
+        return dict(Synthetic._config)
+
+    @staticmethod
+    def _load_raw():
+        """Load the configured dataset, generating it into the cache on first use.
+
+        Entries live in CACHE_DIR/synthetic/<fingerprint>/ and are memory-mapped
+        without copying: the returned frames are shared, backed by read-only
+        column files, and must not be modified in place.
+
+        Returns:
+            tuple: (X, y) feature matrix and target series
+        """
+        directory = os.path.join(CACHE_DIR, "synthetic", _fingerprint(Synthetic._config))
+        if directory not in Synthetic._loaded:
+            if not os.path.exists(os.path.join(directory, 'meta.json')):
+                os.makedirs(os.path.dirname(directory), exist_ok=True)
+                _generate(directory, Synthetic._config)
+            X, y, _ = cache.read(directory, copy=False)
+            Synthetic._loaded[directory] = (X, y)
+
+        return Synthetic._loaded[directory]
+
+    @staticmethod
+    def load(test_size=0.33):
+        """Load the synthetic dataset and return train/test splits.
+
+        Args:
+            test_size: Fraction of data for test set (default 0.33)
+
+        Returns:
+            tuple: (X_train, X_test, y_train, y_test)
+        """
+        X, y = Synthetic._load_raw()
+
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
+            X, y, test_size=test_size, random_state=42
+        )
+
+        return X_train, X_test, y_train, y_test
+
+    @staticmethod
+    def load_masked(mask_rate=0.1, test_size=0.33, random_state=42, compact=False):
+        """Load the synthetic dataset with missing data.
+
+        The mask is drawn one column at a time so no rows x features boolean
+        matrix is allocated.
+
+        Args:
+            mask_rate: Fraction of values to set as missing (default 0.1)
+            test_size: Fraction of data for test set (default 0.33)
+            random_state: Random seed for reproducibility
+            compact: If True, mask into float32 columns instead of float64
+
+        Returns:
+            tuple: (X_train, X_test, y_train, y_test)
+        """
+        X, y = Synthetic._load_raw()
+
+        with Profile.span("dataset.mask"):
+            rng = np.random.default_rng(random_state)
+            dtype = np.float32 if compact else np.float64
+            X = pd.DataFrame({
+                col: np.where(rng.random(len(X)) < mask_rate, np.nan, X[col].to_numpy(dtype=dtype))
+                for col in X.columns
+            })
+
+        X_train, X_test, y_train, y_test = model_selection.train_test_split(
+            X, y, test_size=test_size, random_state=42
+        )
+
+        return X_train, X_test, y_train, y_test
+
+    @staticmethod
+    def load_from_csv(mask_rate):
+        """Load dataset from previously exported CSV files.
+
+        Only files exported with the current configuration are found.
+
+        Args:
+            mask_rate: Mask rate used when exporting (0.0-1.0)
+
+        Returns:
+            tuple: (X_train, X_test, y_train, y_test)
+
+        Raises:
+            FileNotFoundError: If train or test CSV files don't exist
+        """
+        prefix = _csv_prefix(mask_rate, Synthetic._config)
+        train_path = f"{OUTPUT_DIR}/{prefix}_train.csv"
+        test_path = f"{OUTPUT_DIR}/{prefix}_test.csv"
+
+        if not os.path.exists(train_path):
+            raise FileNotFoundError(f"Train dataset not found: {train_path}")
+        if not os.path.exists(test_path):
+            raise FileNotFoundError(f"Test dataset not found: {test_path}")
+
+        train_df = pd.read_csv(train_path)
+        test_df = pd.read_csv(test_path)
+
+        X_train = train_df.drop(columns=[TARGET])
+        y_train = train_df[TARGET]
+        X_test = test_df.drop(columns=[TARGET])
+        y_test = test_df[TARGET]
+
+        return X_train, X_test, y_train, y_test
+
+    @staticmethod
+    def _impute(X_train, X_test):
+        """Impute missing values in training data using KNN.
+
+        Args:
+            X_train: Training feature DataFrame with potential NaN values
+            X_test: Test feature DataFrame with potential NaN values
+
+        Returns:
+            tuple: (X_train_imputed, X_test) - train imputed, test unchanged
+        """
+        X_train_imputed = pd.DataFrame(
+            knn(X_train, n_neighbors=5, weights="distance"),
+            columns=X_train.columns,
+            index=X_train.index
+        )
+
+        return X_train_imputed, X_test
+
+    @staticmethod
+    def input(mask_rate=0.0, test_size=0.33, reuse_dataset=False, impute=False, ignore_columns=None,
+              compact=False):
+        """Load the synthetic dataset based on input parameters.
+
+        Args:
+            mask_rate: Fraction of values to mask (0.0 = no masking)
+            test_size: Fraction of data for test set (default 0.33)
+            reuse_dataset: If True, load from previously exported CSV files
+            impute: If True, impute missing values in training set only
+            ignore_columns: List of column indices to drop (default None)
+            compact: If True, return C-contiguous float32 frames (see compact.frame)
+
+        Returns:
+            tuple: (X_train, X_test, y_train, y_test)
+        """
+        with Profile.span("dataset.load"):
+            if reuse_dataset:
+                X_train, X_test, y_train, y_test = Synthetic.load_from_csv(mask_rate)
+            elif mask_rate > 0:
+                X_train, X_test, y_train, y_test = Synthetic.load_masked(
+                    mask_rate=mask_rate, test_size=test_size, compact=compact
+                )
+            else:
+                X_train, X_test, y_train, y_test = Synthetic.load(test_size=test_size)
+
+        # Drop ignored columns
+        if ignore_columns:
+            cols_to_drop = [X_train.columns[i] for i in ignore_columns if i < len(X_train.columns)]
+            X_train = X_train.drop(columns=cols_to_drop)
+            X_test = X_test.drop(columns=cols_to_drop)
+
+        # Impute missing values in training set if impute is enabled
+        if impute:
+            with Profile.span("dataset.impute"):
+                X_train, X_test = Synthetic._impute(X_train, X_test)
+
+        if compact:
+            X_train, X_test = compact_frame(X_train), compact_frame(X_test)
+
+        return X_train, X_test, y_train, y_test
+
+    @staticmethod
+    def export(X_train, X_test, y_train, y_test, mask_rate=0.0, run_id=None):
+        """Export dataset to CSV files.
+
+        Args:
+            X_train, X_test: Feature DataFrames
+            y_train, y_test: Target Series
+            mask_rate: Mask rate for filename (0.0-1.0)
+            run_id: Run identifier. If provided, outputs to frontend/public/output/<run_id>/
+        """
+        if run_id:
+            output_dir = os.path.realpath(os.path.join(
+                os.path.dirname(__file__), '..', '..', 'frontend', 'public', 'output', run_id
+            ))
+            os.makedirs(output_dir, exist_ok=True)
+            train_path = f"{output_dir}/train.csv"
+            test_path = f"{output_dir}/test.csv"
+        else:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            prefix = _csv_prefix(mask_rate, Synthetic._config)
+            train_path = f"{OUTPUT_DIR}/{prefix}_train.csv"
+            test_path = f"{OUTPUT_DIR}/{prefix}_test.csv"
+
+        train_df = X_train.copy()
+        train_df[TARGET] = y_train.values
+        train_df.to_csv(train_path, index=False)
+
+        test_df = X_test.copy()
+        test_df[TARGET] = y_test.values
+        test_df.to_csv(test_path, index=False)
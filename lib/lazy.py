@@ -0,0 +1,65 @@
+import importlib
+import importlib.util
+
+# Every deferred module path, so long-lived processes can import them up front (warm())
+_MODULES = []
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access.
+
+    Used for heavy plotting and sklearn modules so `import lib` and scripts that
+    never draw or fit do not pay for them:
+
+        plt = LazyModule("matplotlib.pyplot")
+        plt.figure()  # matplotlib.pyplot is imported here
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        _MODULES.append(name)
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+class LazyFunction:
+    """Facade attribute resolved from `<module>.<name>` on first access.
+
+    Replaces itself with a staticmethod of the real function, so later lookups
+    cost nothing:
+
+        class Model:
+            report = LazyFunction(".report", "report", package=__name__)
+    """
+
+    def __init__(self, module, name, package=None):
+        self._module = module
+        self._name = name
+        self._package = package
+        self._attr = None
+        _MODULES.append(importlib.util.resolve_name(module, package) if module.startswith('.') else module)
+
+    def __set_name__(self, owner, attr):
+        self._attr = attr
+
+    def __get__(self, instance, owner):
+        value = getattr(importlib.import_module(self._module, self._package), self._name)
+        setattr(owner, self._attr, staticmethod(value))
+        return value
+
+
+def warm():
+    """Import every deferred module now (worker.py calls this once at startup)."""
+    for name in _MODULES:
+        importlib.import_module(name)
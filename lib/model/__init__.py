@@ -1,8 +1,21 @@
-from .report import report, save, save_runtime, save_id
+import functools
+from . import cache, registry
+from ..lazy import LazyFunction
+
+# sklearn-backed helpers are imported on first use (see lib/lazy.py)
+_lazy = functools.partial(LazyFunction, package=__name__)
 
 
 class Model:
-    report = staticmethod(report)
-    save = staticmethod(save)
-    save_runtime = staticmethod(save_runtime)
-    save_id = staticmethod(save_id)
+    report = _lazy(".report", "report")
+    save = _lazy(".report", "save")
+    save_runtime = _lazy(".report", "save_runtime")
+    save_id = _lazy(".report", "save_id")
+    save_timings = _lazy(".report", "save_timings")
+    load = staticmethod(cache.load)
+    proximity = _lazy(".proximity", "proximity")
+    compile = _lazy(".compiled", "compile")
+    load_compiled = _lazy(".compiled", "load")
+    load_config = _lazy(".estimators", "load_config")
+    build = _lazy(".estimators", "build")
+    get_run = staticmethod(registry.get)
@@ -0,0 +1,75 @@
+import os
+from collections import OrderedDict
+import joblib
+
+# Upper bound on the summed on-disk size of cached models (bytes)
+MAX_BYTES = int(os.environ.get('MODEL_CACHE_BYTES', 512 * 1024 * 1024))
+
+# (realpath, mmap_mode) -> (mtime_ns, size, model), least recently used first
+_models = OrderedDict()
+_total_bytes = 0
+
+
+def _evict(key):
+    global _total_bytes
+    _, size, _ = _models.pop(key)
+    _total_bytes -= size
+
+
+def load(model_path, mmap_mode=None):
+    """Load a joblib-pickled model through the process-level LRU cache.
+
+    Entries are invalidated when the file's mtime or size changes and evicted
+    least-recently-used first once the summed file sizes exceed MAX_BYTES.
+
+    Args:
+        model_path: Path to model.pkl
+        mmap_mode: Optional joblib mmap_mode (e.g. 'r'). numpy arrays stored in the
+            pickle are memory-mapped instead of read into memory; sklearn Tree
+            objects still copy their node arrays on unpickling.
+
+    Returns:
+        Fitted model. The instance is shared between callers and must not be refitted.
+    """
+    global _total_bytes
+
+    path = os.path.realpath(model_path)
+    stat = os.stat(path)
+    key = (path, mmap_mode)
+
+    entry = _models.get(key)
+    if entry is not None:
+        mtime_ns, size, model = entry
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            _models.move_to_end(key)
+            return model
+        _evict(key)
+
+    model = joblib.load(path, mmap_mode=mmap_mode)
+
+    if stat.st_size <= MAX_BYTES:
+        _models[key] = (stat.st_mtime_ns, stat.st_size, model)
+        _total_bytes += stat.st_size
+        while _total_bytes > MAX_BYTES:
+            _evict(next(iter(_models)))
+
+    return model
+
+
+def set_limit(max_bytes):
+    """Change the cache size limit, evicting entries if needed.
+
+    Args:
+        max_bytes: New upper bound on summed model file sizes (bytes)
+    """
+    global MAX_BYTES
+    MAX_BYTES = max_bytes
+    while _models and _total_bytes > MAX_BYTES:
+        _evict(next(iter(_models)))
+
+
+def clear():
+    """Drop all cached models."""
+    global _total_bytes
+    _models.clear()
+    _total_bytes = 0
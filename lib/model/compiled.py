@@ -0,0 +1,305 @@
+import json
+import os
+import shutil
+import numpy as np
+import sklearn
+from sklearn.dummy import DummyClassifier
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+from . import cache
+
+# Sidecar directory next to model.pkl
+COMPILED_DIR = 'compiled'
+
+# Bumped when the packed layout changes (older sidecars are recompiled)
+FORMAT = 1
+
+# (row, tree) pairs traversed per chunk; small enough for the gathers to stay in cache
+CHUNK_PAIRS = 1 << 19
+
+# Traversal levels between checks for pairs that reached a leaf
+COMPACT_EVERY = 4
+
+ARRAYS = ("feature", "threshold", "children", "missing_left", "leaf", "value", "roots", "depth")
+
+# Compiled models already loaded in this process: realpath -> (mtime_ns, size, CompiledModel or None)
+_loaded = {}
+
+
+class CompiledModel:
+    """Tree ensemble packed into flat node arrays with a vectorized batch predictor.
+
+    All trees share one set of node arrays; `roots` holds each tree's root node
+    and child indices are global, so one traversal loop walks every (row, tree)
+    pair of a chunk at once. `children[2 * node + go_right]` is the next node;
+    leaves point to themselves.
+
+    Predictions are identical to the sklearn model's: inputs are cast to float32
+    like sklearn does, splits compare the same float32 values against the same
+    float64 thresholds, and leaf values are accumulated in the same tree order.
+    """
+
+    def __init__(self, kind, arrays, classes, n_features, feature_names=None, allow_nan=False,
+                 learning_rate=None, init_raw=None):
+        self.kind = kind
+        self.classes_ = classes
+        self.n_features_in_ = n_features
+        self.feature_names_in_ = feature_names
+        self.allow_nan = allow_nan
+        self.learning_rate = learning_rate
+        self.init_raw = init_raw
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self.depth = int(arrays["depth"])
+
+    def _validate(self, X):
+        """Convert X to a C-ordered float32 matrix, raising like sklearn on bad input."""
+        if hasattr(X, "columns") and self.feature_names_in_ is not None:
+            if [str(c) for c in X.columns] != self.feature_names_in_:
+                raise ValueError("The feature names should match those that were passed during fit.")
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[-1]} features, but the model is expecting "
+                             f"{self.n_features_in_} features as input.")
+        if np.isinf(X).any():
+            raise ValueError("Input X contains infinity or a value too large for dtype('float32').")
+        if not self.allow_nan and np.isnan(X).any():
+            raise ValueError("Input X contains NaN.")
+        return X
+
+    def _apply(self, X):
+        """Leaf node (global index) of every row in every tree, shape (rows, trees)."""
+        n_rows, n_trees = len(X), len(self.roots)
+        flat = X.ravel()
+        # Offset of each pair's row in the flattened X
+        base = np.repeat(np.arange(n_rows, dtype=np.intp) * X.shape[1], n_trees)
+        nodes = np.tile(self.roots, n_rows)
+        has_nan = self.allow_nan and np.isnan(flat).any()
+
+        # Every pair takes one step per level; leaves loop onto themselves, so
+        # finished pairs are only dropped once they make up half the work
+        result, position = nodes, None
+        for level in range(self.depth):
+            values = flat[base + self.feature[nodes]]
+            go_right = ~(values <= self.threshold[nodes])
+            if has_nan:
+                missing = np.flatnonzero(np.isnan(values))
+                go_right[missing] = ~self.missing_left[nodes[missing]]
+            nodes = self.children[2 * nodes + go_right]
+
+            if level % COMPACT_EVERY == COMPACT_EVERY - 1:
+                live = ~self.leaf[nodes]
+                if live.sum() * 2 < live.size:
+                    if position is None:
+                        result, position = nodes.copy(), np.flatnonzero(live)
+                    else:
+                        result[position] = nodes
+                        position = position[live]
+                    nodes, base = nodes[live], base[live]
+                    if not nodes.size:
+                        break
+        if position is None:
+            result = nodes
+        else:
+            result[position] = nodes
+        return result.reshape(n_rows, n_trees)
+
+    def _predict_chunk(self, X):
+        leaves = self._apply(X)
+
+        if self.kind == "gradient":
+            K = self.init_raw.shape[0]
+            raw = np.tile(self.init_raw, (len(X), 1))
+            # Trees are stored stage by stage, one per class
+            for stage in range(0, leaves.shape[1], K):
+                raw += self.learning_rate * self.value[leaves[:, stage:stage + K]]
+            if K == 1:
+                return (raw.ravel() >= 0).astype(int)
+            return np.argmax(raw, axis=1)
+
+        proba = np.zeros((len(X), self.value.shape[1]), dtype=np.float64)
+        for t in range(leaves.shape[1]):
+            proba += self.value[leaves[:, t]]
+        if self.kind == "forest":
+            proba /= leaves.shape[1]
+        return np.argmax(proba, axis=1)
+
+    def apply(self, X):
+        """Return the leaf node (global index) of every row in every tree."""
+        return self._apply(self._validate(X))
+
+    def predict(self, X):
+        """Predict class labels for X in chunks of at most CHUNK_PAIRS (row, tree) pairs."""
+        X = self._validate(X)
+        step = max(1, CHUNK_PAIRS // len(self.roots))
+        encoded = np.concatenate([self._predict_chunk(X[start:start + step])
+                                  for start in range(0, len(X), step)]) if len(X) else np.zeros(0, dtype=int)
+        return self.classes_.take(encoded, axis=0)
+
+
+def _pack(trees, n_values):
+    """Concatenate sklearn Tree objects into global node arrays."""
+    counts = [tree.node_count for tree in trees]
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+    total = int(sum(counts))
+    nodes = np.arange(total, dtype=np.intp)
+
+    arrays = {
+        "feature": np.empty(total, dtype=np.intp),
+        "threshold": np.empty(total, dtype=np.float64),
+        "children": np.empty(2 * total, dtype=np.intp),
+        "missing_left": np.empty(total, dtype=bool),
+        "value": np.empty((total, n_values), dtype=np.float64),
+        "roots": offsets,
+        "depth": np.array(max(tree.max_depth for tree in trees)),
+    }
+    for tree, offset, count in zip(trees, offsets, counts):
+        part = slice(offset, offset + count)
+        leaf = tree.children_left == -1
+        arrays["feature"][part] = np.where(leaf, 0, tree.feature)
+        arrays["threshold"][part] = tree.threshold
+        arrays["children"][2 * offset:2 * (offset + count):2] = np.where(leaf, nodes[part], tree.children_left + offset)
+        arrays["children"][2 * offset + 1:2 * (offset + count):2] = np.where(leaf, nodes[part], tree.children_right + offset)
+        arrays["missing_left"][part] = tree.missing_go_to_left.astype(bool)
+        arrays["value"][part] = tree.value[:, 0, :n_values]
+    arrays["leaf"] = arrays["children"][0::2] == nodes
+    return arrays
+
+
+def compile(clf):
+    """Pack a fitted DecisionTree, RandomForest or GradientBoosting classifier.
+
+    Args:
+        clf: Fitted single-output sklearn classifier
+
+    Returns:
+        CompiledModel
+
+    Raises:
+        TypeError: If the model type (or its configuration) is not supported
+    """
+    if getattr(clf, "n_outputs_", 1) != 1:
+        raise TypeError("Only single-output models can be compiled")
+    feature_names = None
+    if hasattr(clf, "feature_names_in_"):
+        feature_names = [str(name) for name in clf.feature_names_in_]
+
+    if isinstance(clf, GradientBoostingClassifier):
+        if not (clf.init_ == "zero" or isinstance(clf.init_, DummyClassifier)):
+            raise TypeError("Gradient boosting with a custom init estimator cannot be compiled")
+        # Constant init predictions (prior or zero), taken from sklearn itself
+        init_raw = clf._raw_predict_init(np.zeros((1, clf.n_features_in_), dtype=np.float32))[0]
+        estimators = clf.estimators_
+        trees = [estimators[i, k].tree_ for i in range(estimators.shape[0]) for k in range(estimators.shape[1])]
+        arrays = _pack(trees, 1)
+        arrays["value"] = arrays["value"][:, 0].copy()
+        return CompiledModel("gradient", arrays, clf.classes_, clf.n_features_in_, feature_names,
+                             allow_nan=False, learning_rate=float(clf.learning_rate), init_raw=init_raw)
+
+    if isinstance(clf, RandomForestClassifier):
+        kind, estimators = "forest", clf.estimators_
+    elif isinstance(clf, DecisionTreeClassifier):
+        kind, estimators = "tree", [clf]
+    else:
+        raise TypeError(f"{type(clf).__name__} cannot be compiled")
+
+    arrays = _pack([estimator.tree_ for estimator in estimators], int(clf.n_classes_))
+    allow_nan = estimators[0].__sklearn_tags__().input_tags.allow_nan
+    return CompiledModel(kind, arrays, clf.classes_, clf.n_features_in_, feature_names, allow_nan=allow_nan)
+
+
+def save(compiled, directory, source=None):
+    """Write a compiled model as one .npy file per array plus meta.json.
+
+    Args:
+        compiled: CompiledModel
+        directory: Target directory (replaced if it exists)
+        source: Optional os.stat_result of the model.pkl it was compiled from
+    """
+    tmp_dir = f"{directory}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    for name in ARRAYS:
+        np.save(os.path.join(tmp_dir, f"{name}.npy"), getattr(compiled, name))
+    np.save(os.path.join(tmp_dir, 'classes.npy'), compiled.classes_, allow_pickle=True)
+    if compiled.init_raw is not None:
+        np.save(os.path.join(tmp_dir, 'init_raw.npy'), compiled.init_raw)
+
+    meta = {
+        "format": FORMAT,
+        "sklearn": sklearn.__version__,
+        "kind": compiled.kind,
+        "n_features": compiled.n_features_in_,
+        "feature_names": compiled.feature_names_in_,
+        "allow_nan": compiled.allow_nan,
+        "learning_rate": compiled.learning_rate,
+        "source": {"mtime_ns": source.st_mtime_ns, "size": source.st_size} if source else None,
+    }
+    with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    try:
+        os.replace(tmp_dir, directory)
+    except OSError:
+        # Another process wrote the same sidecar first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def read(directory, mmap_mode='r'):
+    """Read a compiled model written by save().
+
+    Returns:
+        tuple: (CompiledModel, meta dict)
+    """
+    with open(os.path.join(directory, 'meta.json')) as f:
+        meta = json.load(f)
+    arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode) for name in ARRAYS}
+    classes = np.load(os.path.join(directory, 'classes.npy'), allow_pickle=True)
+    init_path = os.path.join(directory, 'init_raw.npy')
+    init_raw = np.load(init_path) if os.path.exists(init_path) else None
+    compiled = CompiledModel(meta["kind"], arrays, classes, meta["n_features"], meta["feature_names"],
+                             allow_nan=meta["allow_nan"], learning_rate=meta["learning_rate"], init_raw=init_raw)
+    return compiled, meta
+
+
+def load(model_path):
+    """Return the compiled form of a model.pkl, compiling it on first use.
+
+    The sidecar lives in a `compiled/` directory next to model.pkl and is
+    rebuilt when model.pkl changes (mtime or size), the layout format or the
+    sklearn version differs. Results are memoized per process.
+
+    Args:
+        model_path: Path to model.pkl
+
+    Returns:
+        CompiledModel, or None if the model type cannot be compiled
+    """
+    path = os.path.realpath(model_path)
+    stat = os.stat(path)
+    entry = _loaded.get(path)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+
+    directory = os.path.join(os.path.dirname(path), COMPILED_DIR)
+    compiled = None
+    try:
+        compiled, meta = read(directory)
+        current = (meta["format"] == FORMAT and meta["sklearn"] == sklearn.__version__ and
+                   meta["source"] == {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        if not current:
+            compiled = None
+    except (OSError, ValueError, KeyError):
+        compiled = None
+
+    if compiled is None:
+        try:
+            compiled = compile(cache.load(path))
+            save(compiled, directory, source=stat)
+        except TypeError:
+            compiled = None
+
+    _loaded[path] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
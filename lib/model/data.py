@@ -0,0 +1,62 @@
+import json
+import os
+import numpy as np
+
+# Sidecar directory inside frontend/public/output/<run_id>/
+DATA_DIR = 'data'
+
+SPLITS = ("train", "test")
+
+
+def _data_dir(run_id):
+    return os.path.realpath(os.path.join(
+        os.path.dirname(__file__), '..', '..', 'frontend', 'public', 'output', run_id, DATA_DIR
+    ))
+
+
+def write(run_id, X_train, X_test, y_train, y_test):
+    """Write train/test rows as a columnar sidecar next to result.json.
+
+    Each feature column is a float64 .npy file (NaN = missing), labels are int32
+    codes into meta.json["label_classes"]. Readers can memory-map or seek into a
+    single column without parsing the rest.
+
+    Args:
+        run_id: Run identifier
+        X_train, X_test: Feature DataFrames
+        y_train, y_test: Target labels
+
+    Returns:
+        dict: Pointer stored in result.json under "data"
+    """
+    directory = _data_dir(run_id)
+    os.makedirs(directory, exist_ok=True)
+
+    labels = {"train": np.asarray(y_train).astype(str), "test": np.asarray(y_test).astype(str)}
+    classes, codes = np.unique(np.concatenate([labels["train"], labels["test"]]), return_inverse=True)
+    codes = {"train": codes[:len(labels["train"])], "test": codes[len(labels["train"]):]}
+
+    meta = {
+        "format": "npy",
+        "feature_names": X_train.columns.tolist(),
+        "label_classes": classes.tolist(),
+        "splits": {}
+    }
+
+    for split, X in (("train", X_train), ("test", X_test)):
+        for i, col in enumerate(X.columns):
+            values = np.ascontiguousarray(X[col].to_numpy(dtype=np.float64, na_value=np.nan))
+            np.save(os.path.join(directory, f"{split}_{i:03d}.npy"), values)
+        np.save(os.path.join(directory, f"{split}_labels.npy"), codes[split].astype(np.int32))
+        meta["splits"][split] = {"rows": len(X)}
+
+    with open(os.path.join(directory, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    return {
+        "path": f"{DATA_DIR}/meta.json",
+        "format": "npy",
+        "train_rows": len(X_train),
+        "test_rows": len(X_test)
+    }
+
@@ -0,0 +1,43 @@
+import os
+import yaml
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+from ..args import merge_config
+
+# Model type (as stored in runtime.json) -> sklearn estimator class
+ESTIMATORS = {
+    "tree": DecisionTreeClassifier,
+    "forest": RandomForestClassifier,
+    "gradient": GradientBoostingClassifier,
+    "hist-gradient": HistGradientBoostingClassifier
+}
+
+CONFIG_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'config'))
+
+
+def load_config(model, dataset, model_config=None):
+    """Load model hyperparameters from config/<model>-<dataset>.yml.
+
+    Args:
+        model: Model type (tree/forest/gradient/hist-gradient)
+        dataset: Dataset name (Iris/Income)
+        model_config: Optional JSON string with overrides (snake_case keys)
+
+    Returns:
+        dict: Merged config
+    """
+    with open(os.path.join(CONFIG_DIR, f"{model}-{dataset}.yml")) as f:
+        return merge_config(yaml.safe_load(f), model_config)
+
+
+def build(model, config):
+    """Instantiate an unfitted estimator for a model type.
+
+    Args:
+        model: Model type (tree/forest/gradient/hist-gradient)
+        config: Hyperparameter dict
+
+    Returns:
+        Unfitted sklearn classifier
+    """
+    return ESTIMATORS[model](**config)
@@ -0,0 +1,78 @@
+import numpy as np
+from scipy import sparse
+
+from ..profile import Profile
+
+
+def leaf_matrix(clf, X):
+    """Build the sparse one-hot leaf membership matrix of a fitted forest.
+
+    Row i has a 1 in the column of every leaf sample i lands in (one per tree).
+    Leaf node ids are offset per tree so columns are unique across the forest.
+
+    Args:
+        clf: Fitted forest exposing apply() and estimators_ (e.g. RandomForestClassifier)
+        X: Feature data
+
+    Returns:
+        scipy.sparse.csr_matrix of shape (n_samples, total_nodes) with int32 ones
+    """
+    leaves = clf.apply(X)
+    n_samples, n_trees = leaves.shape
+
+    node_counts = np.array([est.tree_.node_count for est in clf.estimators_])
+    offsets = np.concatenate(([0], np.cumsum(node_counts)[:-1]))
+
+    rows = np.repeat(np.arange(n_samples), n_trees)
+    cols = (leaves + offsets).ravel()
+    data = np.ones(len(cols), dtype=np.int32)
+
+    return sparse.csr_matrix((data, (rows, cols)), shape=(n_samples, node_counts.sum()))
+
+
+@Profile.span("model.proximity")
+def proximity(clf, X, top_k=None, chunk_size=1024):
+    """Compute the random forest proximity matrix with a sparse matrix product.
+
+    proximity[i, j] is the fraction of trees in which samples i and j share a leaf,
+    computed as (M @ M.T) / n_trees for the leaf membership matrix M. Rows are
+    processed in blocks of chunk_size so peak memory stays bounded.
+
+    Args:
+        clf: Fitted forest exposing apply() and estimators_
+        X: Feature data
+        top_k: If set, keep only the top_k largest proximities per row (self included)
+            and return a sparse matrix
+        chunk_size: Number of rows per block
+
+    Returns:
+        ndarray (n_samples, n_samples) if top_k is None, otherwise scipy.sparse.csr_matrix
+    """
+    M = leaf_matrix(clf, X)
+    MT = M.T.tocsc()
+    n_samples = M.shape[0]
+    n_trees = len(clf.estimators_)
+
+    if top_k is None:
+        result = np.empty((n_samples, n_samples))
+        for start in range(0, n_samples, chunk_size):
+            end = min(start + chunk_size, n_samples)
+            result[start:end] = (M[start:end] @ MT).toarray() / n_trees
+        return result
+
+    k = min(top_k, n_samples)
+    rows, cols, data = [], [], []
+    for start in range(0, n_samples, chunk_size):
+        end = min(start + chunk_size, n_samples)
+        block = (M[start:end] @ MT).toarray()
+        top = np.argpartition(block, n_samples - k, axis=1)[:, n_samples - k:]
+        rows.append(np.repeat(np.arange(start, end), k))
+        cols.append(top.ravel())
+        data.append(np.take_along_axis(block, top, axis=1).ravel() / n_trees)
+
+    result = sparse.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n_samples, n_samples)
+    )
+    result.eliminate_zeros()
+    return result
@@ -0,0 +1,372 @@
+import json
+import os
+import re
+import sqlite3
+import time
+from config import OUTPUT_DIR
+
+# SQLite run registry (outside frontend/public so it is never served)
+REGISTRY_PATH = os.environ.get('RUN_REGISTRY', os.path.join(OUTPUT_DIR, 'registry.sqlite'))
+
+# Training run directories indexed by the registry
+RUNS_DIR = os.path.realpath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'frontend', 'public', 'output'
+))
+
+# Columns accepted by upsert() and returned by get()/query()
+COLUMNS = ("model", "dataset", "accuracy", "name", "timestamp", "mask", "split",
+           "impute", "ignore_columns", "runtime")
+
+# Sort keys accepted by query()
+SORT_KEYS = ("timestamp", "accuracy", "model", "name")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    model TEXT,
+    dataset TEXT,
+    accuracy REAL,
+    name TEXT,
+    timestamp INTEGER,
+    mask INTEGER,
+    split INTEGER,
+    impute INTEGER,
+    ignore_columns TEXT,
+    runtime TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS runs_dataset_timestamp ON runs (dataset, timestamp DESC);
+CREATE INDEX IF NOT EXISTS runs_dataset_model_timestamp ON runs (dataset, model, timestamp DESC);
+CREATE INDEX IF NOT EXISTS runs_dataset_accuracy ON runs (dataset, accuracy DESC);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp DESC);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# .id marker: <model>_<dataset>_<score>[_<name>].id, score = accuracy * 1e6, "/" stored as "--"
+ID_PATTERN = re.compile(r'^([^_]+)_([^_]+)_(\d+)(?:_(.+))?\.id$')
+
+
+def connect(path=None):
+    """Open the registry, creating the schema and indexing existing runs on first use.
+
+    Later changes to RUNS_DIR made outside Model.save* are picked up by
+    reconcile(), which query() runs before listing whenever RUNS_DIR's mtime
+    has changed.
+
+    Args:
+        path: Database path (default REGISTRY_PATH)
+
+    Returns:
+        sqlite3.Connection with Row results
+    """
+    path = path or REGISTRY_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    with conn:
+        conn.executescript(SCHEMA)
+    if conn.execute("SELECT 1 FROM meta WHERE key = 'indexed'").fetchone() is None:
+        rebuild(conn)
+    return conn
+
+
+def _timestamp(run_id):
+    return int(run_id) if str(run_id).isdigit() else int(time.time())
+
+
+def _row(row):
+    """Convert a runs row to a dict with decoded JSON columns."""
+    run = dict(row)
+    run["impute"] = None if run["impute"] is None else bool(run["impute"])
+    for key in ("ignore_columns", "runtime"):
+        run[key] = None if run[key] is None else json.loads(run[key])
+    run.pop("updated", None)
+    return run
+
+
+def _encode(fields):
+    """Validate fields and encode the JSON/boolean columns in place."""
+    unknown = set(fields) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown registry fields: {sorted(unknown)}")
+
+    for key in ("ignore_columns", "runtime"):
+        if key in fields and fields[key] is not None:
+            fields[key] = json.dumps(fields[key])
+    if fields.get("impute") is not None:
+        fields["impute"] = int(bool(fields["impute"]))
+    fields["updated"] = time.time()
+    return fields
+
+
+def _upsert(conn, run_id, fields):
+    """Execute the upsert statement for one run (caller owns the transaction).
+
+    A new run's timestamp defaults to its run ID; updates keep the stored one
+    unless a timestamp is given.
+    """
+    _encode(fields)
+    updated = list(fields)
+    fields.setdefault("timestamp", _timestamp(run_id))
+
+    columns = list(fields)
+    sql = (
+        f"INSERT INTO runs (run_id, {', '.join(columns)}) VALUES (?{', ?' * len(columns)}) "
+        f"ON CONFLICT(run_id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in updated)}"
+    )
+    conn.execute(sql, [run_id] + [fields[c] for c in columns])
+
+
+def upsert(run_id, conn=None, **fields):
+    """Insert a run or update the given fields of an existing one (one transaction).
+
+    Args:
+        run_id: Run identifier
+        conn: Optional open connection
+        **fields: Any of COLUMNS; ignore_columns and runtime are stored as JSON
+    """
+    own = conn is None
+    conn = conn or connect()
+    try:
+        with conn:
+            _upsert(conn, run_id, fields)
+    finally:
+        if own:
+            conn.close()
+
+
+def update(run_id, conn=None, **fields):
+    """Update the given fields of a registered run; unknown runs are left alone.
+
+    Args:
+        run_id: Run identifier
+        conn: Optional open connection
+        **fields: Any of COLUMNS
+
+    Returns:
+        bool: Whether the run was registered (and updated)
+    """
+    _encode(fields)
+    own = conn is None
+    conn = conn or connect()
+    try:
+        with conn:
+            cursor = conn.execute(
+                f"UPDATE runs SET {', '.join(f'{c} = ?' for c in fields)} WHERE run_id = ?",
+                [fields[c] for c in fields] + [run_id]
+            )
+        return cursor.rowcount > 0
+    finally:
+        if own:
+            conn.close()
+
+
+def delete(run_id, conn=None):
+    """Remove a run from the registry."""
+    own = conn is None
+    conn = conn or connect()
+    try:
+        with conn:
+            conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+    finally:
+        if own:
+            conn.close()
+
+
+def get(run_id, conn=None):
+    """Return one run as a dict, or None if it is not registered.
+
+    Run directories created outside the registry (copied in, older versions)
+    are scanned and registered on first lookup.
+    """
+    own = conn is None
+    conn = conn or connect()
+    try:
+        row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None and os.path.isdir(os.path.join(RUNS_DIR, str(run_id))):
+            fields = scan(str(run_id))
+            if fields:
+                with conn:
+                    _upsert(conn, run_id, fields)
+                row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return _row(row) if row else None
+    finally:
+        if own:
+            conn.close()
+
+
+def query(dataset=None, model=None, min_accuracy=None, since=None, until=None,
+          sort="timestamp", descending=True, limit=None, offset=0, conn=None):
+    """List runs with indexed filters, sorting and pagination.
+
+    Args:
+        dataset: Optional dataset filter
+        model: Optional model type filter
+        min_accuracy: Optional lower bound on accuracy
+        since, until: Optional timestamp bounds (inclusive, seconds)
+        sort: One of SORT_KEYS (ties broken by newest run)
+        descending: Sort descending
+        limit: Page size (None = all)
+        offset: Rows to skip
+        conn: Optional open connection
+
+    Returns:
+        dict: {"total": matching runs, "runs": list of run dicts}
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort}")
+
+    where, params = [], []
+    for clause, value in (("dataset = ?", dataset), ("model = ?", model), ("accuracy >= ?", min_accuracy),
+                          ("timestamp >= ?", since), ("timestamp <= ?", until)):
+        if value is not None:
+            where.append(clause)
+            params.append(value)
+    where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+    order = "DESC" if descending else "ASC"
+
+    own = conn is None
+    conn = conn or connect()
+    try:
+        reconcile(conn)
+        total = conn.execute(f"SELECT COUNT(*) FROM runs{where_sql}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT * FROM runs{where_sql} ORDER BY {sort} {order}, timestamp DESC, run_id DESC "
+            f"LIMIT ? OFFSET ?",
+            params + [-1 if limit is None else limit, offset]
+        ).fetchall()
+        return {"total": total, "runs": [_row(row) for row in rows]}
+    finally:
+        if own:
+            conn.close()
+
+
+def scan(run_id):
+    """Read a run's metadata from its runtime.json, result.json and .id marker.
+
+    Returns:
+        dict: Registry fields, or None if the directory has no .id marker
+    """
+    run_dir = os.path.join(RUNS_DIR, run_id)
+    fields = None
+    for filename in os.listdir(run_dir):
+        match = ID_PATTERN.match(filename)
+        if match:
+            model, dataset, score, name = match.groups()
+            fields = {"model": model, "dataset": dataset, "accuracy": int(score) / 1_000_000,
+                      "name": name.replace('--', '/') if name else None}
+            break
+    if fields is None:
+        return None
+
+    try:
+        with open(os.path.join(run_dir, 'runtime.json')) as f:
+            runtime = json.load(f)
+        params = runtime.get("datasetParams", {})
+        if runtime.get("created") is not None:
+            fields["timestamp"] = runtime["created"]
+        fields.update(runtime=runtime, mask=params.get("mask"), split=params.get("split"),
+                      impute=params.get("impute"), ignore_columns=params.get("ignore_columns"))
+    except (OSError, json.JSONDecodeError):
+        pass
+    try:
+        with open(os.path.join(run_dir, 'result.json')) as f:
+            fields["accuracy"] = json.load(f)["accuracy"]
+    except (OSError, json.JSONDecodeError, KeyError):
+        pass
+    return fields
+
+
+def _run_dirs():
+    """Return the run IDs of the run directories under RUNS_DIR."""
+    if not os.path.isdir(RUNS_DIR):
+        return set()
+    return {
+        run_id for run_id in os.listdir(RUNS_DIR)
+        if re.fullmatch(r'\d{10}', run_id) and os.path.isdir(os.path.join(RUNS_DIR, run_id))
+    }
+
+
+def _runs_mtime():
+    """RUNS_DIR's mtime (changes when run directories are added or removed)."""
+    try:
+        return str(os.stat(RUNS_DIR).st_mtime_ns)
+    except OSError:
+        return ""
+
+
+def _mark_reconciled(conn, mtime):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('runs_mtime', ?)", (mtime,))
+
+
+def reconcile(conn=None, force=False):
+    """Sync the registry with the run directories that exist under RUNS_DIR.
+
+    Skipped while RUNS_DIR's mtime matches the one stored by the last
+    reconcile/rebuild, so listings don't rescan unregistered directories
+    (in-progress or failed runs) each time. Otherwise only the directory
+    names are compared against the registered run IDs: runs whose directory
+    is gone are removed, and directories that are not registered (copied in,
+    older versions) are scanned and added.
+
+    Args:
+        conn: Optional open connection
+        force: Reconcile even if RUNS_DIR's mtime is unchanged
+
+    Returns:
+        tuple: (added, removed) run counts
+    """
+    own = conn is None
+    conn = conn or connect()
+    try:
+        # Read before listing, so directories created meanwhile trigger the next reconcile
+        mtime = _runs_mtime()
+        stored = conn.execute("SELECT value FROM meta WHERE key = 'runs_mtime'").fetchone()
+        if not force and stored is not None and stored[0] == mtime:
+            return 0, 0
+
+        on_disk = _run_dirs()
+        registered = {row[0] for row in conn.execute("SELECT run_id FROM runs")}
+        removed = registered - on_disk
+        added = {}
+        for run_id in on_disk - registered:
+            fields = scan(run_id)
+            if fields:
+                added[run_id] = fields
+        with conn:
+            conn.executemany("DELETE FROM runs WHERE run_id = ?", [(run_id,) for run_id in removed])
+            for run_id, fields in added.items():
+                _upsert(conn, run_id, fields)
+            _mark_reconciled(conn, mtime)
+        return len(added), len(removed)
+    finally:
+        if own:
+            conn.close()
+
+
+def rebuild(conn=None):
+    """Re-index every run directory under RUNS_DIR in one transaction.
+
+    Returns:
+        int: Number of registered runs
+    """
+    own = conn is None
+    conn = conn or connect()
+    try:
+        mtime = _runs_mtime()
+        runs = {}
+        for run_id in _run_dirs():
+            fields = scan(run_id)
+            if fields:
+                runs[run_id] = fields
+        with conn:
+            conn.execute("DELETE FROM runs")
+            for run_id, fields in runs.items():
+                _upsert(conn, run_id, fields)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('indexed', ?)", (str(time.time()),))
+            _mark_reconciled(conn, mtime)
+        return len(runs)
+    finally:
+        if own:
+            conn.close()
@@ -1,9 +1,12 @@
 import json as json_lib
 import os
+import sys
 import numpy as np
 import pandas as pd
 import joblib
 from sklearn.metrics import accuracy_score, classification_report
+from . import data, registry
+from ..profile import TOP_FUNCTIONS, Profile, save_memory, top_functions
 
 
 def convert_nan_to_none(obj):
@@ -35,7 +38,7 @@ class NumpyEncoder(json_lib.JSONEncoder):
 
 
 def report(y_true, y_pred, json_output=False, model_info=None, params=None,
-           feature_importance=None, X_train=None, X_test=None, y_train=None, y_test=None):
+           feature_importance=None, X_train=None, X_test=None, y_train=None, y_test=None, timings=None):
     """Print accuracy and classification report.
 
     Args:
@@ -49,6 +52,7 @@ def report(y_true, y_pred, json_output=False, model_info=None, params=None,
         X_test: Optional test features DataFrame
         y_train: Optional training labels
         y_test: Optional test labels
+        timings: Optional stage timing summary (Profile.summary()) of the run so far
     """
     accuracy = accuracy_score(y_true, y_pred)
 
@@ -69,24 +73,37 @@ def report(y_true, y_pred, json_output=False, model_info=None, params=None,
             summary["feature_importance"] = feature_importance
 
         if X_train is not None:
-            summary["train_data"] = X_train.to_dict(orient='records')
             summary["feature_names"] = X_train.columns.tolist()
 
-        if X_test is not None:
-            summary["test_data"] = X_test.to_dict(orient='records')
+        if timings is not None:
+            summary["timings"] = timings
 
-        if y_train is not None:
-            summary["train_labels"] = y_train.tolist() if hasattr(y_train, 'tolist') else list(y_train)
+        run_id = params.get('run_id') if params else None
+        has_rows = all(v is not None for v in (X_train, X_test, y_train, y_test))
+
+        with Profile.span("report.data"):
+            if run_id and has_rows:
+                # Rows go to the columnar sidecar; result.json only points to it
+                summary["data"] = data.write(run_id, X_train, X_test, y_train, y_test)
+            else:
+                if X_train is not None:
+                    summary["train_data"] = X_train.to_dict(orient='records')
+
+                if X_test is not None:
+                    summary["test_data"] = X_test.to_dict(orient='records')
 
-        if y_test is not None:
-            summary["test_labels"] = y_test.tolist() if hasattr(y_test, 'tolist') else list(y_test)
+                if y_train is not None:
+                    summary["train_labels"] = y_train.tolist() if hasattr(y_train, 'tolist') else list(y_train)
+
+                if y_test is not None:
+                    summary["test_labels"] = y_test.tolist() if hasattr(y_test, 'tolist') else list(y_test)
 
         # Convert any remaining NaN values to None
-        summary = convert_nan_to_none(summary)
-        json_str = json_lib.dumps(summary, indent=2, cls=NumpyEncoder)
+        with Profile.span("report.json"):
+            summary = convert_nan_to_none(summary)
+            json_str = json_lib.dumps(summary, indent=2, cls=NumpyEncoder)
 
         # Save result.json if run_id is provided
-        run_id = params.get('run_id') if params else None
         if run_id:
             output_dir = _get_output_dir(run_id)
             os.makedirs(output_dir, exist_ok=True)
@@ -133,8 +150,8 @@ def save(clf, run_id):
     joblib.dump(clf, model_path)
 
 
-def save_runtime(run_id, dataset, model, dataset_params, model_params):
-    """Save runtime configuration to runtime.json.
+def save_runtime(run_id, dataset, model, dataset_params, model_params, extra=None):
+    """Save runtime configuration to runtime.json and register the run.
 
     Args:
         run_id: Run identifier
@@ -142,6 +159,8 @@ def save_runtime(run_id, dataset, model, dataset_params, model_params):
         model: Model type (tree/forest/gradient)
         dataset_params: Dict with dataset parameters (mask, split, impute, etc.)
         model_params: Dict with model hyperparameters
+        extra: Optional dict of additional top-level keys (e.g. "sweep" for sweep trials,
+            "created" for runs whose ID is not their creation time; registered as the timestamp)
     """
     if not run_id:
         return
@@ -154,16 +173,90 @@ def save_runtime(run_id, dataset, model, dataset_params, model_params):
         "dataset": dataset,
         "model": model,
         "datasetParams": dataset_params,
-        "modelParams": model_params
+        "modelParams": model_params,
+        **(extra or {})
     }
 
     runtime_path = os.path.join(output_dir, 'runtime.json')
     with open(runtime_path, 'w') as f:
         json_lib.dump(runtime, f, indent=2, cls=NumpyEncoder)
 
+    created = {"timestamp": runtime["created"]} if runtime.get("created") is not None else {}
+    registry.upsert(
+        run_id,
+        **created,
+        model=model,
+        dataset=dataset,
+        mask=dataset_params.get("mask"),
+        split=dataset_params.get("split"),
+        impute=dataset_params.get("impute"),
+        ignore_columns=dataset_params.get("ignore_columns"),
+        runtime=json_lib.loads(json_lib.dumps(runtime, cls=NumpyEncoder))
+    )
+
+
+def save_timings(run_id, timings, stats=None, memory=None):
+    """Add the stage timings of a finished run to runtime.json (and the registry).
+
+    result.json's "timings" summary is replaced by the final one, so stages that
+    ran after the report (image rendering) are included. With a cProfile run (stats), profile.pstats and a profile.txt listing of
+    the slowest functions are written next to it, and with memory tracking
+    the memory report goes to memory.json. Without a run_id both listings go
+    to stderr.
+
+    Args:
+        run_id: Run identifier (None = nothing is saved)
+        timings: Profile.timings() dict
+        stats: Optional pstats.Stats from Profile.finish()
+        memory: Optional memory report from Profile.finish()
+    """
+    if not run_id:
+        if stats is not None:
+            stats.stream = sys.stderr
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        save_memory(memory)
+        return
+
+    output_dir = _get_output_dir(run_id)
+    runtime_path = os.path.join(output_dir, 'runtime.json')
+    if not timings or not os.path.exists(runtime_path):
+        return
+
+    if stats is not None:
+        stats.dump_stats(os.path.join(output_dir, 'profile.pstats'))
+        with open(os.path.join(output_dir, 'profile.txt'), 'w') as f:
+            stats.stream = f
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        timings = {**timings, "profile": {"pstats": "profile.pstats", "text": "profile.txt",
+                                          "top": top_functions(stats)}}
+
+    if memory is not None:
+        save_memory(memory, os.path.join(output_dir, 'memory.json'))
+        timings = {**timings, "memory": {"file": "memory.json", "budget_mb": memory["budget_mb"],
+                                         **{key: memory[key] for key in ("peak_rss_mb", "traced_peak_mb")
+                                            if key in memory}}}
+
+    with open(runtime_path) as f:
+        runtime = json_lib.load(f)
+    runtime["timings"] = timings
+    with open(runtime_path, 'w') as f:
+        json_lib.dump(runtime, f, indent=2, cls=NumpyEncoder)
+
+    result_path = os.path.join(output_dir, 'result.json')
+    if os.path.exists(result_path):
+        with open(result_path) as f:
+            result = json_lib.load(f)
+        result["timings"] = {"total": timings["total"], "stages": timings["stages"]}
+        with open(result_path, 'w') as f:
+            json_lib.dump(result, f, indent=2, cls=NumpyEncoder)
+
+    registry.upsert(run_id, runtime=json_lib.loads(json_lib.dumps(runtime, cls=NumpyEncoder)))
+
 
 def save_id(run_id, model, dataset, accuracy):
-    """Save empty .id marker file with model/dataset/score in filename.
+    """Save empty .id marker file with model/dataset/score in filename and register the score.
+
+    A run has one marker: an existing one is replaced, keeping its name suffix.
 
     Args:
         run_id: Run identifier
@@ -181,9 +274,18 @@ def save_id(run_id, model, dataset, accuracy):
     score_int = int(accuracy * 1_000_000)
     score_str = f"{score_int:06d}"
 
-    id_filename = f"{model}_{dataset}_{score_str}.id"
+    name = None
+    for filename in os.listdir(output_dir):
+        match = registry.ID_PATTERN.match(filename)
+        if match:
+            name = name or match.group(4)
+            os.remove(os.path.join(output_dir, filename))
+
+    id_filename = f"{model}_{dataset}_{score_str}{f'_{name}' if name else ''}.id"
     id_path = os.path.join(output_dir, id_filename)
 
     # Create empty file
     with open(id_path, 'w') as f:
         pass
+
+    registry.upsert(run_id, model=model, dataset=dataset, accuracy=float(accuracy))
@@ -0,0 +1,163 @@
+import contextlib
+import cProfile
+import os
+import pstats
+import time
+
+from .memory import BUDGET_MB, MemoryBudgetError, MemoryTracker, save_memory
+
+__all__ = ['MemoryBudgetError', 'Profile', 'TOP_FUNCTIONS', 'save_memory', 'top_functions']
+
+# Functions listed by cumulative time in profile.txt and runtime.json (--profile)
+TOP_FUNCTIONS = 30
+
+
+class Profile:
+    """Named timing spans around the stages of a run, with an optional cProfile.
+
+    Training scripts call Profile.start() first and Profile.finish() last;
+    scripts and library code wrap their stages in Profile.span(name). Spans
+    nest, and outside a started run they are not recorded. With memory
+    tracking, each span also records its peak RSS (see MemoryTracker):
+
+        with Profile.span("fit"):
+            clf.fit(X_train, y_train)
+    """
+    _start = None      # perf_counter() at start(), None while not recording
+    _spans = []        # finished spans: {"name", "parent", "start", "seconds"}
+    _stack = []        # names of the open spans
+    _profiler = None   # cProfile.Profile while profiling (--profile)
+    _memory = None     # MemoryTracker while tracking memory (--memory, --memory-budget)
+
+    @classmethod
+    def start(cls, profile=False, memory=False, memory_budget=None):
+        """Start recording spans of a new run.
+
+        Args:
+            profile: Also run cProfile until finish()
+            memory: Also trace Python allocations per span (tracemalloc, slow)
+            memory_budget: Raise MemoryBudgetError above this many MB of RSS
+                (default: MEMORY_BUDGET_MB); any budget samples RSS per span
+        """
+        cls.reset()
+        cls._start = time.perf_counter()
+        budget = memory_budget if memory_budget is not None else BUDGET_MB
+        if memory or budget:
+            cls._memory = MemoryTracker(budget_mb=budget, traced=memory,
+                                        stage=lambda: cls._stack[-1] if cls._stack else None)
+        if profile:
+            cls._profiler = cProfile.Profile()
+            cls._profiler.enable()
+
+    @classmethod
+    def reset(cls):
+        """Stop recording and drop all spans (long-lived workers call this between jobs)."""
+        if cls._profiler is not None:
+            cls._profiler.disable()
+        if cls._memory is not None:
+            cls._memory.stop()
+        cls._start = None
+        cls._spans = []
+        cls._stack = []
+        cls._profiler = None
+        cls._memory = None
+
+    @classmethod
+    def recording(cls):
+        """Whether a run was started."""
+        return cls._start is not None
+
+    @classmethod
+    @contextlib.contextmanager
+    def span(cls, name):
+        """Time the enclosed block as stage `name` (nested under the enclosing span)."""
+        if cls._start is None:
+            yield
+            return
+        parent = cls._stack[-1] if cls._stack else None
+        memory = cls._memory.enter(name, parent is None) if cls._memory else None
+        cls._stack.append(name)
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls._stack.pop()
+            start = round(begin - cls._start, 6)
+            cls._spans.append({
+                "name": name,
+                "parent": parent,
+                "start": start,
+                "seconds": round(time.perf_counter() - begin, 6)
+            })
+            if memory is not None:
+                cls._memory.exit(memory, name, parent, start)
+
+    @classmethod
+    def summary(cls):
+        """Total seconds so far and seconds per top-level stage.
+
+        Stages appear in the order they started; repeated stages (e.g. several
+        render.tree calls) are summed. Nested spans are only listed by timings().
+
+        Returns:
+            dict: {"total": seconds, "stages": {name: seconds}}, or None when not recording
+        """
+        if cls._start is None:
+            return None
+        stages = {}
+        for span in sorted(cls._spans, key=lambda span: span["start"]):
+            if span["parent"] is None:
+                stages[span["name"]] = round(stages.get(span["name"], 0.0) + span["seconds"], 6)
+        return {"total": round(time.perf_counter() - cls._start, 6), "stages": stages}
+
+    @classmethod
+    def timings(cls):
+        """summary() plus every recorded span in start order."""
+        summary = cls.summary()
+        if summary is None:
+            return None
+        return {**summary, "spans": sorted(cls._spans, key=lambda span: span["start"])}
+
+    @classmethod
+    def memory(cls):
+        """Memory report (MemoryTracker.report()), or None when not tracking memory."""
+        return cls._memory.report() if cls._memory else None
+
+    @classmethod
+    def finish(cls):
+        """Stop recording.
+
+        Returns:
+            tuple: (timings() dict or None, pstats.Stats of the cProfile run or None,
+                    memory() report or None)
+        """
+        timings = cls.timings()
+        memory = cls.memory()
+        stats = None
+        if cls._profiler is not None:
+            cls._profiler.disable()
+            stats = pstats.Stats(cls._profiler)
+        cls.reset()
+        return timings, stats, memory
+
+
+# Forked children (process pools) do not record the parent's run
+os.register_at_fork(after_in_child=Profile.reset)
+
+
+def top_functions(stats, limit=TOP_FUNCTIONS):
+    """The functions with the highest cumulative time in a pstats.Stats.
+
+    Returns:
+        list: [{"function": "file:line(name)", "calls", "seconds" (own), "cumulative"}]
+    """
+    rows = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        rows.append({
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "seconds": round(own, 6),
+            "cumulative": round(cumulative, 6)
+        })
+    rows.sort(key=lambda row: row["cumulative"], reverse=True)
+    return rows[:limit]
@@ -0,0 +1,252 @@
+import json
+import os
+import signal
+import sys
+import threading
+import tracemalloc
+
+MB = 1024 * 1024
+
+# Default budget in MB for runs without --memory-budget (unset = no budget)
+BUDGET_MB = float(os.environ.get("MEMORY_BUDGET_MB", 0)) or None
+
+# Seconds between RSS samples of the background sampler
+SAMPLE_SECONDS = 0.05
+
+# Allocation sites listed per top-level span in memory.json
+TOP_ALLOCATIONS = 10
+
+# Allocation sites of import machinery rather than the run (lazy imports inside a stage)
+_IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+class MemoryBudgetError(MemoryError):
+    """The process (with its child processes) went over the memory budget."""
+
+
+def _proc_rss(pid):
+    """Resident set size in bytes of a process from /proc (0 when unavailable)."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _children(pid):
+    """Pids of the direct children of a process (Linux /proc only)."""
+    pids = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                pids.extend(int(child) for child in f.read().split())
+    except (OSError, ValueError):
+        pass
+    return pids
+
+
+def rss_bytes(children=True):
+    """Current resident set size of this process, plus its child processes.
+
+    Children (process pools, subprocesses) are summed with their full RSS, so
+    pages shared after fork are counted once per process. Without /proc the
+    process's peak RSS so far is returned instead.
+
+    Args:
+        children: Include child processes, recursively
+
+    Returns:
+        int: Bytes
+    """
+    rss = _proc_rss(os.getpid())
+    if not rss:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    if children:
+        pending = _children(os.getpid())
+        while pending:
+            pid = pending.pop()
+            rss += _proc_rss(pid)
+            pending.extend(_children(pid))
+    return rss
+
+
+def _mb(size):
+    return round(size / MB, 3)
+
+
+def save_memory(report, path=None):
+    """Write a MemoryTracker.report() to memory.json, or its stage peaks to stderr.
+
+    Args:
+        report: Memory report (None = nothing to write)
+        path: memory.json path (None = print a summary to stderr)
+    """
+    if report is None:
+        return
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return
+    print(f"Peak RSS: {report['peak_rss_mb']:.1f} MB", file=sys.stderr)
+    for name, stage in report["stages"].items():
+        traced = f" (traced {stage['traced_peak_mb']:.1f} MB)" if "traced_peak_mb" in stage else ""
+        print(f"  {name}: {stage['rss_peak_mb']:.1f} MB{traced}", file=sys.stderr)
+
+
+def top_allocations(snapshot, limit=TOP_ALLOCATIONS):
+    """The allocation sites holding the most memory in a tracemalloc snapshot.
+
+    Returns:
+        list: [{"location": "file:line", "size_mb", "count"}]
+    """
+    rows = []
+    for stat in snapshot.statistics("lineno"):
+        frame = stat.traceback[0]
+        if frame.filename in _IGNORED_FILES or frame.filename == __file__:
+            continue
+        rows.append({"location": f"{frame.filename}:{frame.lineno}", "size_mb": _mb(stat.size),
+                     "count": stat.count})
+        if len(rows) == limit:
+            break
+    return rows
+
+
+class MemoryTracker:
+    """Peak RSS (and optionally tracemalloc) per span, enforcing a memory budget.
+
+    A daemon thread samples the RSS every SAMPLE_SECONDS into the open spans.
+    Over the budget it signals the main thread (SIGUSR1), which raises
+    MemoryBudgetError wherever it is; entering a span checks the budget too.
+    Profile drives it: enter()/exit() around each span, stop() at the end.
+
+    tracemalloc is started afresh for every top-level span and stopped at its
+    end, so a stage's traced peak and top allocations cover only what that
+    stage allocated, and the snapshot is analysed without tracing itself.
+    """
+
+    def __init__(self, budget_mb=None, traced=False, stage=None):
+        """
+        Args:
+            budget_mb: Max RSS in MB (None = no budget)
+            traced: Also trace Python allocations with tracemalloc
+            stage: Callable returning the name of the innermost open span
+        """
+        self.budget = int(budget_mb * MB) if budget_mb else None
+        self.budget_mb = budget_mb
+        self.traced = traced
+        self.stage = stage or (lambda: None)
+        self.peak = 0
+        self.traced_peak = 0
+        self.exceeded = None      # {"stage", "rss_mb"} once over the budget
+        self.spans = []           # finished span records
+        self._open = []           # records of the open spans
+        self._handler = None      # previous SIGUSR1 handler while installed
+
+        if self.budget and hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            self._handler = signal.signal(signal.SIGUSR1, self._interrupt)
+        self._main = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_loop, name="memory-sampler", daemon=True)
+        self._sampler.start()
+
+    def _sample_loop(self):
+        while not self._stop.wait(SAMPLE_SECONDS):
+            if self._sample() and self._handler is not None:
+                signal.pthread_kill(self._main, signal.SIGUSR1)
+
+    def _sample(self):
+        """Fold the current RSS into the open spans; True when it first goes over the budget."""
+        rss = rss_bytes()
+        self.peak = max(self.peak, rss)
+        for record in tuple(self._open):
+            record["rss_peak"] = max(record["rss_peak"], rss)
+        if self.budget and rss > self.budget and self.exceeded is None:
+            self.exceeded = {"stage": self.stage(), "rss_mb": _mb(rss)}
+            return True
+        return False
+
+    def _interrupt(self, signum, frame):
+        raise self.error()
+
+    def error(self):
+        """MemoryBudgetError describing the exceeded budget."""
+        return MemoryBudgetError(
+            f"Memory budget exceeded during {self.exceeded['stage'] or 'startup'}: "
+            f"RSS {self.exceeded['rss_mb']:.1f} MB > budget {self.budget_mb:g} MB "
+            f"(--memory-budget / MEMORY_BUDGET_MB)"
+        )
+
+    def _fold_traced(self):
+        """Fold the tracemalloc peak since the last fold into the open spans."""
+        if not self.traced or not tracemalloc.is_tracing():
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        self.traced_peak = max(self.traced_peak, peak)
+        for record in self._open:
+            record["traced_peak"] = max(record["traced_peak"], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def enter(self, name, top_level):
+        """Open a span record (raises MemoryBudgetError when already over the budget)."""
+        if self._sample() or self.exceeded is not None:
+            raise self.error()
+        if self.traced and top_level:
+            # Fresh traces: the stage's own allocations
+            tracemalloc.stop()
+            tracemalloc.start()
+        current = self._fold_traced()
+        record = {"rss_peak": 0, "traced_peak": current, "top_level": top_level}
+        self._open.append(record)
+        self._sample()
+        return record
+
+    def exit(self, record, name, parent, start):
+        """Close a span record opened by enter()."""
+        self._sample()
+        self._fold_traced()
+        self._open = [other for other in self._open if other is not record]
+        span = {"name": name, "parent": parent, "start": start, "rss_peak_mb": _mb(record["rss_peak"])}
+        if self.traced:
+            span["traced_peak_mb"] = _mb(record["traced_peak"])
+        if self.traced and record["top_level"] and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            span["top"] = top_allocations(snapshot)
+        self.spans.append(span)
+
+    def report(self):
+        """memory.json contents: run peaks, per top-level stage peaks and all spans.
+
+        Returns:
+            dict: {"budget_mb", "peak_rss_mb", "traced_peak_mb" (with tracemalloc),
+                   "exceeded", "stages": {name: {"rss_peak_mb", ...}}, "spans"}
+        """
+        self._sample()
+        self._fold_traced()
+        spans = sorted(self.spans, key=lambda span: span["start"])
+        stages = {}
+        for span in spans:
+            if span["parent"] is None:
+                stage = stages.setdefault(span["name"], {})
+                for key in ("rss_peak_mb", "traced_peak_mb"):
+                    if key in span:
+                        stage[key] = max(stage.get(key, 0.0), span[key])
+        report = {"budget_mb": self.budget_mb, "peak_rss_mb": _mb(self.peak)}
+        if self.traced:
+            report["traced_peak_mb"] = _mb(self.traced_peak)
+        report.update(exceeded=self.exceeded, stages=stages, spans=spans)
+        return report
+
+    def stop(self):
+        """Stop sampling, restore SIGUSR1 and stop tracemalloc."""
+        self._stop.set()
+        if self._sampler.is_alive() and self._sampler is not threading.current_thread():
+            self._sampler.join()
+        if self._handler is not None:
+            signal.signal(signal.SIGUSR1, self._handler)
+            self._handler = None
+        if self.traced and tracemalloc.is_tracing():
+            tracemalloc.stop()
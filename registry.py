@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Query and maintain the SQLite run registry (lib/model/registry.py)."""
+
+import argparse
+import json
+import sys
+
+from lib.model import registry
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Query and maintain the run registry")
+    # --json is accepted after any subcommand for API compatibility (output is always JSON)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="Accepted for API compatibility")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List runs (JSON)", parents=[common])
+    list_parser.add_argument("--dataset", type=str, default=None, help="Filter by dataset")
+    list_parser.add_argument("--model", type=str, default=None, help="Filter by model type")
+    list_parser.add_argument("--min-accuracy", type=float, default=None, help="Minimum accuracy")
+    list_parser.add_argument("--since", type=int, default=None, help="Earliest run timestamp")
+    list_parser.add_argument("--until", type=int, default=None, help="Latest run timestamp")
+    list_parser.add_argument("--sort", type=str, choices=registry.SORT_KEYS, default="timestamp",
+                             help="Sort key (default: timestamp)")
+    list_parser.add_argument("--order", type=str, choices=["asc", "desc"], default="desc",
+                             help="Sort order (default: desc)")
+    list_parser.add_argument("--limit", type=int, default=None, help="Page size (default: all)")
+    list_parser.add_argument("--offset", type=int, default=0, help="Rows to skip")
+
+    get_parser = commands.add_parser("get", help="Show one run (JSON)", parents=[common])
+    get_parser.add_argument("--run-id", type=str, required=True)
+
+    rename_parser = commands.add_parser("rename", help="Set or clear a run name", parents=[common])
+    rename_parser.add_argument("--run-id", type=str, required=True)
+    rename_parser.add_argument("--name", type=str, default="", help="New name (empty clears it)")
+
+    delete_parser = commands.add_parser("delete", help="Remove a run from the registry", parents=[common])
+    delete_parser.add_argument("--run-id", type=str, required=True)
+
+    commands.add_parser("rebuild", help="Re-index all run directories", parents=[common])
+
+    return parser.parse_args()
+
+
+def to_api(run):
+    """Map a registry row to the /api/history run shape."""
+    return {
+        "runId": run["run_id"],
+        "model": run["model"],
+        "dataset": run["dataset"],
+        "accuracy": run["accuracy"],
+        "timestamp": run["timestamp"],
+        "name": run["name"] or None
+    }
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "list":
+        result = registry.query(
+            dataset=args.dataset,
+            model=args.model,
+            min_accuracy=args.min_accuracy,
+            since=args.since,
+            until=args.until,
+            sort=args.sort,
+            descending=args.order == "desc",
+            limit=args.limit,
+            offset=args.offset
+        )
+        output = {"total": result["total"], "runs": [to_api(run) for run in result["runs"]]}
+    elif args.command == "get":
+        run = registry.get(args.run_id)
+        if run is None:
+            print(json.dumps({"success": False, "error": {"message": f"Run {args.run_id} not found"}}))
+            sys.exit(1)
+        output = {"success": True, "run": run}
+    elif args.command == "rename":
+        if not registry.update(args.run_id, name=args.name or None):
+            print(json.dumps({"success": False, "error": {"message": f"Run {args.run_id} not found"}}))
+            sys.exit(1)
+        output = {"success": True}
+    elif args.command == "delete":
+        registry.delete(args.run_id)
+        output = {"success": True}
+    else:
+        output = {"success": True, "runs": registry.rebuild()}
+
+    print(json.dumps(output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Materialize lazily recorded images of a training run (see --lazy-images).
+
+Also the background renderer for --render-workers (--background, started by Render.flush).
+"""
+
+import argparse
+import json
+import sys
+
+from lib import Render
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Render images recorded with --lazy-images on first request")
+    parser.add_argument("--run-id", type=str, default=None,
+                        help="Run ID (frontend/public/output/<run-id>/)")
+    parser.add_argument("--compare-id", type=str, default=None,
+                        help="Compare ID (frontend/public/output/compare/<compare-id>/)")
+    parser.add_argument("--file", type=str, action="append", default=[],
+                        help="Image filename listed in renders.json (repeatable)")
+    parser.add_argument("--background", type=str, default=None, metavar="BATCH",
+                        help="Run a job batch queued by Render.flush(detach=True) and exit")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Render pool size for --background (default: RENDER_WORKERS)")
+    parser.add_argument("--json", action="store_true",
+                        help="Suppress log output (only the JSON result is printed)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.background:
+        Render.run_background(args.background, workers=args.workers)
+        return
+    if not args.file:
+        print(json.dumps({"success": False, "error": {"message": "--file is required"}}))
+        sys.exit(1)
+    if not args.run_id and not args.compare_id:
+        print(json.dumps({"success": False, "error": {"message": "--run-id or --compare-id is required"}}))
+        sys.exit(1)
+
+    Render.set_run_id(args.run_id)
+    Render.set_compare_id(args.compare_id)
+
+    # A failing file does not stop the rest of a batch (the API renders a run's lazy files in one call)
+    files, errors = [], []
+    for filename in args.file:
+        if filename in files:
+            continue
+        try:
+            files.extend(f for f in Render.materialize(filename) if f not in files)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            errors.append({"message": str(e), "file": filename})
+
+    if errors:
+        print(json.dumps({"success": False, "files": files, "error": errors[0], "errors": errors}))
+        sys.exit(1)
+
+    print(json.dumps({"success": True, "files": files}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""Hyperparameter sweep over the keys of config/<model>-<dataset>.yml.
+
+The dataset is loaded and split once; candidates are fitted on a pool of
+worker processes that receive the split through the pool initializer. With
+--halving, candidates are first fitted on a fraction of the training rows and
+only the best 1/eta of each rung is refitted on eta times more rows (successive
+halving); rungs are ranked on a validation split held out of the training
+rows, so the test split only gives the final scores. Every trial is saved as a normal run (model.pkl, runtime.json,
+result.json, .id marker, registry), so history and compare pick them up.
+
+    python sweep.py --model forest --dataset Income --space '{"max_depth": [4, 8, null], "n_estimators": [50, 100]}'
+    python sweep.py --model tree --search random --trials 20 --halving \\
+        --space '{"max_depth": {"low": 2, "high": 12, "type": "int"}, "criterion": ["gini", "entropy"]}'
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from lib import Dataset, Model
+from lib.lazy import LazyModule
+
+inspection = LazyModule("sklearn.inspection")
+
+MODELS = ["tree", "forest", "gradient", "hist-gradient"]
+
+OUTPUT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), 'frontend', 'public', 'output'))
+
+# Smallest rung of successive halving (rows)
+MIN_ROWS = 50
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Hyperparameter sweep over config/<model>-<dataset>.yml")
+    parser.add_argument("--model", type=str, choices=MODELS, required=True, help="Model type")
+    parser.add_argument("--dataset", type=str, choices=["Iris", "Income", "Synthetic"], default="Iris",
+                        help="Dataset to use (default: Iris)")
+    parser.add_argument("--dataset-config", type=json.loads, default=None,
+                        help="JSON string with Synthetic dataset parameters")
+    parser.add_argument("--space", type=json.loads, required=True,
+                        help="JSON search space: key -> list of values, or {\"low\", \"high\", \"type\": "
+                             "\"int\"|\"float\", \"log\": bool} (random search only)")
+    parser.add_argument("--search", type=str, choices=["grid", "random"], default="grid",
+                        help="Grid over all combinations or random sampling (default: grid)")
+    parser.add_argument("--trials", type=int, default=20, help="Random search candidates (default: 20)")
+    parser.add_argument("--seed", type=int, default=42, help="Random search and row subset seed (default: 42)")
+    parser.add_argument("--halving", action="store_true",
+                        help="Prune candidates with successive halving over training rows")
+    parser.add_argument("--eta", type=int, default=3,
+                        help="Halving factor: keep 1/eta of the candidates per rung (default: 3)")
+    parser.add_argument("--min-rows", type=int, default=None,
+                        help="Training rows of the first rung (default: sized so the last rung uses all rows)")
+    parser.add_argument("--validation", type=int, default=20,
+                        help="Percentage of the training rows held out to rank halving rungs (default: 20)")
+    parser.add_argument("--mask", type=int, default=0, help="Mask percentage (0-100)")
+    parser.add_argument("--split", type=int, default=33, help="Test set percentage (default: 33)")
+    parser.add_argument("--impute", action="store_true", help="Impute missing values in the training set")
+    parser.add_argument("--compact", action="store_true",
+                        help="Load features as C-contiguous float32 frames (see train scripts --compact)")
+    parser.add_argument("--ignore-columns", type=str, default=None,
+                        help="Comma-separated column indices to drop")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument("--json", action="store_true", help="Output summary as JSON")
+    args = parser.parse_args()
+
+    args.ignore_columns = [int(x) for x in args.ignore_columns.split(",")] if args.ignore_columns else []
+    if args.eta < 2:
+        parser.error("--eta must be at least 2")
+    if not 0 < args.validation < 100:
+        parser.error("--validation must be between 1 and 99")
+    if not isinstance(args.space, dict) or not args.space:
+        parser.error("--space must be a non-empty JSON object")
+    return args
+
+
+def candidates(space, base_config, search, trials, seed):
+    """Expand a search space into a list of override dicts.
+
+    Args:
+        space: key -> list of values or {"low", "high", "type", "log"} distribution
+        base_config: Config loaded from the YAML file (keys that may be searched)
+        search: "grid" or "random"
+        trials: Number of random candidates
+        seed: Random seed
+
+    Returns:
+        list: Override dicts, one per candidate
+
+    Raises:
+        ValueError: On keys missing from the YAML config or invalid dimensions
+    """
+    unknown = set(space) - set(base_config)
+    if unknown:
+        raise ValueError(f"Keys not in the model config: {sorted(unknown)}")
+
+    for key, values in space.items():
+        if isinstance(values, dict):
+            if search == "grid":
+                raise ValueError(f"{key}: distributions need --search random, use a list for grid search")
+            if values.get("type", "float") not in ("int", "float") or values["low"] > values["high"]:
+                raise ValueError(f"{key}: expected {{\"low\" <= \"high\", \"type\": \"int\"|\"float\"}}")
+        elif not isinstance(values, list) or not values:
+            raise ValueError(f"{key}: expected a non-empty list of values")
+
+    keys = list(space)
+    if search == "grid":
+        return [dict(zip(keys, combination)) for combination in itertools.product(*space.values())]
+
+    rng = np.random.default_rng(seed)
+
+    def sample(values):
+        if isinstance(values, list):
+            return values[rng.integers(len(values))]
+        low, high = values["low"], values["high"]
+        if values.get("log"):
+            value = math.exp(rng.uniform(math.log(low), math.log(high)))
+        else:
+            value = rng.uniform(low, high)
+        return int(round(value)) if values.get("type") == "int" else float(value)
+
+    return [{key: sample(space[key]) for key in keys} for _ in range(trials)]
+
+
+def rungs(train_rows, n_candidates, eta, min_rows=None):
+    """Training rows per successive halving rung; the last rung uses all rows.
+
+    By default the first rung is sized so that halving down to one candidate
+    ends on the full training set.
+    """
+    depth = 0
+    while eta ** depth < n_candidates:
+        depth += 1
+    if min_rows is None:
+        min_rows = max(MIN_ROWS, train_rows // eta ** depth)
+    sizes = []
+    rows = min_rows
+    while rows < train_rows and len(sizes) < depth:
+        sizes.append(rows)
+        rows *= eta
+    return sizes + [train_rows]
+
+
+def allocate_run_ids(count):
+    """Reserve run directories for the trials.
+
+    Run IDs have the timestamp format but are only identifiers here: trials
+    take free seconds counting down from the current one, so they never
+    collide with runs the frontend starts later. Each trial records its real
+    creation time in runtime.json ("created"), which the registry uses.
+    """
+    run_ids = []
+    candidate = int(time.time()) - 1
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    while len(run_ids) < count:
+        try:
+            os.mkdir(os.path.join(OUTPUT_DIR, str(candidate)))
+            run_ids.append(str(candidate))
+        except FileExistsError:
+            pass
+        candidate -= 1
+    return run_ids
+
+
+# Shared with pool workers: split, row order for rung subsets, sweep settings
+_shared = {}
+
+
+def _init_worker(shared):
+    """Process pool initializer: receive the split and sweep settings once per worker."""
+    _shared.update(shared)
+
+
+def _model_summary(model, clf, X_test, y_test, feature_names):
+    """model_info and feature importance as reported by the train-<model>.py scripts."""
+    if model == "tree":
+        info = {"type": "tree", "tree_depth": clf.get_depth(), "n_leaves": clf.get_n_leaves()}
+    elif model == "forest":
+        info = {"type": "forest", "n_estimators": clf.n_estimators}
+        if hasattr(clf, 'oob_score_'):
+            info["oob_score"] = clf.oob_score_
+    elif model == "gradient":
+        info = {"type": "gradient", "n_estimators": clf.n_estimators}
+    else:
+        info = {"type": "hist-gradient", "n_iterations": clf.n_iter_}
+
+    if model == "hist-gradient":
+        importances = inspection.permutation_importance(clf, X_test, y_test, n_repeats=10, random_state=42).importances_mean
+    else:
+        importances = clf.feature_importances_
+    return info, dict(zip(feature_names, importances.tolist()))
+
+
+def score(record):
+    """Ranking score of a trial: validation accuracy when halving, else test accuracy."""
+    return record["accuracy"] if record["validation"] is None else record["validation"]
+
+
+def _trial_task(trial, run_id, overrides, rows, rung):
+    """Fit one candidate on the first `rows` training rows, score it and save it as a run.
+
+    Returns:
+        dict: Trial record (accuracy is None and error is set on failure)
+    """
+    X_train, X_test, y_train, y_test = _shared["split"]
+    model, dataset, args = _shared["model"], _shared["dataset"], _shared["args"]
+    config = {**_shared["base_config"], **overrides}
+    record = {"trial": trial, "runId": run_id, "config": overrides, "rung": rung, "rows": rows,
+              "accuracy": None, "validation": None, "seconds": None, "error": None}
+
+    try:
+        subset = _shared["order"][:rows]
+        X_fit, y_fit = X_train.iloc[subset], y_train.iloc[subset]
+        if args["compact"]:
+            # Row subsets of a compact frame are column-major; gather them back into one C-contiguous block
+            X_fit = Dataset.compact(X_fit)
+
+        start_time = time.time()
+        clf = Model.build(model, config)
+        clf.fit(X_fit, y_fit)
+        record["seconds"] = round(time.time() - start_time, 3)
+
+        if _shared["validation"] is not None:
+            X_val, y_val = _shared["validation"]
+            record["validation"] = float((clf.predict(X_val) == y_val).mean())
+        y_pred = clf.predict(X_test)
+        accuracy = float((y_pred == y_test).mean())
+        record["accuracy"] = accuracy
+
+        # Save as a normal run (a promoted trial overwrites its previous rung)
+        dataset_params = {
+            "mask": args["mask"],
+            "split": args["split"],
+            "impute": args["impute"],
+            "compact": args["compact"],
+            "ignore_columns": args["ignore_columns"],
+            "dataset_config": args["dataset_config"],
+            "use_output": False,
+            "images": False
+        }
+        sweep = {"id": _shared["sweep_id"], "trial": trial, "rung": rung, "rows": rows, "overrides": overrides,
+                 "validation": record["validation"]}
+        Model.save(clf, run_id)
+        Model.save_runtime(run_id=run_id, dataset=dataset, model=model, dataset_params=dataset_params,
+                           model_params=config, extra={"sweep": sweep, "created": int(time.time())})
+        Model.save_id(run_id, model, dataset, accuracy)
+        _shared["source"].export(X_fit, X_test, y_fit, y_test, mask_rate=args["mask"] / 100.0, run_id=run_id)
+
+        model_info, feature_importance = _model_summary(model, clf, X_test, y_test, X_train.columns.tolist())
+        model_info["sweep"] = sweep
+        params = {"dataset": dataset, **{k: dataset_params[k] for k in ("mask", "split", "impute", "ignore_columns",
+                                                                        "dataset_config")},
+                  "run_id": run_id, "model_config": config}
+        with contextlib.redirect_stdout(io.StringIO()):
+            Model.report(y_test, y_pred, json_output=True, model_info=model_info, params=params,
+                         feature_importance=feature_importance,
+                         X_train=X_fit, X_test=X_test, y_train=y_fit, y_test=y_test)
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+
+
+def run_rung(pool, tasks, on_result):
+    """Run one rung of (trial, run_id, overrides, rows, rung) tasks; results in completion order."""
+    if pool is None:
+        return [on_result(_trial_task(*task)) for task in tasks]
+    pending = {pool.submit(_trial_task, *task) for task in tasks}
+    results = []
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        results.extend(on_result(future.result()) for future in done)
+    return results
+
+
+def main():
+    args = parse_args()
+    start_time = time.time()
+    log = sys.stderr if args.json else sys.stdout
+
+    source = Dataset.get(args.dataset, args.dataset_config)
+    base_config = Model.load_config(args.model, args.dataset)
+    try:
+        trials = candidates(args.space, base_config, args.search, args.trials, args.seed)
+    except (ValueError, KeyError) as e:
+        print(json.dumps({"success": False, "error": {"message": f"Invalid --space: {e}"}}) if args.json
+              else f"Error: invalid --space: {e}", file=sys.stdout if args.json else sys.stderr)
+        sys.exit(1)
+
+    # Load and split once
+    split = source.input(mask_rate=args.mask / 100.0, test_size=args.split / 100.0,
+                         impute=args.impute, ignore_columns=args.ignore_columns, compact=args.compact)
+    order = np.random.default_rng(args.seed).permutation(len(split[0]))
+
+    # Halving ranks rungs on rows held out of the training set, never on the test split
+    validation = None
+    if args.halving:
+        held_out = max(1, len(order) * args.validation // 100)
+        rows = order[len(order) - held_out:]
+        X_val = split[0].iloc[rows]
+        validation = (Dataset.compact(X_val) if args.compact else X_val, split[2].iloc[rows])
+        order = order[:len(order) - held_out]
+
+    train_rows = len(order)
+    sizes = rungs(train_rows, len(trials), args.eta, args.min_rows) if args.halving else [train_rows]
+
+    sweep_id = str(int(time.time()))
+    run_ids = allocate_run_ids(len(trials))
+    shared = {
+        "split": split,
+        "order": order,
+        "validation": validation,
+        "model": args.model,
+        "dataset": args.dataset,
+        "base_config": base_config,
+        "source": source,
+        "sweep_id": sweep_id,
+        "args": {"mask": args.mask, "split": args.split, "impute": args.impute, "compact": args.compact,
+                 "ignore_columns": args.ignore_columns, "dataset_config": args.dataset_config}
+    }
+    print(f"Sweep {sweep_id}: {len(trials)} {args.model} candidates on {args.dataset} "
+          f"({train_rows} training rows), rungs {sizes}", file=log)
+
+    def on_result(record):
+        if record["error"] is not None:
+            status = f"ERROR - {record['error']}"
+        elif record["validation"] is not None:
+            status = f"validation {record['validation']:.4f}, test {record['accuracy']:.4f}"
+        else:
+            status = f"{record['accuracy']:.4f}"
+        print(f"  [{record['rows']} rows] trial {record['trial']} ({record['runId']}) "
+              f"{json.dumps(record['config'])}: {status}", file=log)
+        return record
+
+    records = {}
+    alive = list(range(len(trials)))
+    pool = ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker, initargs=(shared,)) \
+        if args.jobs > 1 else None
+    if pool is None:
+        _init_worker(shared)
+    try:
+        for rung, rows in enumerate(sizes):
+            results = run_rung(pool, [(i, run_ids[i], trials[i], rows, rung) for i in alive], on_result)
+            for record in results:
+                records[record["trial"]] = record
+
+            if rung < len(sizes) - 1:
+                ranked = sorted((r for r in results if r["error"] is None),
+                                key=lambda r: (-score(r), r["trial"]))
+                alive = sorted(r["trial"] for r in ranked[:max(1, math.ceil(len(alive) / args.eta))])
+                if not alive:
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Failed trials leave no run behind
+    for record in records.values():
+        if record["error"] is not None:
+            run_dir = os.path.join(OUTPUT_DIR, record["runId"])
+            if not os.listdir(run_dir):
+                os.rmdir(run_dir)
+
+    final_rung = len(sizes) - 1
+    ordered = sorted(records.values(), key=lambda r: (r["accuracy"] is None, -(score(r) or 0), r["trial"]))
+    for record in ordered:
+        record["pruned"] = record["rung"] < final_rung
+    completed = [r for r in ordered if not r["pruned"] and r["error"] is None]
+    best = completed[0] if completed else None
+
+    summary = {
+        "success": best is not None,
+        "sweepId": sweep_id,
+        "model": args.model,
+        "dataset": args.dataset,
+        "search": args.search,
+        "halving": args.halving,
+        "rungs": sizes,
+        "elapsed": round(time.time() - start_time, 2),
+        "best": best,
+        "trials": ordered
+    }
+
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        print(f"\nCompleted in {summary['elapsed']:.2f}s")
+        if best:
+            print(f"Best: trial {best['trial']} ({best['runId']}) accuracy {best['accuracy']:.4f} "
+                  f"{json.dumps(best['config'])}")
+    if best is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
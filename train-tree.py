@@ -1,13 +1,16 @@
 import pandas as pd
 import yaml
 from sklearn.tree import DecisionTreeClassifier
-from lib import Args, Dataset, Model, Render
+from lib import Args, Dataset, Model, Profile, Render
 from lib.args import merge_config
 
 args = Args.get_inputs()
 
+# Time each stage into runtime.json (cProfile with --profile, memory per stage with --memory)
+Profile.start(profile=args.profile, memory=args.memory, memory_budget=args.memory_budget)
+
 # Select dataset
-DataSource = Dataset.Iris if args.dataset == "Iris" else Dataset.Income
+DataSource = Dataset.get(args.dataset, args.dataset_config)
 
 # Load model config (YAML base + CLI overrides)
 with open(f"config/tree-{args.dataset}.yml") as f:
@@ -19,46 +22,54 @@ if args.run_id:
     Render.set_run_id(args.run_id)
 
 # Load dataset
-X_train, X_test, y_train, y_test = DataSource.input(
-    mask_rate=args.mask_rate,
-    test_size=args.test_size,
-    reuse_dataset=args.use_output,
-    impute=args.impute,
-    ignore_columns=args.ignore_columns
-)
+with Profile.span("dataset.input"):
+    X_train, X_test, y_train, y_test = DataSource.input(
+        mask_rate=args.mask_rate,
+        test_size=args.test_size,
+        reuse_dataset=args.use_output,
+        impute=args.impute,
+        ignore_columns=args.ignore_columns,
+        compact=args.compact
+    )
 
 # Export dataset if run_id provided or generating new masked data
-if args.run_id:
-    DataSource.export(X_train, X_test, y_train, y_test, mask_rate=args.mask_rate, run_id=args.run_id)
-elif args.mask_rate > 0 and not args.use_output:
-    DataSource.export(X_train, X_test, y_train, y_test, mask_rate=args.mask_rate)
+with Profile.span("dataset.export"):
+    if args.run_id:
+        DataSource.export(X_train, X_test, y_train, y_test, mask_rate=args.mask_rate, run_id=args.run_id)
+    elif args.mask_rate > 0 and not args.use_output:
+        DataSource.export(X_train, X_test, y_train, y_test, mask_rate=args.mask_rate)
 
 # Train decision tree
 clf = DecisionTreeClassifier(**config)
-clf.fit(X_train, y_train)
+with Profile.span("fit"):
+    clf.fit(X_train, y_train)
 
 # Predictions and evaluation
-y_pred = clf.predict(X_test)
+with Profile.span("predict"):
+    y_pred = clf.predict(X_test)
 accuracy = (y_pred == y_test).mean()
 
 # Save model and runtime config if run_id provided
 if args.run_id:
-    Model.save(clf, args.run_id)
-    Model.save_runtime(
-        run_id=args.run_id,
-        dataset=args.dataset,
-        model="tree",
-        dataset_params={
-            "mask": args.mask,
-            "split": args.split,
-            "impute": args.impute,
-            "ignore_columns": args.ignore_columns,
-            "use_output": args.use_output,
-            "images": args.images
-        },
-        model_params=config
-    )
-    Model.save_id(args.run_id, "tree", args.dataset, accuracy)
+    with Profile.span("save"):
+        Model.save(clf, args.run_id)
+        Model.save_runtime(
+            run_id=args.run_id,
+            dataset=args.dataset,
+            model="tree",
+            dataset_params={
+                "mask": args.mask,
+                "split": args.split,
+                "impute": args.impute,
+                "compact": args.compact,
+                "ignore_columns": args.ignore_columns,
+                "dataset_config": args.dataset_config,
+                "use_output": args.use_output,
+                "images": args.images
+            },
+            model_params=config
+        )
+        Model.save_id(args.run_id, "tree", args.dataset, accuracy)
 model_info = {
     "type": "tree",
     "tree_depth": clf.get_depth(),
@@ -75,23 +86,29 @@ params = {
     "split": args.split,
     "impute": args.impute,
     "ignore_columns": args.ignore_columns,
+    "dataset_config": args.dataset_config,
     "run_id": args.run_id,
     "model_config": config
 }
 
-Model.report(
-    y_test, y_pred,
-    json_output=args.json,
-    model_info=model_info if args.json else None,
-    params=params if args.json else None,
-    feature_importance=feature_importance if args.json else None,
-    X_train=X_train if args.json else None,
-    X_test=X_test if args.json else None,
-    y_train=y_train if args.json else None,
-    y_test=y_test if args.json else None
-)
+with Profile.span("report"):
+    Model.report(
+        y_test, y_pred,
+        json_output=args.json,
+        model_info=model_info if args.json else None,
+        params=params if args.json else None,
+        feature_importance=feature_importance if args.json else None,
+        X_train=X_train if args.json else None,
+        X_test=X_test if args.json else None,
+        y_train=y_train if args.json else None,
+        y_test=y_test if args.json else None,
+        timings=Profile.summary() if args.json else None
+    )
 
 if args.images:
+    # Queue renders for a background pool (--render-workers) or first request (--lazy-images)
+    if args.render_workers is not None or args.lazy_images:
+        Render.defer()
 
     # Export tree visualization
     Render.tree(
@@ -108,3 +125,10 @@ if args.images:
         # Export decision boundaries (only for small feature sets)
         if len(X_train.columns) <= 6:
             Render.tree_boundaries(clf, X_train, y_train, X_train.columns.tolist())
+
+    # Start or record the queued renders (no-op when rendering inline)
+    with Profile.span("render.flush"):
+        Render.flush(workers=args.render_workers, detach=True, lazy=args.lazy_images)
+
+# Record the stage timings (and the --profile dump and memory.json) in the run directory
+Model.save_timings(args.run_id, *Profile.finish())
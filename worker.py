@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Long-lived training worker speaking a JSON-lines protocol over stdin/stdout.
+
+Each request is one JSON object per line:
+    {"id": "1", "script": "train-tree.py", "args": ["--json", "--dataset", "Iris"]}
+
+Each response is one JSON object per line:
+    {"id": "1", "code": 0, "stdout": "...", "stderr": "...", "elapsed": 0.42}
+
+Scripts run in-process with the same argv they would get from the command line,
+so imports, parsed datasets and loaded models stay warm between requests.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import runpy
+import sys
+import time
+import traceback
+
+import matplotlib
+matplotlib.use("Agg")
+
+import config
+import config.Config
+import compare
+import lib.dataset.impute
+import lib.dataset.render
+import lib.dataset.synthetic
+import lib.lazy
+from lib import Dataset, Profile, Render
+
+SCRIPTS = ["train-tree.py", "train-forest.py", "train-gradient.py", "train-hist-gradient.py", "compare.py", "render.py",
+           "registry.py"]
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Long-lived training worker (JSON lines over stdin/stdout)")
+    parser.add_argument("--preload", type=str, default="",
+                        help="Comma-separated datasets to load at startup (e.g. Iris,Income)")
+    return parser.parse_args()
+
+
+def open_protocol():
+    """Reserve the real stdout for protocol messages.
+
+    File descriptor 1 is pointed at stderr so stray output from native code or
+    child processes cannot corrupt the protocol stream.
+
+    Returns:
+        Text stream writing to the original stdout
+    """
+    protocol_fd = os.dup(1)
+    os.dup2(2, 1)
+    return os.fdopen(protocol_fd, "w", buffering=1)
+
+
+def reset_state(argv):
+    """Reset module-level state that training scripts set through class attributes.
+
+    Args:
+        argv: Argument list of the next job (without the script name)
+    """
+    verbose = "--json" not in argv
+    config.VERBOSE = verbose
+    config.Config.VERBOSE = verbose
+    lib.dataset.render.VERBOSE = verbose
+    lib.dataset.impute.VERBOSE = verbose
+    lib.dataset.synthetic.VERBOSE = verbose
+
+    Render._mask_pct = 0
+    Render._run_id = None
+    Render._compare_id = None
+    Render._jobs = None
+    Render._directory = None
+
+
+def run_job(script, argv):
+    """Run a training or compare script in-process.
+
+    Args:
+        script: Script filename (one of SCRIPTS)
+        argv: Command line arguments for the script
+
+    Returns:
+        tuple: (code, stdout, stderr)
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = 0
+
+    reset_state(argv)
+    sys.argv = [script] + argv
+
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            if script == "compare.py":
+                # Imported once so its in-process dataset memo stays warm
+                compare.main()
+            else:
+                runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                code = e.code
+            elif e.code is not None:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        finally:
+            # A failed job leaves its spans, cProfile and memory sampler running
+            Profile.reset()
+
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def main():
+    args = parse_args()
+    protocol = open_protocol()
+
+    # The lib package defers plotting/sklearn imports; a long-lived worker pays them once
+    lib.lazy.warm()
+
+    for name in filter(None, (d.strip() for d in args.preload.split(","))):
+        getattr(Dataset, name)._load_raw()
+
+    protocol.write(json.dumps({"ready": True, "pid": os.getpid()}) + "\n")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        start_time = time.time()
+        job_id = None
+        try:
+            request = json.loads(line)
+            job_id = request.get("id")
+            script = request["script"]
+            if script not in SCRIPTS:
+                raise ValueError(f"Unknown script: {script}")
+        except (json.JSONDecodeError, AttributeError, KeyError, ValueError) as e:
+            code, stdout, stderr = 2, "", f"Invalid request: {e}"
+        else:
+            code, stdout, stderr = run_job(script, [str(a) for a in request.get("args", [])])
+
+        protocol.write(json.dumps({
+            "id": job_id,
+            "code": code,
+            "stdout": stdout,
+            "stderr": stderr,
+            "elapsed": round(time.time() - start_time, 3)
+        }) + "\n")
+
+
+if __name__ == "__main__":
+    main()